@@ -0,0 +1,58 @@
+"""
+Compara la representación de autómatas basada en diccionarios con AutomataCompacto.
+
+Mide los bytes por estado (con tracemalloc) y el tiempo de construcción de una
+cadena de estados con dos transiciones por estado.
+
+Uso, desde la carpeta ValidadorExReg:
+
+    python -m benchmarks.bench_automata 1000 10000 50000
+"""
+import sys
+import time
+import tracemalloc
+from src.utils.automata_compacto import AutomataCompacto
+from src.utils.automata_generator import Automata
+
+def construir(clase, num_estados):
+    """Construye un autómata de num_estados estados y devuelve sus transiciones compactadas."""
+    automata = clase()
+    anterior = automata.crear_estado()
+    automata.estado_inicial = anterior
+    for _ in range(num_estados - 1):
+        estado = automata.crear_estado()
+        automata.agregar_transicion(anterior, 'a', estado)
+        automata.agregar_transicion(estado, '', anterior)
+        anterior = estado
+    if isinstance(automata, AutomataCompacto):
+        automata.compactar()
+    return automata
+
+def medir(clase, num_estados):
+    """
+    Mide la construcción de un autómata.
+
+    Returns:
+        tuple: (bytes por estado, segundos de construcción)
+    """
+    inicio = time.perf_counter()
+    construir(clase, num_estados)
+    segundos = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    automata = construir(clase, num_estados)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del automata
+    return memoria / num_estados, segundos
+
+def main(argv=None):
+    tamanos = [int(valor) for valor in (argv or sys.argv[1:])] or [1000, 10000, 50000]
+    print(f"{'estados':>10} {'clase':>18} {'bytes/estado':>14} {'construcción (s)':>18}")
+    for num_estados in tamanos:
+        for clase in (Automata, AutomataCompacto):
+            bytes_estado, segundos = medir(clase, num_estados)
+            print(f"{num_estados:>10} {clase.__name__:>18} {bytes_estado:>14.1f} {segundos:>18.4f}")
+
+if __name__ == "__main__":
+    main()
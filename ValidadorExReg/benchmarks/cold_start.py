@@ -0,0 +1,76 @@
+"""
+Mide el tiempo de importación del arranque de la aplicación con -X importtime.
+
+Ejecuta varias veces `python -X importtime -c "import src.main"` en procesos
+nuevos, informa la mediana del tiempo acumulado de src.main y los módulos más
+costosos, y falla si se supera el umbral o si se cargan al arrancar módulos que
+deben importarse de forma diferida.
+
+Uso, desde la carpeta ValidadorExReg:
+
+    python -m benchmarks.cold_start --runs 7 --max-ms 150
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Módulos que no deben cargarse antes de mostrar la primera ventana.
+MODULOS_DIFERIDOS = ('graphviz', 'PIL', 'multiprocessing', 'concurrent.futures',
+                     'src.utils.automata_generator')
+
+def medir_importacion(modulo='src.main'):
+    """
+    Importa un módulo en un proceso nuevo con -X importtime.
+
+    Args:
+        modulo (str): El módulo a importar.
+
+    Returns:
+        dict: Tiempo acumulado en microsegundos de cada módulo importado.
+    """
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proceso = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+        cwd=raiz, capture_output=True, text=True
+    )
+    tiempos = {}
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        _, acumulado, nombre = linea[len('import time:'):].split('|')
+        tiempos[nombre.strip()] = int(acumulado)
+    if proceso.returncode != 0 or modulo not in tiempos:
+        raise RuntimeError(f"No se pudo importar {modulo}:\n{proceso.stderr}")
+    return tiempos
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='número de ejecuciones')
+    parser.add_argument('--max-ms', type=float, help='umbral de la mediana en milisegundos')
+    parser.add_argument('--top', type=int, default=10, help='módulos más costosos a mostrar')
+    args = parser.parse_args(argv)
+
+    ejecuciones = [medir_importacion() for _ in range(args.runs)]
+    mediana = statistics.median(tiempos['src.main'] for tiempos in ejecuciones) / 1000
+    print(f"src.main: mediana {mediana:.1f} ms en {args.runs} ejecuciones")
+
+    ultima = ejecuciones[-1]
+    for nombre, acumulado in sorted(ultima.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {acumulado / 1000:8.1f} ms  {nombre}")
+
+    fallos = []
+    cargados = [nombre for nombre in ultima
+                if any(nombre == m or nombre.startswith(m + '.') for m in MODULOS_DIFERIDOS)]
+    if cargados:
+        fallos.append(f"módulos cargados al arrancar: {', '.join(sorted(cargados))}")
+    if args.max_ms is not None and mediana > args.max_ms:
+        fallos.append(f"la mediana {mediana:.1f} ms supera el umbral de {args.max_ms} ms")
+
+    for fallo in fallos:
+        print(f"FALLO: {fallo}", file=sys.stderr)
+    return 1 if fallos else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+Suite de benchmarks con entradas escalables y umbrales de regresión.
+
+Mide RegexModel.validate_strings (incluidos patrones con retroceso
+catastrófico y patrones selectivos con y sin prefiltro de literales),
+RegexModel.explain_regex, GeneradorAutomata.procesar_expresion,
+GeneradorAutomata.visualizar_automata y la aceptación de cadenas con un AFD
+(cadena por cadena y con EjecutorVectorizado) sobre una rejilla de tamaños:
+número de patrones, número de cadenas, longitud de la expresión y profundidad
+de anidamiento. Los resultados se guardan como una línea base en JSON y el modo
+de comparación falla cuando el tiempo mínimo de algún caso empeora más que el
+umbral indicado.
+
+La línea base de referencia, benchmarks/baselines/quick.json, se genera con la
+rejilla reducida y es la que usa --compare sin argumento. Los tiempos dependen
+de la máquina: para comparar en otra conviene regenerarla allí primero.
+
+Uso, desde la carpeta ValidadorExReg:
+
+    python -m benchmarks.suite --quick --compare
+    python -m benchmarks.suite --quick --save benchmarks/baselines/quick.json
+    python -m benchmarks.suite --save benchmarks/baselines/local.json
+    python -m benchmarks.suite --compare benchmarks/baselines/local.json --threshold 0.25
+    python -m benchmarks.suite --quick --filter procesar_expresion
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from src.models.regex_model import RegexModel
+from src.utils.automata_determinista import determinizar, minimizar
+from src.utils.automata_generator import GeneradorAutomata
+
+FORMATO_BASE = 1
+
+# Línea base incluida en el repositorio, generada con --quick.
+BASE_RAPIDA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'quick.json')
+
+# Patrones con retroceso catastrófico ante una cadena de 'a' que no termina bien.
+PATRONES_PATOLOGICOS = ('(a+)+$', '(a|aa)+$', '(a*)*b')
+
+# Cada caso: (nombre, rejilla completa, rejilla reducida para --quick, preparación).
+CASOS = []
+
+class CasoOmitido(Exception):
+    """Se lanza al preparar un caso que no puede ejecutarse en este entorno."""
+
+def caso(nombre, rejilla, rapida=None):
+    """
+    Registra la función de preparación de un caso.
+
+    La función recibe los parámetros de una combinación de la rejilla y
+    devuelve la función sin argumentos que se cronometra.
+
+    Args:
+        nombre (str): Nombre del caso.
+        rejilla (dict): Valores de cada parámetro.
+        rapida (dict, optional): Rejilla reducida para --quick.
+    """
+    def registrar(preparar):
+        CASOS.append((nombre, rejilla, rapida or rejilla, preparar))
+        return preparar
+    return registrar
+
+def _cadenas(cantidad, semilla=0):
+    aleatorio = random.Random(semilla)
+    return [''.join(aleatorio.choice('abc01') for _ in range(aleatorio.randint(1, 20)))
+            for _ in range(cantidad)]
+
+def _patrones(cantidad, longitud=12, semilla=0):
+    aleatorio = random.Random(semilla)
+    piezas = ('a', 'b', 'c', '0', '1', '.', '[abc]', '\\d', '(a|b)', 'c*', '[01]+')
+    patrones = []
+    while len(patrones) < cantidad:
+        patron = ''.join(aleatorio.choice(piezas) for _ in range(longitud))
+        if patron not in patrones:
+            patrones.append(patron)
+    return patrones
+
+def _expresion(longitud, semilla=0):
+    """Genera una expresión válida para GeneradorAutomata de la longitud dada."""
+    aleatorio = random.Random(semilla)
+    partes = []
+    tamano = 0
+    while tamano < longitud:
+        pieza = aleatorio.choice(('a', 'b', 'ab', '(a|b)*', '(ab)+', 'c|d'))
+        partes.append(pieza)
+        tamano += len(pieza)
+    return ''.join(partes)
+
+def _modelo(patrones, prefiltro=True):
+    modelo = RegexModel(prefilter=prefiltro)
+    for patron in patrones:
+        modelo.set_regex(patron)
+    return modelo
+
+@caso('validate_strings',
+      {'patrones': [1, 10], 'cadenas': [1000, 10000, 100000]},
+      {'patrones': [1, 10], 'cadenas': [1000, 10000]})
+def _validate_strings(patrones, cadenas):
+    modelo = _modelo(_patrones(patrones))
+    entrada = _cadenas(cadenas)
+    return lambda: modelo.validate_strings(entrada)
+
+@caso('validate_strings_patologico',
+      {'patron': list(PATRONES_PATOLOGICOS), 'longitud': [12, 16, 20]},
+      {'patron': list(PATRONES_PATOLOGICOS), 'longitud': [12, 16]})
+def _validate_strings_patologico(patron, longitud):
+    # Sin prefiltro: la 'b' obligatoria de (a*)*b descartaría la entrada antes
+    # de llegar al motor y el caso mediría solo la búsqueda de la subcadena.
+    modelo = _modelo([patron], prefiltro=False)
+    entrada = ['a' * longitud + '!']
+    return lambda: modelo.validate_strings(entrada)
+
+@caso('validate_strings_selectivo',
+      {'prefiltro': [False, True], 'cadenas': [10000, 100000]},
+      {'prefiltro': [False, True], 'cadenas': [10000]})
+def _validate_strings_selectivo(prefiltro, cadenas):
+    # Patrones con literales que casi ninguna cadena contiene.
+    modelo = RegexModel(prefilter=prefiltro)
+    for patron in (r'[a-z]+ERROR\d+ at .*', r'(\w+)+timeout=\d+ms', r'.*user=(\w+);id=\d+'):
+        modelo.set_regex(patron)
+    entrada = [f'info usuario{i} conectado desde el equipo {i % 97}' for i in range(cadenas)]
+    return lambda: modelo.validate_strings(entrada)
+
+@caso('explain_regex',
+      {'patrones': [10, 100, 1000]},
+      {'patrones': [10, 100]})
+def _explain_regex(patrones):
+    modelo = _modelo(_patrones(patrones, longitud=20))
+    return modelo.explain_regex
+
+@caso('procesar_expresion',
+      {'longitud': [100, 1000, 10000]},
+      {'longitud': [100, 1000]})
+def _procesar_expresion(longitud):
+    expresion = _expresion(longitud)
+    return lambda: GeneradorAutomata().procesar_expresion(expresion)
+
+@caso('procesar_expresion_anidada',
+      {'profundidad': [10, 100, 1000]},
+      {'profundidad': [10, 100]})
+def _procesar_expresion_anidada(profundidad):
+    expresion = '(a' * profundidad + '|b)*' * profundidad
+    return lambda: GeneradorAutomata().procesar_expresion(expresion)
+
+# AFD que no se bloquea y AFD en el que casi toda cadena aleatoria se bloquea pronto.
+EXPRESIONES_AFD = ('(a|b|c)*c', '(ab|c)*(a|b)+c')
+
+@caso('aceptar_cadenas_afd',
+      {'expresion': list(EXPRESIONES_AFD), 'motor': ['escalar', 'vectorizado'],
+       'cadenas': [10000, 100000]},
+      {'expresion': list(EXPRESIONES_AFD), 'motor': ['escalar', 'vectorizado'],
+       'cadenas': [10000]})
+def _aceptar_cadenas_afd(expresion, motor, cadenas):
+    generador = GeneradorAutomata()
+    generador.procesar_expresion(expresion)
+    afd, _ = minimizar(determinizar(generador.automata))
+    aleatorio = random.Random(0)
+    entrada = [''.join(aleatorio.choice('abc') for _ in range(aleatorio.randint(50, 200)))
+               for _ in range(cadenas)]
+    if motor == 'escalar':
+        return lambda: [afd.accepts(cadena) for cadena in entrada]
+    try:
+        from src.utils.ejecucion_vectorizada import EjecutorVectorizado
+        ejecutor = EjecutorVectorizado(afd)
+    except RuntimeError as error:
+        raise CasoOmitido("NumPy no está instalado") from error
+    return lambda: ejecutor.aceptar(entrada)
+
+@caso('visualizar_automata',
+      {'longitud': [100, 1000]},
+      {'longitud': [100]})
+def _visualizar_automata(longitud):
+    try:
+        import graphviz  # noqa: F401
+    except ImportError as error:
+        raise CasoOmitido("graphviz no está instalado") from error
+    generador = GeneradorAutomata()
+    generador.procesar_expresion(_expresion(longitud))
+    return generador.visualizar_automata
+
+def combinaciones(rejilla):
+    """
+    Recorre todas las combinaciones de parámetros de una rejilla.
+
+    Args:
+        rejilla (dict): Valores de cada parámetro.
+
+    Yields:
+        dict: Una combinación de parámetros.
+    """
+    nombres = list(rejilla)
+    for valores in itertools.product(*(rejilla[nombre] for nombre in nombres)):
+        yield dict(zip(nombres, valores))
+
+def identificador(nombre, parametros):
+    """
+    Construye el identificador estable de un caso, por ejemplo 'explain_regex[patrones=10]'.
+
+    Args:
+        nombre (str): Nombre del caso.
+        parametros (dict): Parámetros de la combinación.
+
+    Returns:
+        str: El identificador del caso.
+    """
+    return f"{nombre}[{','.join(f'{clave}={valor}' for clave, valor in parametros.items())}]"
+
+def cronometrar(funcion, repeticiones):
+    """
+    Ejecuta una función varias veces y mide cada ejecución.
+
+    Args:
+        funcion (Callable): La función a medir.
+        repeticiones (int): Número de ejecuciones.
+
+    Returns:
+        dict: Tiempo mínimo y mediana en segundos, y número de repeticiones.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return {'minimo': min(tiempos), 'mediana': statistics.median(tiempos),
+            'repeticiones': repeticiones}
+
+def ejecutar(repeticiones=5, rapida=False, filtro=None, salida=sys.stdout):
+    """
+    Ejecuta la suite.
+
+    Args:
+        repeticiones (int): Número de ejecuciones de cada caso.
+        rapida (bool): Si es True, usa las rejillas reducidas.
+        filtro (str, optional): Solo se ejecutan los casos cuyo identificador lo contiene.
+        salida (TextIO): Flujo donde se informa el avance.
+
+    Returns:
+        dict: Resultados en el formato de las líneas base.
+    """
+    resultados = {}
+    for nombre, rejilla, rejilla_rapida, preparar in CASOS:
+        for parametros in combinaciones(rejilla_rapida if rapida else rejilla):
+            caso_id = identificador(nombre, parametros)
+            if filtro and filtro not in caso_id:
+                continue
+            try:
+                funcion = preparar(**parametros)
+            except CasoOmitido as motivo:
+                print(f"{caso_id:<60} omitido: {motivo}", file=salida)
+                continue
+            resultados[caso_id] = medida = cronometrar(funcion, repeticiones)
+            print(f"{caso_id:<60} {medida['minimo'] * 1000:10.3f} ms "
+                  f"(mediana {medida['mediana'] * 1000:.3f} ms)", file=salida)
+    return {
+        'formato': FORMATO_BASE,
+        'entorno': {
+            'python': platform.python_version(),
+            'implementacion': platform.python_implementation(),
+            'plataforma': platform.platform(),
+            'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        },
+        'resultados': resultados,
+    }
+
+def comparar(base, actual, umbral, diferencia_minima=0.0):
+    """
+    Compara unos resultados con una línea base.
+
+    Se compara el tiempo mínimo de cada caso, que es la medida menos sensible
+    al ruido de la máquina. Los casos ausentes en alguno de los dos lados, y
+    los que empeoran menos que diferencia_minima en términos absolutos, se
+    ignoran.
+
+    Args:
+        base (dict): Línea base cargada del JSON.
+        actual (dict): Resultados de la ejecución actual.
+        umbral (float): Empeoramiento relativo tolerado (0.2 = 20 %).
+        diferencia_minima (float): Empeoramiento absoluto tolerado, en segundos.
+
+    Returns:
+        list: Tuplas (caso, tiempo base, tiempo actual, cociente) de los casos que empeoran.
+    """
+    regresiones = []
+    for caso_id, medida in actual['resultados'].items():
+        anterior = base['resultados'].get(caso_id)
+        if anterior is None or anterior['minimo'] <= 0:
+            continue
+        cociente = medida['minimo'] / anterior['minimo']
+        if cociente > 1 + umbral and medida['minimo'] - anterior['minimo'] > diferencia_minima:
+            regresiones.append((caso_id, anterior['minimo'], medida['minimo'], cociente))
+    return regresiones
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='ejecuciones de cada caso')
+    parser.add_argument('--quick', action='store_true', help='usa las rejillas reducidas')
+    parser.add_argument('--filter', help='ejecuta solo los casos que contienen este texto')
+    parser.add_argument('--save', metavar='JSON', help='guarda los resultados como línea base')
+    parser.add_argument('--compare', metavar='JSON', nargs='?', const=BASE_RAPIDA,
+                        help='compara con una línea base (por defecto benchmarks/baselines/quick.json)')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='empeoramiento relativo tolerado al comparar (por defecto 0.2)')
+    parser.add_argument('--min-delta-ms', type=float, default=0.1,
+                        help='empeoramiento absoluto tolerado al comparar (por defecto 0.1 ms)')
+    args = parser.parse_args(argv)
+
+    actual = ejecutar(max(1, args.repeat), args.quick, args.filter)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as archivo:
+            json.dump(actual, archivo, indent=2, ensure_ascii=False)
+            archivo.write('\n')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as archivo:
+            base = json.load(archivo)
+        if base.get('formato') != FORMATO_BASE:
+            print(f"FALLO: formato de línea base no reconocido en {args.compare}", file=sys.stderr)
+            return 2
+        regresiones = comparar(base, actual, args.threshold, args.min_delta_ms / 1000)
+        for caso_id, anterior, nuevo, cociente in regresiones:
+            print(f"FALLO: {caso_id}: {anterior * 1000:.3f} ms -> {nuevo * 1000:.3f} ms "
+                  f"(x{cociente:.2f})", file=sys.stderr)
+        if regresiones:
+            return 1
+        print(f"Sin regresiones por encima del {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
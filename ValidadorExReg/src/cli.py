@@ -0,0 +1,171 @@
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from src.models.regex_model import RegexModel
+from src.controllers.regex_controller import RegexController
+
+FORMATS = ('text', 'csv', 'jsonl')
+# Código de salida cuando no se puede abrir un archivo (EX_NOINPUT de sysexits.h)
+EXIT_NO_INPUT = 66
+
+def read_lines(paths):
+    """
+    Genera las líneas de los archivos de entrada, una a una.
+
+    Args:
+        paths (list): Rutas de los archivos; '-' representa la entrada estándar.
+
+    Yields:
+        str: Cada línea leída, sin el salto de línea final.
+
+    Raises:
+        OSError: Si un archivo no se puede abrir; puede ocurrir después de
+            haber producido las líneas de los archivos anteriores.
+    """
+    for path in paths or ['-']:
+        if path == '-':
+            for line in sys.stdin:
+                yield line.rstrip('\n')
+            continue
+        with open(path, encoding='utf-8', errors='replace') as handle:
+            for line in handle:
+                yield line.rstrip('\n')
+
+def write_results(results, patterns, output, fmt):
+    """
+    Escribe los resultados de forma incremental a medida que se producen.
+
+    Args:
+        results (Iterator): Resultados (cadena, índice del patrón, es_válida).
+        patterns (list): Patrones usados, para poder nombrarlos en la salida.
+        output (TextIO): Flujo de salida.
+        fmt (str): Formato de salida: 'text', 'csv' o 'jsonl'.
+
+    Returns:
+        tuple: Número de cadenas válidas y número de resultados escritos.
+    """
+    valid = total = 0
+    if fmt == 'csv':
+        writer = csv.writer(output)
+        writer.writerow(['pattern_index', 'pattern', 'string', 'valid'])
+
+    for string, index, is_valid in results:
+        total += 1
+        valid += is_valid
+        pattern = patterns[index] if index >= 0 else None
+        if fmt == 'csv':
+            writer.writerow([index, pattern, string, int(is_valid)])
+        elif fmt == 'jsonl':
+            output.write(json.dumps({
+                'pattern_index': index,
+                'pattern': pattern,
+                'string': string,
+                'valid': is_valid
+            }, ensure_ascii=False) + '\n')
+        else:
+            result = "✓" if is_valid else "✗"
+            prefix = f"[{index}] " if len(patterns) > 1 else ""
+            output.write(f"{prefix}{string}: {result}\n")
+    return valid, total
+
+def build_parser():
+    """
+    Construye el analizador de argumentos de la línea de comandos.
+
+    Returns:
+        argparse.ArgumentParser: El analizador configurado.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description='Valida líneas de texto contra expresiones regulares sin interfaz gráfica.'
+    )
+    parser.add_argument('inputs', nargs='*', metavar='ARCHIVO',
+                        help="archivos de entrada ('-' o ninguno para la entrada estándar)")
+    parser.add_argument('-p', '--pattern', action='append', default=[], dest='patterns',
+                        help='expresión regular a aplicar (se puede repetir)')
+    parser.add_argument('-P', '--patterns-file',
+                        help='archivo con una expresión regular por línea')
+    parser.add_argument('-i', '--ignore-case', action='store_true',
+                        help='ignorar mayúsculas y minúsculas')
+    parser.add_argument('-f', '--format', choices=FORMATS, default='text',
+                        help='formato de salida (por defecto: text)')
+    parser.add_argument('-o', '--output',
+                        help='archivo de salida (por defecto: salida estándar)')
+    parser.add_argument('-s', '--summary', action='store_true',
+                        help='escribir un resumen en la salida de errores al terminar')
+    return parser
+
+def report_os_error(error):
+    """
+    Informa en la salida de errores de un archivo que no se pudo abrir.
+
+    Args:
+        error (OSError): Error producido al abrir el archivo.
+
+    Returns:
+        int: Código de salida correspondiente.
+    """
+    print(f"regexify: {error.filename}: {error.strerror}", file=sys.stderr)
+    return EXIT_NO_INPUT
+
+def main(argv=None):
+    """
+    Punto de entrada de la validación por línea de comandos.
+
+    Args:
+        argv (list, optional): Argumentos; por defecto los de sys.argv.
+
+    Returns:
+        int: Código de salida del proceso.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    patterns = list(args.patterns)
+    if args.patterns_file:
+        try:
+            with open(args.patterns_file, encoding='utf-8') as handle:
+                patterns.extend(line.rstrip('\n') for line in handle if line.strip())
+        except OSError as error:
+            return report_os_error(error)
+    if not patterns:
+        parser.error('se necesita al menos un patrón (-p o -P)')
+
+    controller = RegexController(RegexModel())
+    flags = re.IGNORECASE if args.ignore_case else 0
+    for pattern in patterns:
+        if not controller.set_regex_pattern(pattern, flags):
+            parser.error(f'la expresión regular no es válida: {pattern}')
+
+    results = controller.iter_validate_strings(read_lines(args.inputs))
+    try:
+        output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    except OSError as error:
+        return report_os_error(error)
+    try:
+        valid, total = write_results(results, controller.model.patterns, output, args.format)
+    except BrokenPipeError:
+        # La salida se cerró antes de tiempo (por ejemplo, al encadenar con head).
+        # Se redirige stdout a devnull para que el vaciado final al salir no
+        # vuelva a fallar, y stderr sigue disponible para los errores.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 141
+    except OSError as error:
+        if error.filename is None:
+            raise
+        # Un archivo de entrada no se pudo abrir a mitad del recorrido; los
+        # resultados de los archivos anteriores ya se escribieron.
+        return report_os_error(error)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if args.summary:
+        print(f"{valid}/{total} resultados válidos", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
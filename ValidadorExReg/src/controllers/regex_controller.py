@@ -1,37 +1,291 @@
-from typing import List
-from src.models.regex_model import RegexModel
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from src.models.match_results import MatchResults, ValidationMatrix
+from src.models.regex_model import FileMatch, PatternSnapshot, RegexModel
+from src.utils.metricas import metricas
+
+# Patrones compilados en cada proceso del pool (ver _init_worker).
+_worker_regexes = []
+
+def _init_worker(patterns: List[str], flags: List[int]):
+    """Compila los patrones una sola vez al arrancar cada proceso del pool."""
+    global _worker_regexes
+    _worker_regexes = [re.compile(p, f) for p, f in zip(patterns, flags)]
+
+def _validate_chunk(chunk: List[str]) -> List[bytes]:
+    """Valida un bloque de cadenas; devuelve un byte (0/1) por cadena y patrón."""
+    return [bytes(1 if regex.match(s) else 0 for s in chunk) for regex in _worker_regexes]
 
 class RegexController:
     """Controlador principal para la aplicación de validación de regex."""
 
-    def __init__(self, model: RegexModel):
+    def __init__(self, model: RegexModel, line_cache_size: int = 100000):
         self.model = model
+        self.line_cache_size = line_cache_size
+        self._line_cache = (None, {})
+        self._line_cache_lock = threading.Lock()
+        self._pool = None
+        self._pool_key = None
 
-    def set_regex_pattern(self, pattern: str) -> bool:
+    def set_regex_pattern(self, pattern: str, flags: int = 0) -> bool:
         """
         Establece un nuevo patrón de expresión regular.
 
         Args:
             pattern (str): El patrón de expresión regular
+            flags (int): Flags de compilación del módulo re
 
         Returns:
             bool: True si el patrón es válido, False en caso contrario
         """
-        return self.model.set_regex(pattern)
+        return self.model.set_regex(pattern, flags)
 
-    def validate_strings(self, strings: List[str]) -> List[tuple]:
+    def validate_strings(self, strings: List[str], parallel: bool = False,
+                         workers: Optional[int] = None, chunk_size: int = 20000,
+                         min_parallel_size: int = 100000) -> List[tuple]:
         """
         Valida una lista de cadenas contra el patrón actual.
 
+        En modo paralelo las cadenas se reparten en bloques entre los procesos
+        de un pool, que compilan los patrones una sola vez, y los resultados se
+        reúnen en el mismo orden que en el modo secuencial. Los lotes pequeños
+        se validan siempre en el proceso actual.
+
         Args:
             strings (List[str]): Lista de cadenas a validar
+            parallel (bool): Si es True, usa el pool de procesos para lotes grandes
+            workers (int, optional): Número de procesos (por defecto, os.cpu_count())
+            chunk_size (int): Número de cadenas de cada bloque enviado al pool
+            min_parallel_size (int): Tamaño mínimo del lote para usar el pool
 
         Returns:
             List[tuple]: Lista de resultados (cadena, es_válida)
         """
+        inicio = time.perf_counter() if metricas.activo else 0.0
         # Limpiamos las cadenas de entrada
         cleaned_strings = [s.strip() for s in strings if s.strip()]
-        return self.model.validate_strings(cleaned_strings)
+        if (not parallel or not self.model.patterns
+                or len(cleaned_strings) < max(min_parallel_size, chunk_size)):
+            results = self.model.validate_strings(cleaned_strings)
+        else:
+            results = self._validate_parallel(cleaned_strings, workers, chunk_size)
+        if metricas.activo:
+            self._record_validation(inicio, len(cleaned_strings))
+        return results
+
+    def _record_validation(self, inicio: float, count: int):
+        """Registra la duración de una validación y el número de cadenas validadas."""
+        metricas.observar('controlador.validacion', time.perf_counter() - inicio)
+        metricas.incrementar('controlador.cadenas', count)
+
+    def _validate_parallel(self, strings: List[str], workers: Optional[int],
+                           chunk_size: int) -> List[tuple]:
+        """
+        Valida las cadenas en el pool de procesos conservando el orden de resultados.
+
+        Args:
+            strings (List[str]): Cadenas ya limpias
+            workers (int, optional): Número de procesos
+            chunk_size (int): Número de cadenas por bloque
+
+        Returns:
+            List[tuple]: Lista de resultados (cadena, es_válida)
+        """
+        # Importación diferida: el pool solo se necesita en lotes grandes.
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = workers or os.cpu_count() or 1
+        key = (tuple(self.model.patterns), tuple(self.model.flags), workers)
+        if self._pool is None or self._pool_key != key:
+            # El pool se conserva entre llamadas mientras no cambien los patrones.
+            self.shutdown_pool()
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(list(self.model.patterns), list(self.model.flags))
+            )
+            self._pool_key = key
+
+        chunks = [strings[i:i + chunk_size] for i in range(0, len(strings), chunk_size)]
+        columns = [bytearray() for _ in self.model.patterns]
+        for chunk_result in self._pool.map(_validate_chunk, chunks):
+            for column, chunk_column in zip(columns, chunk_result):
+                column += chunk_column
+
+        results = []
+        for column in columns:
+            results.extend(zip(strings, map(bool, column)))
+        return results
+
+    def snapshot_patterns(self) -> PatternSnapshot:
+        """
+        Toma una copia inmutable de los patrones para validar desde otro hilo.
+
+        Returns:
+            PatternSnapshot: La copia de los patrones actuales
+        """
+        return self.model.snapshot()
+
+    def validate_strings_cached(self, strings: List[str],
+                                snapshot: Optional[PatternSnapshot] = None) -> List[tuple]:
+        """
+        Valida una lista de cadenas reutilizando los resultados de llamadas anteriores.
+
+        Los resultados se guardan por cadena bajo la versión del conjunto de
+        patrones del modelo: mientras los patrones no cambien solo se validan las
+        cadenas nuevas, y cualquier cambio de patrones invalida la caché entera.
+
+        Con una copia de los patrones (ver snapshot_patterns) la validación no
+        consulta el modelo, de modo que puede ejecutarse en otro hilo mientras
+        el hilo principal cambia los patrones. Varias llamadas concurrentes
+        comparten la caché bajo un candado; una copia más antigua que la caché
+        actual valida sin guardar nada, para no descartar resultados más nuevos.
+
+        Args:
+            strings (List[str]): Lista de cadenas a validar
+            snapshot (PatternSnapshot, optional): Patrones a usar; por defecto los actuales
+
+        Returns:
+            List[tuple]: Lista de resultados (cadena, es_válida), en el mismo
+                orden que validate_strings; sin patrones, un único grupo de resultados
+        """
+        inicio = time.perf_counter() if metricas.activo else 0.0
+        if snapshot is None:
+            snapshot = self.model.snapshot()
+        cleaned_strings = [s.strip() for s in strings if s.strip()]
+        if not snapshot.patterns:
+            return [(s, False) for s in cleaned_strings]
+
+        unique_strings = dict.fromkeys(cleaned_strings)
+        with self._line_cache_lock:
+            version, cache = self._line_cache
+            if version is not None and snapshot.version < version:
+                cache = {}
+            elif version != snapshot.version or len(cache) > self.line_cache_size:
+                cache = {}
+                self._line_cache = (snapshot.version, cache)
+            pending = [s for s in unique_strings if s not in cache]
+        if pending:
+            # La validación se hace fuera del candado; las entradas nunca se
+            # borran de un diccionario, así que las demás llamadas pueden leerlo.
+            validated = self.model.validate_strings_set(pending, snapshot)
+            with self._line_cache_lock:
+                cache.update(validated)
+
+        results = []
+        for index in range(len(snapshot.patterns)):
+            results.extend([(s, index in cache[s]) for s in cleaned_strings])
+        if metricas.activo:
+            metricas.incrementar('controlador.cache_lineas.aciertos', len(unique_strings) - len(pending))
+            metricas.incrementar('controlador.cache_lineas.fallos', len(pending))
+            self._record_validation(inicio, len(cleaned_strings))
+        return results
+
+    def shutdown_pool(self):
+        """Detiene el pool de procesos usado por la validación paralela."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_key = None
+
+    def iter_validate_strings(self, strings: Iterable[str]) -> Iterator[Tuple[str, int, bool]]:
+        """
+        Valida de forma perezosa un flujo de cadenas, sin cargarlo en memoria.
+
+        Args:
+            strings (Iterable[str]): Cadenas a validar, por ejemplo las líneas de un archivo
+
+        Returns:
+            Iterator[Tuple[str, int, bool]]: Resultados (cadena, índice del patrón, es_válida)
+        """
+        cleaned_strings = (s.strip() for s in strings)
+        return self.model.iter_validate_strings(s for s in cleaned_strings if s)
+
+    def validate_matrix(self, strings: List[str], aggregate_only: bool = False) -> ValidationMatrix:
+        """
+        Valida una lista de cadenas con resultados en una matriz de bits.
+
+        Args:
+            strings (List[str]): Lista de cadenas a validar
+            aggregate_only (bool): Si es True, solo se cuentan las cadenas válidas
+
+        Returns:
+            ValidationMatrix: Matriz patrones × cadenas; las columnas corresponden
+                a las cadenas ya limpias, en el orden de entrada
+        """
+        inicio = time.perf_counter() if metricas.activo else 0.0
+        cleaned_strings = [s.strip() for s in strings if s.strip()]
+        matrix = self.model.validate_matrix(cleaned_strings, aggregate_only)
+        if metricas.activo:
+            self._record_validation(inicio, len(cleaned_strings))
+        return matrix
+
+    def match_strings(self, strings: List[str], mode: str = 'fullmatch') -> MatchResults:
+        """
+        Evalúa una lista de cadenas con el modo de coincidencia indicado.
+
+        Args:
+            strings (List[str]): Lista de cadenas a evaluar
+            mode (str): 'fullmatch', 'match', 'search' o 'finditer'
+
+        Returns:
+            MatchResults: Coincidencias en formato columnar; los índices de
+                cadena se refieren a las cadenas ya limpias (results.strings)
+        """
+        cleaned_strings = [s.strip() for s in strings if s.strip()]
+        return self.model.match_strings(cleaned_strings, mode)
+
+    def scan_file(self, path: str, mode: str = 'match') -> Iterator[FileMatch]:
+        """
+        Recorre un archivo grande sin cargarlo en memoria (ver RegexModel.scan_file).
+
+        Args:
+            path (str): Ruta del archivo
+            mode (str): 'match' para validar cada línea, 'search' para buscar coincidencias
+
+        Returns:
+            Iterator[FileMatch]: Resultados (índice del patrón, número de línea,
+                desplazamiento de la línea, span)
+        """
+        return self.model.scan_file(path, mode)
+
+    def validate_strings_set(self, strings: List[str]) -> List[Tuple[str, FrozenSet[int]]]:
+        """
+        Valida una lista de cadenas contra todos los patrones a la vez.
+
+        Args:
+            strings (List[str]): Lista de cadenas a validar
+
+        Returns:
+            List[Tuple[str, FrozenSet[int]]]: Lista de resultados
+                (cadena, índices de los patrones que la aceptan)
+        """
+        cleaned_strings = [s.strip() for s in strings if s.strip()]
+        return self.model.validate_strings_set(cleaned_strings)
+
+    def validate_strings_guarded(self, strings: List[str],
+                                 pattern_timeout: Optional[float] = None,
+                                 string_timeout: float = 1.0) -> List[tuple]:
+        """
+        Valida una lista de cadenas con presupuesto de tiempo por patrón y por cadena.
+
+        Args:
+            strings (List[str]): Lista de cadenas a validar
+            pattern_timeout (float, optional): Segundos disponibles para cada patrón
+            string_timeout (float): Segundos disponibles para cada cadena
+
+        Returns:
+            List[tuple]: Lista de resultados (cadena, True | False | TIMEOUT)
+        """
+        cleaned_strings = [s.strip() for s in strings if s.strip()]
+        return self.model.validate_strings_guarded(
+            cleaned_strings,
+            pattern_timeout=pattern_timeout,
+            string_timeout=string_timeout
+        )
 
     def get_regex_explanation(self) -> str:
         """
@@ -44,4 +298,80 @@ class RegexController:
 
     def clear_patterns(self):
         """Limpia todos los patrones de expresión regular almacenados."""
-        self.model.clear_patterns()
\ No newline at end of file
+        self.model.clear_patterns()
+
+    def enable_metrics(self, dump_path: Optional[str] = None, dump_interval: float = 60.0):
+        """
+        Activa la instrumentación de los caminos críticos.
+
+        Args:
+            dump_path (str, optional): Archivo JSON donde volcar get_metrics periódicamente
+            dump_interval (float): Segundos entre volcados
+        """
+        metricas.activar()
+        if dump_path is not None:
+            metricas.iniciar_volcado(dump_path, dump_interval, extra=self._derived_metrics)
+
+    def disable_metrics(self):
+        """Desactiva la instrumentación y detiene el volcado periódico."""
+        metricas.desactivar()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Obtiene una instantánea de las métricas registradas.
+
+        Además de los contadores, valores e histogramas registrados (tiempos de
+        compilación y de coincidencia por patrón, duración de las validaciones,
+        construcción y renderizado de autómatas), incluye métricas derivadas:
+        cadenas por segundo y tasas de acierto de las cachés.
+
+        Returns:
+            Dict[str, Any]: La instantánea de las métricas
+        """
+        snapshot = metricas.instantanea()
+        snapshot.update(self._derived_metrics(snapshot))
+        return snapshot
+
+    def _derived_metrics(self, snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Calcula las métricas derivadas de una instantánea."""
+        if snapshot is None:
+            snapshot = metricas.instantanea()
+        counters = snapshot['contadores']
+
+        def rate(hits: int, misses: int) -> float:
+            return hits / (hits + misses) if hits + misses else 0.0
+
+        validation = snapshot['histogramas'].get('controlador.validacion')
+        strings = counters.get('controlador.cadenas', 0)
+        pattern_cache = self.model.get_cache_stats()
+        line_hits = counters.get('controlador.cache_lineas.aciertos', 0)
+        line_misses = counters.get('controlador.cache_lineas.fallos', 0)
+        return {
+            'derivadas': {
+                'cadenas_por_segundo': (strings / validation['total']
+                                        if validation and validation['total'] else 0.0),
+                'cache_patrones': dict(
+                    pattern_cache,
+                    hit_rate=rate(pattern_cache['hits'], pattern_cache['misses'])
+                ),
+                'cache_lineas': {
+                    'size': len(self._line_cache[1]),
+                    'hits': line_hits,
+                    'misses': line_misses,
+                    'hit_rate': rate(line_hits, line_misses),
+                },
+                'cache_automatas': {
+                    'hit_rate': rate(counters.get('automata.cache.aciertos', 0),
+                                     counters.get('automata.cache.fallos', 0)),
+                },
+            }
+        }
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores de la caché de patrones compilados.
+
+        Returns:
+            Dict[str, int]: Tamaño, capacidad, aciertos, fallos y desalojos
+        """
+        return self.model.get_cache_stats()
\ No newline at end of file
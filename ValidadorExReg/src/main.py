@@ -2,9 +2,13 @@ from src.models.regex_model import RegexModel
 from src.controllers.regex_controller import RegexController
 from src.views.main_window import MainWindow
 from src.views.start_window import StartWindow
+from src.utils.automata_generator import activar_cache_en_disco
 import tkinter as tk
 
 def main():
+    # Conservar los autómatas ya construidos entre ejecuciones
+    activar_cache_en_disco()
+
     # Crear instancias de los componentes MVC
     model = RegexModel()
     controller = RegexController(model)
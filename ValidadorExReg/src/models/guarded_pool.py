@@ -0,0 +1,204 @@
+import atexit
+import multiprocessing
+import time
+from collections import deque
+from multiprocessing.connection import wait
+from typing import List, Optional, Tuple
+from src.models.pattern_cache import PatternCache
+
+# Resultado usado para las cadenas que agotan su presupuesto de tiempo.
+TIMEOUT = 'timeout'
+
+def _worker_main(conn, results, progress):
+    """
+    Bucle de un proceso trabajador.
+
+    Recibe trabajos (patrón, flags, cadenas) y escribe el resultado de cada
+    cadena en la memoria compartida, anotando antes el índice de la cadena en
+    curso para que el proceso principal sepa cuál se ha quedado bloqueada.
+    """
+    cache = PatternCache()
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+
+        pattern, flags, strings = job
+        regex = cache.get(pattern, flags)
+        for index, string in enumerate(strings):
+            progress.value = index
+            results[index] = 1 if regex.match(string) else 0
+        progress.value = len(strings)
+        conn.send(True)
+
+class _Worker:
+    """Proceso trabajador con su canal y su memoria compartida de resultados."""
+
+    def __init__(self, context, capacity: int):
+        self.results = context.RawArray('b', capacity)
+        self.progress = context.RawValue('i', 0)
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self.results, self.progress),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+class _Task:
+    """Estado de la validación de un patrón en curso dentro de un trabajador."""
+
+    def __init__(self, index: int, pattern: str, flags: int, deadline: Optional[float]):
+        self.index = index
+        self.pattern = pattern
+        self.flags = flags
+        self.deadline = deadline
+        self.offset = 0
+        self.size = 0
+        self.last_progress = -1
+        self.progress_since = 0.0
+
+class GuardedPool:
+    """
+    Grupo reutilizable de procesos para validar con presupuesto de tiempo.
+
+    Cada patrón se evalúa en un proceso trabajador aparte. Si una cadena supera
+    su presupuesto, o el patrón agota el suyo, el trabajador se termina y se
+    reemplaza, y las cadenas afectadas se marcan como TIMEOUT en lugar de
+    bloquear al llamador. Los trabajadores se conservan entre llamadas, así que
+    en entradas normales solo se paga el envío de las cadenas.
+
+    Attributes:
+        workers (int): Número de procesos trabajadores.
+        capacity (int): Número máximo de cadenas enviadas en cada trabajo.
+    """
+
+    def __init__(self, workers: int = 2, capacity: int = 4096):
+        """
+        Inicializa el grupo; los procesos se crean al primer uso.
+
+        Args:
+            workers (int): Número de procesos trabajadores
+            capacity (int): Número máximo de cadenas enviadas en cada trabajo
+        """
+        if workers < 1 or capacity < 1:
+            raise ValueError("workers y capacity deben ser mayores o iguales a 1")
+        self.workers = workers
+        self.capacity = capacity
+        self._context = multiprocessing.get_context()
+        self._idle = []
+        atexit.register(self.shutdown)
+
+    def _acquire(self) -> _Worker:
+        return self._idle.pop() if self._idle else _Worker(self._context, self.capacity)
+
+    def validate(self, patterns: List[Tuple[str, int]], strings: List[str],
+                 pattern_timeout: Optional[float] = None,
+                 string_timeout: float = 1.0) -> List[list]:
+        """
+        Valida las cadenas contra cada patrón con presupuesto de tiempo.
+
+        Args:
+            patterns (List[Tuple[str, int]]): Pares (patrón, flags)
+            strings (List[str]): Cadenas a validar
+            pattern_timeout (float, optional): Segundos disponibles para cada patrón
+            string_timeout (float): Segundos disponibles para cada cadena
+
+        Returns:
+            List[list]: Para cada patrón, una lista con True, False o TIMEOUT por cadena
+        """
+        outcomes = [[TIMEOUT] * len(strings) for _ in patterns]
+        pending = deque(enumerate(patterns))
+        running = {}
+        tick = min(string_timeout, pattern_timeout or string_timeout) / 4
+
+        def dispatch(worker, task, now):
+            task.size = min(self.capacity, len(strings) - task.offset)
+            task.last_progress = -1
+            task.progress_since = now
+            worker.progress.value = 0
+            chunk = strings[task.offset:task.offset + task.size]
+            worker.conn.send((task.pattern, task.flags, chunk))
+            running[worker.conn] = (worker, task)
+
+        def collect(worker, task, count):
+            row = outcomes[task.index]
+            for i in range(count):
+                row[task.offset + i] = bool(worker.results[i])
+
+        def abort(worker, task, now, pattern_expired):
+            # La cadena en curso agotó su presupuesto (o el patrón el suyo): se
+            # descarta el trabajador y se conserva lo ya calculado.
+            progress = min(worker.progress.value, task.size)
+            collect(worker, task, progress)
+            worker.kill()
+            if pattern_expired:
+                return
+            task.offset += progress + 1
+            if task.offset < len(strings):
+                dispatch(self._acquire(), task, now)
+
+        try:
+            while pending or running:
+                now = time.monotonic()
+                while pending and len(running) < self.workers:
+                    index, (pattern, flags) = pending.popleft()
+                    deadline = now + pattern_timeout if pattern_timeout is not None else None
+                    task = _Task(index, pattern, flags, deadline)
+                    if strings:
+                        dispatch(self._acquire(), task, now)
+
+                for conn in wait(list(running), timeout=tick):
+                    worker, task = running.pop(conn)
+                    try:
+                        conn.recv()
+                    except EOFError:
+                        abort(worker, task, time.monotonic(), False)
+                        continue
+                    collect(worker, task, task.size)
+                    task.offset += task.size
+                    if task.offset < len(strings):
+                        dispatch(worker, task, time.monotonic())
+                    else:
+                        self._idle.append(worker)
+
+                now = time.monotonic()
+                for conn, (worker, task) in list(running.items()):
+                    progress = worker.progress.value
+                    if progress != task.last_progress:
+                        task.last_progress = progress
+                        task.progress_since = now
+                    pattern_expired = task.deadline is not None and now >= task.deadline
+                    string_expired = (progress < task.size
+                                      and now - task.progress_since >= string_timeout)
+                    if pattern_expired or string_expired:
+                        del running[conn]
+                        abort(worker, task, now, pattern_expired)
+        except BaseException:
+            for worker, _ in running.values():
+                worker.kill()
+            raise
+
+        return outcomes
+
+    def shutdown(self):
+        """Detiene todos los procesos trabajadores inactivos."""
+        for worker in self._idle:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.process.join(timeout=1)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+        self._idle = []
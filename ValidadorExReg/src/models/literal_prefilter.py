@@ -0,0 +1,165 @@
+import os
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+try:
+    import re._parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Códigos de operación que solo existen en algunas versiones de Python.
+_ATOMIC_GROUP = getattr(sre_parse, 'ATOMIC_GROUP', None)
+_REPEATS = tuple(op for op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT,
+                               getattr(sre_parse, 'POSSESSIVE_REPEAT', None))
+                 if op is not None)
+
+@lru_cache(maxsize=512)
+def required_literals(pattern: str, flags: int = 0) -> Tuple[str, ...]:
+    """
+    Extrae las subcadenas fijas que aparecen en toda cadena aceptada por un patrón.
+
+    Por ejemplo, toda cadena en la que foo\\d+bar encuentra una coincidencia
+    contiene 'foo' y 'bar'. El análisis recorre el árbol de sre_parse: las
+    secuencias de literales consecutivos forman un factor, las repeticiones con
+    mínimo uno y las búsquedas anticipadas positivas aportan los factores de
+    su contenido, y una alternativa aporta los factores comunes a todas sus
+    ramas. Las repeticiones de un cuerpo literal (ab{2}c da 'abbc') y el
+    principio y el final comunes de las ramas de una alternativa
+    ((?:foo|xfoo)bar da 'foobar') se unen a los literales vecinos. Los
+    patrones sin distinción de mayúsculas no aportan factores.
+
+    Args:
+        pattern (str): El patrón de expresión regular
+        flags (int): Flags de compilación del módulo re
+
+    Returns:
+        Tuple[str, ...]: Factores requeridos, del más largo al más corto;
+            vacía si no se puede asegurar ninguno
+    """
+    if flags & re.IGNORECASE:
+        return ()
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+        if parsed.state.flags & sre_parse.SRE_FLAG_IGNORECASE:
+            return ()
+        factors = _sequence_factors(parsed)
+    except (re.error, RecursionError):
+        return ()
+    return tuple(sorted(set(factors), key=len, reverse=True))
+
+def _sequence_factors(items) -> List[str]:
+    """Obtiene los factores requeridos de una secuencia del árbol de sre_parse."""
+    factors = []
+    run = []
+    _walk(items, run, factors)
+    _flush(run, factors)
+    return factors
+
+def _flush(run: List[str], factors: List[str]):
+    """Cierra la secuencia de literales en curso y la añade a los factores."""
+    factor = ''.join(run)
+    if factor:
+        factors.append(factor)
+    run.clear()
+
+def _walk(items, run: List[str], factors: List[str]):
+    """
+    Recorre una secuencia acumulando literales consecutivos en run.
+
+    Args:
+        items: Secuencia de nodos (código, argumento) de sre_parse
+        run (List[str]): Literales consecutivos aún no cerrados
+        factors (List[str]): Factores requeridos encontrados
+    """
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+        elif op is sre_parse.IN and len(av) == 1 and av[0][0] is sre_parse.LITERAL:
+            # Una clase de un solo carácter, como [x], equivale a un literal.
+            run.append(chr(av[0][1]))
+        elif op is sre_parse.SUBPATTERN:
+            _, add_flags, _, subpattern = av
+            if add_flags & sre_parse.SRE_FLAG_IGNORECASE:
+                _flush(run, factors)
+            else:
+                # El contenido del grupo sigue a los literales anteriores.
+                _walk(subpattern, run, factors)
+        elif op is _ATOMIC_GROUP:
+            _walk(av, run, factors)
+        elif op in _REPEATS:
+            minimum, maximum, item = av
+            text = _literal_text(item)
+            if text is None:
+                _flush(run, factors)
+                if minimum >= 1:
+                    factors.extend(_sequence_factors(item))
+            elif minimum == maximum:
+                # Un número fijo de copias de un literal sigue siendo un literal.
+                run.append(text * minimum)
+            else:
+                # Las primeras copias siguen a lo anterior y las últimas preceden a lo siguiente.
+                run.append(text * minimum)
+                _flush(run, factors)
+                run.append(text * minimum)
+        elif op is sre_parse.BRANCH:
+            branches = av[1]
+            # El principio común de las ramas sigue a lo anterior y el final
+            # común precede a lo siguiente.
+            run.append(os.path.commonprefix([_literal_edge(branch) for branch in branches]))
+            _flush(run, factors)
+            factors.extend(_common_factors([_sequence_factors(branch) for branch in branches]))
+            suffixes = [_literal_edge(branch, from_end=True)[::-1] for branch in branches]
+            run.append(os.path.commonprefix(suffixes)[::-1])
+        elif op is sre_parse.ASSERT:
+            _flush(run, factors)
+            # Lo que exige una búsqueda anticipada o hacia atrás también está en la cadena.
+            factors.extend(_sequence_factors(av[1]))
+        elif op is sre_parse.AT:
+            # Las anclas no consumen caracteres: la secuencia sigue siendo contigua.
+            continue
+        else:
+            _flush(run, factors)
+
+def _literal_text(items) -> Optional[str]:
+    """Obtiene el texto de una secuencia formada solo por literales, o None si no lo es."""
+    parts = []
+    for node in items:
+        text = _node_text(node)
+        if text is None:
+            return None
+        parts.append(text)
+    return ''.join(parts)
+
+def _literal_edge(items, from_end: bool = False) -> str:
+    """Obtiene el texto de los literales del principio (o del final) de una secuencia."""
+    parts = []
+    for node in (reversed(items) if from_end else items):
+        text = _node_text(node)
+        if text is None:
+            break
+        parts.append(text)
+    return ''.join(reversed(parts) if from_end else parts)
+
+def _node_text(node) -> Optional[str]:
+    """Obtiene el texto que reconoce un nodo literal, o None si no es literal."""
+    op, av = node
+    if op is sre_parse.LITERAL:
+        return chr(av)
+    if op is sre_parse.IN and len(av) == 1 and av[0][0] is sre_parse.LITERAL:
+        return chr(av[0][1])
+    if op is sre_parse.AT:
+        # Las anclas no consumen caracteres.
+        return ''
+    if op is sre_parse.SUBPATTERN and not av[1] & sre_parse.SRE_FLAG_IGNORECASE:
+        return _literal_text(av[3])
+    if op is _ATOMIC_GROUP:
+        return _literal_text(av)
+    return None
+
+def _common_factors(branches: List[List[str]]) -> List[str]:
+    """Obtiene los factores de la primera rama contenidos en algún factor de cada otra rama."""
+    if not branches:
+        return []
+    return [factor for factor in branches[0]
+            if all(any(factor in other for other in branch) for branch in branches[1:])]
@@ -0,0 +1,298 @@
+from array import array
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+class MatchResults:
+    """
+    Resultados de coincidencia en formato columnar.
+
+    Cada coincidencia ocupa una fila repartida en cuatro arrays paralelos de
+    enteros (índice de la cadena, índice del patrón, inicio y fin), en lugar de
+    una tupla con una referencia a la cadena. Las cadenas se guardan una sola
+    vez, en el orden de entrada. Solo se registran las coincidencias: un par
+    (cadena, patrón) sin coincidencia no ocupa ninguna fila.
+
+    Attributes:
+        strings (Sequence[str]): Cadenas evaluadas, en el orden de entrada.
+        pattern_count (int): Número de patrones evaluados.
+        mode (str): Modo de coincidencia usado ('fullmatch', 'match', 'search' o 'finditer').
+        string_index (array): Índice de la cadena de cada fila.
+        pattern_index (array): Índice del patrón de cada fila.
+        start (array): Inicio de la coincidencia de cada fila.
+        end (array): Fin de la coincidencia de cada fila.
+    """
+
+    __slots__ = ('strings', 'pattern_count', 'mode',
+                 'string_index', 'pattern_index', 'start', 'end')
+
+    def __init__(self, strings: Sequence[str], pattern_count: int, mode: str):
+        """
+        Crea un conjunto de resultados vacío.
+
+        Args:
+            strings (Sequence[str]): Cadenas evaluadas
+            pattern_count (int): Número de patrones evaluados
+            mode (str): Modo de coincidencia usado
+        """
+        self.strings = strings
+        self.pattern_count = pattern_count
+        self.mode = mode
+        self.string_index = array('i')
+        self.pattern_index = array('i')
+        self.start = array('i')
+        self.end = array('i')
+
+    def __len__(self) -> int:
+        return len(self.string_index)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int, int]]:
+        """Recorre las filas como tuplas (índice de cadena, índice de patrón, inicio, fin)."""
+        return zip(self.string_index, self.pattern_index, self.start, self.end)
+
+    def __repr__(self) -> str:
+        return (f"MatchResults(mode={self.mode!r}, strings={len(self.strings)}, "
+                f"patterns={self.pattern_count}, rows={len(self)})")
+
+    def group(self, row: int) -> str:
+        """
+        Obtiene el texto de la coincidencia de una fila.
+
+        Args:
+            row (int): Índice de la fila
+
+        Returns:
+            str: La subcadena coincidente
+        """
+        return self.strings[self.string_index[row]][self.start[row]:self.end[row]]
+
+    def rows_for_pattern(self, pattern: int) -> List[int]:
+        """
+        Obtiene las filas de un patrón.
+
+        Args:
+            pattern (int): Índice del patrón
+
+        Returns:
+            List[int]: Índices de las filas, en el orden de las cadenas
+        """
+        return [row for row, index in enumerate(self.pattern_index) if index == pattern]
+
+    def spans(self, string: int, pattern: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Obtiene las coincidencias de una cadena.
+
+        Args:
+            string (int): Índice de la cadena
+            pattern (int, optional): Si se indica, solo las coincidencias de ese patrón
+
+        Returns:
+            List[Tuple[int, int]]: Tramos (inicio, fin) de las coincidencias
+        """
+        return [(self.start[row], self.end[row])
+                for row, index in enumerate(self.string_index)
+                if index == string and (pattern is None or self.pattern_index[row] == pattern)]
+
+    def matched(self, pattern: int) -> bytearray:
+        """
+        Indica qué cadenas tienen al menos una coincidencia con un patrón.
+
+        Args:
+            pattern (int): Índice del patrón
+
+        Returns:
+            bytearray: Un byte (0/1) por cadena, en el orden de entrada
+        """
+        flags = bytearray(len(self.strings))
+        for index, string in zip(self.pattern_index, self.string_index):
+            if index == pattern:
+                flags[string] = 1
+        return flags
+
+# Traduce los bytes 0/1 de un resultado a los dígitos de un número binario.
+_BINARY_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+class ValidationMatrix:
+    """
+    Resultados de validación en una matriz de bits empaquetada (patrones × cadenas).
+
+    Cada patrón ocupa una fila de ceil(cadenas / 8) bytes y el bit i de la
+    fila (empezando por el bit menos significativo del primer byte) indica si
+    la cadena i es válida. Las cadenas no se guardan, así que la matriz ocupa
+    un bit por par (patrón, cadena) y se serializa copiando sus bytes. En modo
+    solo agregados no se guardan los bits, únicamente las cuentas por patrón.
+
+    Attributes:
+        pattern_count (int): Número de patrones (filas).
+        string_count (int): Número de cadenas (columnas).
+        counts (List[int]): Número de cadenas válidas de cada patrón.
+        aggregate_only (bool): Si es True, solo están disponibles las cuentas.
+    """
+
+    __slots__ = ('pattern_count', 'string_count', 'counts', 'aggregate_only',
+                 '_row_bytes', '_bits')
+
+    def __init__(self, pattern_count: int, string_count: int, aggregate_only: bool = False):
+        """
+        Crea una matriz sin ningún resultado válido.
+
+        Args:
+            pattern_count (int): Número de patrones
+            string_count (int): Número de cadenas
+            aggregate_only (bool): Si es True, solo se guardan las cuentas
+        """
+        self.pattern_count = pattern_count
+        self.string_count = string_count
+        self.counts = [0] * pattern_count
+        self.aggregate_only = aggregate_only
+        self._row_bytes = (string_count + 7) // 8
+        self._bits = None if aggregate_only else bytearray(self._row_bytes * pattern_count)
+
+    def __repr__(self) -> str:
+        return (f"ValidationMatrix(patterns={self.pattern_count}, strings={self.string_count}, "
+                f"aggregate_only={self.aggregate_only})")
+
+    def set_row(self, pattern: int, flags: bytes):
+        """
+        Guarda la fila de un patrón a partir de un byte (0/1) por cadena.
+
+        Args:
+            pattern (int): Índice del patrón
+            flags (bytes): Un byte 0 o 1 por cadena, en el orden de entrada
+        """
+        self.counts[pattern] = flags.count(1)
+        if self._bits is None or not flags:
+            return
+        # Empaquetado lineal: los bytes 0/1 se leen como un número binario.
+        value = int(flags.translate(_BINARY_DIGITS)[::-1], 2)
+        start = pattern * self._row_bytes
+        self._bits[start:start + self._row_bytes] = value.to_bytes(self._row_bytes, 'little')
+
+    def _require_bits(self):
+        if self._bits is None:
+            raise ValueError("La matriz solo guarda agregados")
+
+    def _row_value(self, pattern: int) -> int:
+        start = pattern * self._row_bytes
+        return int.from_bytes(self._bits[start:start + self._row_bytes], 'little')
+
+    def get(self, pattern: int, string: int) -> bool:
+        """
+        Indica si una cadena es válida para un patrón.
+
+        Args:
+            pattern (int): Índice del patrón
+            string (int): Índice de la cadena
+
+        Returns:
+            bool: True si la cadena es válida
+        """
+        self._require_bits()
+        if not 0 <= string < self.string_count:
+            raise IndexError("índice de cadena fuera de rango")
+        return bool(self._bits[pattern * self._row_bytes + (string >> 3)] >> (string & 7) & 1)
+
+    def pattern_row(self, pattern: int) -> List[bool]:
+        """
+        Obtiene el resultado de todas las cadenas para un patrón.
+
+        Args:
+            pattern (int): Índice del patrón
+
+        Returns:
+            List[bool]: Un valor por cadena, en el orden de entrada
+        """
+        self._require_bits()
+        digits = format(self._row_value(pattern), f'0{self._row_bytes * 8}b')[::-1]
+        return [digit == '1' for digit in digits[:self.string_count]]
+
+    def valid_strings(self, pattern: int) -> List[int]:
+        """
+        Obtiene los índices de las cadenas válidas para un patrón.
+
+        Args:
+            pattern (int): Índice del patrón
+
+        Returns:
+            List[int]: Índices de las cadenas válidas, en orden creciente
+        """
+        return [index for index, is_valid in enumerate(self.pattern_row(pattern)) if is_valid]
+
+    def string_column(self, string: int) -> List[bool]:
+        """
+        Obtiene el resultado de una cadena para todos los patrones.
+
+        Args:
+            string (int): Índice de la cadena
+
+        Returns:
+            List[bool]: Un valor por patrón, en orden de inserción
+        """
+        return [self.get(pattern, string) for pattern in range(self.pattern_count)]
+
+    def to_tuples(self, strings: Sequence[str]) -> List[tuple]:
+        """
+        Convierte la matriz al formato de RegexModel.validate_strings.
+
+        Args:
+            strings (Sequence[str]): Las cadenas validadas, en el mismo orden
+
+        Returns:
+            List[tuple]: Lista de resultados (cadena, es_válida), agrupados por patrón
+        """
+        results = []
+        for pattern in range(self.pattern_count):
+            results.extend(zip(strings, self.pattern_row(pattern)))
+        return results
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializa los bits de la matriz, fila por fila.
+
+        Returns:
+            bytes: pattern_count filas de ceil(string_count / 8) bytes
+        """
+        self._require_bits()
+        return bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, pattern_count: int, string_count: int) -> 'ValidationMatrix':
+        """
+        Reconstruye una matriz serializada con to_bytes.
+
+        Args:
+            data (bytes): Bits de la matriz
+            pattern_count (int): Número de patrones
+            string_count (int): Número de cadenas
+
+        Returns:
+            ValidationMatrix: La matriz reconstruida
+
+        Raises:
+            ValueError: Si el tamaño de los datos no corresponde a las dimensiones
+        """
+        matrix = cls(pattern_count, string_count)
+        if len(data) != len(matrix._bits):
+            raise ValueError("El tamaño de los datos no corresponde a las dimensiones")
+        matrix._bits[:] = data
+        for pattern in range(pattern_count):
+            matrix.counts[pattern] = bin(matrix._row_value(pattern)).count('1')
+        return matrix
+
+    def to_numpy(self):
+        """
+        Convierte la matriz en un arreglo booleano de NumPy (patrones × cadenas).
+
+        Returns:
+            numpy.ndarray: La matriz desempaquetada
+
+        Raises:
+            RuntimeError: Si NumPy no está instalado
+        """
+        self._require_bits()
+        try:
+            import numpy as np
+        except ImportError:
+            raise RuntimeError("to_numpy necesita NumPy") from None
+        packed = np.frombuffer(bytes(self._bits), dtype=np.uint8)
+        packed = packed.reshape(self.pattern_count, self._row_bytes)
+        bits = np.unpackbits(packed, axis=1, bitorder='little')
+        return bits[:, :self.string_count].astype(bool)
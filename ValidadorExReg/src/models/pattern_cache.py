@@ -0,0 +1,93 @@
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Pattern
+from src.utils.metricas import metricas
+
+class PatternCache:
+    """
+    Caché LRU acotada de expresiones regulares compiladas.
+
+    Las entradas se indexan por el par (patrón, flags), de modo que un mismo
+    patrón compilado con flags distintos ocupa entradas diferentes.
+
+    Attributes:
+        maxsize (int): Número máximo de patrones compilados que se conservan.
+        hits (int): Número de consultas resueltas desde la caché.
+        misses (int): Número de consultas que tuvieron que compilar el patrón.
+        evictions (int): Número de entradas descartadas por la política LRU.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Inicializa una caché vacía.
+
+        Args:
+            maxsize (int): Número máximo de patrones compilados a conservar.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize debe ser mayor o igual a 1")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, pattern: str, flags: int = 0) -> Pattern:
+        """
+        Obtiene el patrón compilado, compilándolo solo si no está en caché.
+
+        Args:
+            pattern (str): El patrón de expresión regular
+            flags (int): Flags de compilación del módulo re
+
+        Returns:
+            Pattern: El patrón compilado
+
+        Raises:
+            re.error: Si el patrón no es válido
+        """
+        key = (pattern, flags)
+        regex = self._entries.get(key)
+        if regex is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return regex
+
+        self.misses += 1
+        if metricas.activo:
+            inicio = time.perf_counter()
+            regex = re.compile(pattern, flags)
+            metricas.observar('patrones.compilacion', time.perf_counter() - inicio, etiqueta=pattern)
+        else:
+            regex = re.compile(pattern, flags)
+        self._entries[key] = regex
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return regex
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Vacía la caché sin reiniciar los contadores."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Devuelve una instantánea de los contadores de la caché.
+
+        Returns:
+            Dict[str, int]: Tamaño actual, capacidad, aciertos, fallos y desalojos
+        """
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
@@ -1,29 +1,128 @@
+import mmap
+import os
 import re
-from typing import List
+import time
+from typing import (Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional,
+                    Pattern, Tuple)
+from src.models.literal_prefilter import required_literals
+from src.models.match_results import MatchResults, ValidationMatrix
+from src.models.pattern_cache import PatternCache
+from src.models.regex_set import RegexSet
+from src.utils.metricas import metricas
+
+# Modos de scan_file: validación anclada por línea o búsqueda sin anclar.
+SCAN_MODES = ('match', 'search')
+
+# Modos de match_strings, con el nombre del método de Pattern correspondiente.
+MATCH_MODES = ('fullmatch', 'match', 'search', 'finditer')
+
+class FileMatch(NamedTuple):
+    """Resultado de RegexModel.scan_file."""
+    pattern: int
+    """Índice del patrón."""
+    line: int
+    """Número de línea, empezando en 1."""
+    offset: int
+    """Desplazamiento en bytes del inicio de la línea."""
+    span: Optional[Tuple[int, int]]
+    """Desplazamientos en bytes de la coincidencia en el archivo, o None si no hay."""
+
+class PatternSnapshot(NamedTuple):
+    """
+    Copia inmutable del conjunto de patrones, para validar desde otro hilo.
+
+    Se obtiene con RegexModel.snapshot en el hilo que modifica el modelo; la
+    validación con la copia no vuelve a tocar el modelo ni su caché, así que el
+    modelo puede cambiar mientras tanto sin carreras.
+    """
+    version: int
+    """Versión del modelo al tomar la copia."""
+    patterns: Tuple[Tuple[str, int], ...]
+    """Pares (patrón, flags), en orden de inserción."""
+    regex_set: Optional[RegexSet]
+    """Matcher combinado ya compilado, o None si no hay patrones."""
 
 class RegexModel:
-    """Modelo para manejar la lógica de las expresiones regulares."""
+    """
+    Modelo para manejar la lógica de las expresiones regulares.
+
+    El atributo version se incrementa cada vez que cambia el conjunto de
+    patrones, de modo que los resultados guardados con otra versión se
+    reconocen como obsoletos.
+
+    Con prefilter activo, antes de ejecutar un patrón sobre una cadena se
+    comprueba con el operador in que la cadena contiene el literal requerido
+    más largo del patrón (ver required_literals); las cadenas que no lo
+    contienen se descartan sin invocar al motor de re. El prefiltro se aplica
+    en validate_strings, iter_validate_strings, validate_matrix, match_strings
+    y validate_strings_set cuando recorre los patrones uno a uno;
+    validate_strings_guarded (procesos aparte) no lo usa.
+    """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 512, prefilter: bool = True):
+        self.version = 0
+        self.prefilter = prefilter
         self.patterns = []
+        self.flags = []
+        self._pattern_keys = set()
+        self._cache = PatternCache(cache_size)
+        self._regex_set = None
+        self._guarded_pool = None
 
-    def set_regex(self, pattern: str) -> bool:
+    def set_regex(self, pattern: str, flags: int = 0) -> bool:
         """
         Establece un nuevo patrón de expresión regular.
 
+        El patrón compilado queda en la caché del modelo y los patrones
+        repetidos (mismo texto y mismos flags) no se vuelven a almacenar.
+
         Args:
             pattern (str): El patrón de expresión regular
+            flags (int): Flags de compilación del módulo re
 
         Returns:
             bool: True si el patrón es válido, False en caso contrario
         """
         try:
-            re.compile(pattern)
-            self.patterns.append(pattern)
-            return True
-        except re.error:
+            self._cache.get(pattern, flags)
+        except (re.error, ValueError):
+            # ValueError: combinación de flags no válida, como re.LOCALE con un patrón str.
             return False
 
+        key = (pattern, flags)
+        if key not in self._pattern_keys:
+            self._pattern_keys.add(key)
+            self.patterns.append(pattern)
+            self.flags.append(flags)
+            self._regex_set = None
+            self.version += 1
+        return True
+
+    def _compiled_patterns(self) -> List[Pattern]:
+        """
+        Obtiene los patrones almacenados ya compilados, en orden de inserción.
+
+        Returns:
+            List[Pattern]: Patrones compilados servidos desde la caché
+        """
+        return [self._cache.get(p, f) for p, f in zip(self.patterns, self.flags)]
+
+    def _required_literals(self) -> List[str]:
+        """
+        Obtiene el literal usado como prefiltro de cada patrón, en orden de inserción.
+
+        Returns:
+            List[str]: El factor requerido más largo de cada patrón, o '' (que
+                está en toda cadena) si no tiene ninguno o el prefiltro está desactivado
+        """
+        if not self.prefilter:
+            return [''] * len(self.patterns)
+        literals = []
+        for pattern, flags in zip(self.patterns, self.flags):
+            factors = required_literals(pattern, flags)
+            literals.append(factors[0] if factors else '')
+        return literals
+
     def validate_strings(self, strings: List[str]) -> List[tuple]:
         """
         Valida una lista de cadenas contra el patrón actual.
@@ -38,9 +137,301 @@ class RegexModel:
             return [(s, False) for s in strings]
 
         results = []
-        for pattern in self.patterns:
-            regex = re.compile(pattern)
-            results.extend([(s, bool(regex.match(s))) for s in strings])
+        if metricas.activo and strings:
+            # Duración media por cadena de cada patrón, ponderada por el tamaño del lote.
+            for pattern, regex, literal in zip(self.patterns, self._compiled_patterns(),
+                                               self._required_literals()):
+                match = regex.match
+                inicio = time.perf_counter()
+                results.extend([(s, literal in s and match(s) is not None) for s in strings])
+                metricas.observar('modelo.coincidencia',
+                                  (time.perf_counter() - inicio) / len(strings),
+                                  etiqueta=pattern, veces=len(strings))
+            return results
+
+        for regex, literal in zip(self._compiled_patterns(), self._required_literals()):
+            match = regex.match
+            results.extend([(s, literal in s and match(s) is not None) for s in strings])
+        return results
+
+    def iter_validate_strings(self, strings: Iterable[str]) -> Iterator[Tuple[str, int, bool]]:
+        """
+        Valida de forma perezosa un flujo de cadenas contra todos los patrones.
+
+        Cada cadena se consume, se valida y se descarta antes de leer la
+        siguiente, así que la memoria no depende del tamaño de la entrada.
+
+        Args:
+            strings (Iterable[str]): Cadenas a validar, por ejemplo las líneas de un archivo
+
+        Yields:
+            Tuple[str, int, bool]: (cadena, índice del patrón, es_válida)
+        """
+        regexes = list(zip(self._compiled_patterns(), self._required_literals()))
+        for s in strings:
+            if not regexes:
+                yield s, -1, False
+                continue
+            for index, (regex, literal) in enumerate(regexes):
+                yield s, index, literal in s and regex.match(s) is not None
+
+    def validate_matrix(self, strings: List[str], aggregate_only: bool = False) -> ValidationMatrix:
+        """
+        Valida una lista de cadenas y guarda los resultados en una matriz de bits.
+
+        Usa match, como validate_strings, pero en lugar de una tupla
+        (cadena, es_válida) por par (patrón, cadena) guarda un bit por par,
+        con las filas indexadas por patrón.
+
+        Args:
+            strings (List[str]): Lista de cadenas a validar
+            aggregate_only (bool): Si es True, solo se cuentan las cadenas válidas
+                de cada patrón
+
+        Returns:
+            ValidationMatrix: Matriz patrones × cadenas con las cuentas por patrón
+        """
+        regexes = self._compiled_patterns()
+        matrix = ValidationMatrix(len(regexes), len(strings), aggregate_only)
+        for index, (regex, literal) in enumerate(zip(regexes, self._required_literals())):
+            match = regex.match
+            if aggregate_only:
+                matrix.counts[index] = sum(1 for s in strings if literal in s and match(s))
+            else:
+                matrix.set_row(index, bytes([literal in s and match(s) is not None
+                                             for s in strings]))
+        return matrix
+
+    def match_strings(self, strings: List[str], mode: str = 'fullmatch') -> MatchResults:
+        """
+        Evalúa una lista de cadenas contra todos los patrones con el modo indicado.
+
+        A diferencia de validate_strings, que usa siempre match (la cadena debe
+        empezar con una coincidencia, pero no tiene que acabar en ella), el
+        llamador elige el método: 'fullmatch' exige que el patrón cubra la
+        cadena completa, 'match' la ancla solo al inicio, 'search' busca la
+        primera coincidencia en cualquier posición y 'finditer' informa todas
+        las coincidencias sin solapamiento.
+
+        Args:
+            strings (List[str]): Lista de cadenas a evaluar
+            mode (str): 'fullmatch', 'match', 'search' o 'finditer'
+
+        Returns:
+            MatchResults: Coincidencias en formato columnar, agrupadas por patrón
+
+        Raises:
+            ValueError: Si el modo no es válido
+        """
+        if mode not in MATCH_MODES:
+            raise ValueError(f"Modo no soportado: {mode}")
+        regexes = self._compiled_patterns()
+        results = MatchResults(strings, len(regexes), mode)
+        add_string = results.string_index.append
+        add_pattern = results.pattern_index.append
+        add_start = results.start.append
+        add_end = results.end.append
+
+        for index, (regex, literal) in enumerate(zip(regexes, self._required_literals())):
+            method = getattr(regex, mode)
+            if mode == 'finditer':
+                for position, s in enumerate(strings):
+                    if literal not in s:
+                        continue
+                    for match in method(s):
+                        add_string(position)
+                        add_pattern(index)
+                        add_start(match.start())
+                        add_end(match.end())
+            else:
+                for position, s in enumerate(strings):
+                    if literal not in s:
+                        continue
+                    match = method(s)
+                    if match is not None:
+                        add_string(position)
+                        add_pattern(index)
+                        add_start(match.start())
+                        add_end(match.end())
+        return results
+
+    def _compiled_byte_patterns(self) -> List[Pattern]:
+        """
+        Obtiene los patrones almacenados compilados para bytes, en orden de inserción.
+
+        Los patrones se codifican en UTF-8 y se compilan con re.MULTILINE, de
+        modo que ^ y $ funcionan en cada línea del archivo. Como en todo patrón
+        de bytes, las clases como \\d o \\w solo reconocen caracteres ASCII.
+
+        Returns:
+            List[Pattern]: Patrones de bytes compilados servidos desde la caché
+
+        Raises:
+            re.error: Si algún patrón no es válido como patrón de bytes
+        """
+        return [self._cache.get(p.encode('utf-8'), (f & ~re.UNICODE) | re.MULTILINE)
+                for p, f in zip(self.patterns, self.flags)]
+
+    def scan_file(self, path: str, mode: str = 'match') -> Iterator[FileMatch]:
+        """
+        Recorre un archivo proyectado en memoria con los patrones compilados para bytes.
+
+        Los patrones se ejecutan directamente sobre el mmap, sin decodificar el
+        archivo ni dividirlo en cadenas, así que la memoria usada no depende de
+        su tamaño.
+
+        En ambos modos el archivo se recorre por líneas, sin el salto de línea
+        ni un '\\r' final, así que $ se comporta igual con finales \\n y \\r\\n
+        y ninguna coincidencia abarca varias líneas. En modo 'match' cada línea
+        se valida con match, como en validate_strings, y se produce un
+        resultado por línea y patrón, con span None si la línea no es válida.
+        En modo 'search' cada patrón busca todas sus coincidencias en cada
+        línea y solo se producen las coincidencias, agrupadas por patrón.
+
+        Args:
+            path (str): Ruta del archivo
+            mode (str): 'match' o 'search'
+
+        Yields:
+            FileMatch: (índice del patrón, número de línea, desplazamiento de la línea, span)
+
+        Raises:
+            ValueError: Si el modo no es válido
+            re.error: Si algún patrón no es válido como patrón de bytes
+        """
+        if mode not in SCAN_MODES:
+            raise ValueError(f"Modo no soportado: {mode}")
+        regexes = self._compiled_byte_patterns()
+        if not regexes:
+            return
+
+        scan = self._scan_lines if mode == 'match' else self._scan_search
+        with open(path, 'rb') as handle:
+            # mmap no admite archivos vacíos.
+            if os.fstat(handle.fileno()).st_size == 0:
+                yield from scan(b'', regexes)
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield from scan(buffer, regexes)
+
+    @staticmethod
+    def _line_bounds(buffer: bytes) -> Iterator[Tuple[int, int, int]]:
+        """Recorre las líneas del buffer como (número, inicio, fin sin '\\n' ni '\\r' final)."""
+        find = buffer.find
+        size = len(buffer)
+        line = 0
+        start = 0
+        while start < size:
+            end = find(b'\n', start)
+            next_start = end + 1 if end >= 0 else size
+            if end < 0:
+                end = size
+            if end > start and buffer[end - 1] == 13:
+                end -= 1
+            line += 1
+            yield line, start, end
+            start = next_start
+
+    @classmethod
+    def _scan_lines(cls, buffer: bytes, regexes: List[Pattern]) -> Iterator[FileMatch]:
+        """Valida cada línea del buffer con pos/endpos, sin copiarla."""
+        matchers = [regex.match for regex in regexes]
+        for line, start, end in cls._line_bounds(buffer):
+            for index, matcher in enumerate(matchers):
+                match = matcher(buffer, start, end)
+                yield FileMatch(index, line, start, match.span() if match else None)
+
+    @classmethod
+    def _scan_search(cls, buffer: bytes, regexes: List[Pattern]) -> Iterator[FileMatch]:
+        """Busca las coincidencias de cada patrón en cada línea del buffer, sin copiarla."""
+        for index, regex in enumerate(regexes):
+            finditer = regex.finditer
+            for line, start, end in cls._line_bounds(buffer):
+                for match in finditer(buffer, start, end):
+                    yield FileMatch(index, line, start, match.span())
+
+    def snapshot(self) -> PatternSnapshot:
+        """
+        Toma una copia inmutable de los patrones actuales con su matcher combinado.
+
+        Returns:
+            PatternSnapshot: La copia, válida aunque el modelo cambie después
+        """
+        regex_set = None
+        if self.patterns:
+            if self._regex_set is None:
+                self._regex_set = RegexSet(self.patterns, self.flags, self._cache.get,
+                                           self._required_literals())
+            regex_set = self._regex_set
+        return PatternSnapshot(self.version, tuple(zip(self.patterns, self.flags)), regex_set)
+
+    def validate_strings_set(self, strings: List[str],
+                             snapshot: Optional[PatternSnapshot] = None
+                             ) -> List[Tuple[str, FrozenSet[int]]]:
+        """
+        Valida cada cadena contra todos los patrones a la vez.
+
+        Los resultados se obtienen con RegexSet.matches_many, que usa el matcher
+        combinado o recorre los patrones uno a uno con el prefiltro, según cuál
+        haya resultado más rápido con este conjunto de patrones.
+
+        Args:
+            strings (List[str]): Lista de cadenas a validar
+            snapshot (PatternSnapshot, optional): Patrones a usar en lugar de los
+                actuales; con una copia, el modelo no se consulta
+
+        Returns:
+            List[Tuple[str, FrozenSet[int]]]: Lista de resultados
+                (cadena, índices de los patrones que la aceptan)
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        if snapshot.regex_set is None:
+            return [(s, frozenset()) for s in strings]
+
+        matches_many = snapshot.regex_set.matches_many
+        if metricas.activo and strings:
+            inicio = time.perf_counter()
+            results = list(zip(strings, matches_many(strings)))
+            metricas.observar('modelo.coincidencia_conjunto',
+                              (time.perf_counter() - inicio) / len(strings),
+                              veces=len(strings))
+            return results
+        return list(zip(strings, matches_many(strings)))
+
+    def validate_strings_guarded(self, strings: List[str],
+                                 pattern_timeout: Optional[float] = None,
+                                 string_timeout: float = 1.0) -> List[tuple]:
+        """
+        Valida una lista de cadenas en procesos aparte, con presupuesto de tiempo.
+
+        Un patrón patológico, como (a+)+$, no bloquea al llamador: las cadenas
+        que agotan su presupuesto se informan con el resultado TIMEOUT.
+
+        Args:
+            strings (List[str]): Lista de cadenas a validar
+            pattern_timeout (float, optional): Segundos disponibles para cada patrón
+            string_timeout (float): Segundos disponibles para cada cadena
+
+        Returns:
+            List[tuple]: Lista de resultados (cadena, True | False | TIMEOUT)
+        """
+        if not self.patterns:
+            return [(s, False) for s in strings]
+
+        if self._guarded_pool is None:
+            # Importación diferida: multiprocessing solo se carga en este modo.
+            from src.models.guarded_pool import GuardedPool
+            self._guarded_pool = GuardedPool()
+        outcomes = self._guarded_pool.validate(
+            list(zip(self.patterns, self.flags)),
+            strings,
+            pattern_timeout=pattern_timeout,
+            string_timeout=string_timeout
+        )
+        results = []
+        for row in outcomes:
+            results.extend(zip(strings, row))
         return results
 
     def explain_regex(self) -> str:
@@ -87,5 +478,23 @@ class RegexModel:
         return ' '.join(explanation)
 
     def clear_patterns(self):
-        """Limpia todos los patrones de expresión regular almacenados."""
-        self.patterns = []
\ No newline at end of file
+        """
+        Limpia todos los patrones de expresión regular almacenados.
+
+        La caché de patrones compilados se conserva, de modo que volver a
+        establecer un patrón ya usado no requiere recompilarlo.
+        """
+        self.patterns = []
+        self.flags = []
+        self._pattern_keys = set()
+        self._regex_set = None
+        self.version += 1
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores de la caché de patrones compilados.
+
+        Returns:
+            Dict[str, int]: Tamaño, capacidad, aciertos, fallos y desalojos
+        """
+        return self._cache.stats()
\ No newline at end of file
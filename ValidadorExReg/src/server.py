@@ -0,0 +1,483 @@
+"""
+Servicio local de validación sobre HTTP/JSON.
+
+Un único RegexController, con sus patrones ya compilados, atiende a todos los
+clientes locales, que así no pagan cada uno el arranque ni la compilación.
+Las peticiones concurrentes con el mismo conjunto de patrones se agrupan en un
+solo lote, los lotes se validan en un hilo aparte para no bloquear el bucle de
+eventos y el número de cadenas pendientes está acotado.
+
+Uso, desde la carpeta ValidadorExReg:
+
+    python -m src.server --port 8765
+    python -m src.server --unix /tmp/validador.sock
+
+Peticiones:
+
+    POST /validate  {"patterns": ["[a-z]+\\d"], "strings": ["abc1", "x"],
+                     "mode": "match", "flags": 0}
+                 -> {"patterns": [...], "mode": "match", "results": [[true, false]]}
+    GET /health     Estado del servicio y contadores de peticiones y lotes
+    GET /metrics    RegexController.get_metrics()
+"""
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+import traceback
+from typing import Dict, List, Optional, Tuple
+from src.models.regex_model import RegexModel
+from src.controllers.regex_controller import RegexController
+from src.utils.metricas import metricas
+
+# Modos de coincidencia aceptados por /validate (ver RegexModel.match_strings).
+SERVER_MODES = ('fullmatch', 'match', 'search')
+
+# Flags de compilación aceptados por /validate. El resto (re.LOCALE, re.DEBUG o
+# bits desconocidos) fallan al compilar o escriben en la salida del proceso.
+ALLOWED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE | re.ASCII
+
+REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+class HttpError(Exception):
+    """Error que se devuelve al cliente con un código de estado HTTP."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class _Batch:
+    """Peticiones con el mismo conjunto de patrones que se validan juntas."""
+
+    __slots__ = ('key', 'strings', 'requests', 'timer')
+
+    def __init__(self, key: tuple):
+        self.key = key
+        self.strings = []
+        # (posición de la primera cadena, número de cadenas, futuro) de cada petición.
+        self.requests = []
+        self.timer = None
+
+class ValidationServer:
+    """
+    Servidor asyncio que comparte un RegexController entre clientes locales.
+
+    Las peticiones con la misma clave (patrones, flags y modo) que llegan
+    dentro de la ventana de agrupación se concatenan en un lote; el lote se
+    valida en un único hilo de trabajo, que cambia los patrones del modelo
+    solo cuando cambia la clave y los obtiene ya compilados de su caché. Si las
+    cadenas pendientes superan max_pending_strings, las peticiones nuevas se
+    rechazan con 503 en lugar de acumularse en memoria.
+
+    Attributes:
+        controller (RegexController): El controlador compartido.
+        coalesce_ms (float): Ventana de agrupación de peticiones, en milisegundos.
+        max_batch_strings (int): Número máximo de cadenas de un lote.
+        max_pending_strings (int): Número máximo de cadenas pendientes.
+        max_body_bytes (int): Tamaño máximo del cuerpo de una petición.
+        stats (dict): Contadores de peticiones, lotes y rechazos.
+    """
+
+    def __init__(self, controller: Optional[RegexController] = None,
+                 coalesce_ms: float = 2.0, max_batch_strings: int = 100000,
+                 max_pending_strings: int = 1000000, max_body_bytes: int = 16 * 1024 * 1024):
+        """
+        Inicializa el servidor.
+
+        Args:
+            controller (RegexController, optional): Controlador compartido; por
+                defecto uno nuevo sobre un RegexModel vacío
+            coalesce_ms (float): Ventana de agrupación de peticiones, en milisegundos
+            max_batch_strings (int): Número máximo de cadenas de un lote
+            max_pending_strings (int): Número máximo de cadenas pendientes
+            max_body_bytes (int): Tamaño máximo del cuerpo de una petición
+        """
+        self.controller = controller or RegexController(RegexModel())
+        self.coalesce_ms = coalesce_ms
+        self.max_batch_strings = max_batch_strings
+        self.max_pending_strings = max_pending_strings
+        self.max_body_bytes = max_body_bytes
+        self.stats = {'requests': 0, 'batches': 0, 'coalesced': 0, 'rejected': 0}
+        self._open = {}
+        self._pending_strings = 0
+        self._active_key = None
+        self._executor = None
+        self._server = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765,
+                    path: Optional[str] = None):
+        """
+        Empieza a escuchar conexiones.
+
+        Args:
+            host (str): Dirección TCP
+            port (int): Puerto TCP; 0 elige uno libre
+            path (str, optional): Ruta de un socket Unix; si se indica, se usa en lugar de TCP
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+
+    @property
+    def address(self):
+        """La dirección en la que escucha el servidor: (host, puerto) o la ruta del socket."""
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        """Atiende conexiones hasta que se cancela."""
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Deja de aceptar conexiones y detiene el hilo de trabajo."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def validate(self, patterns: List[str], strings: List[str],
+                       mode: str = 'match', flags: int = 0) -> List[List[bool]]:
+        """
+        Valida cadenas agrupándolas con otras peticiones del mismo conjunto de patrones.
+
+        Args:
+            patterns (List[str]): Patrones, sin repetidos
+            strings (List[str]): Cadenas a validar, tal como se reciben
+            mode (str): 'fullmatch', 'match' o 'search'
+            flags (int): Flags de compilación de todos los patrones
+
+        Returns:
+            List[List[bool]]: Para cada patrón, el resultado de cada cadena
+
+        Raises:
+            HttpError: 503 si se supera el límite de cadenas pendientes, 400 si
+                algún patrón no es válido
+        """
+        if self._pending_strings + len(strings) > self.max_pending_strings:
+            self.stats['rejected'] += 1
+            if metricas.activo:
+                metricas.incrementar('servidor.rechazadas')
+            raise HttpError(503, 'demasiadas cadenas pendientes')
+
+        loop = asyncio.get_running_loop()
+        key = (tuple(patterns), flags, mode)
+        batch = self._open.get(key)
+        if batch is not None and len(batch.strings) + len(strings) > self.max_batch_strings:
+            self._dispatch(batch)
+            batch = None
+        if batch is None:
+            batch = self._open[key] = _Batch(key)
+            batch.timer = loop.call_later(self.coalesce_ms / 1000, self._dispatch, batch)
+        else:
+            self.stats['coalesced'] += 1
+
+        future = loop.create_future()
+        batch.requests.append((len(batch.strings), len(strings), future))
+        batch.strings.extend(strings)
+        self._pending_strings += len(strings)
+        if len(batch.strings) >= self.max_batch_strings:
+            self._dispatch(batch)
+        return await future
+
+    def _dispatch(self, batch: _Batch):
+        """Envía un lote al hilo de trabajo; no admite más peticiones."""
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        if self._open.get(batch.key) is not batch:
+            return
+        del self._open[batch.key]
+        self.stats['batches'] += 1
+
+        if self._executor is None:
+            # Importación diferida, como en BackgroundRunner: un solo hilo
+            # comparte el modelo, así que no hace falta sincronizarlo.
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix='validacion')
+        loop = asyncio.get_running_loop()
+        work = loop.run_in_executor(self._executor, self._run_batch, batch.key, batch.strings)
+        work.add_done_callback(lambda done: self._deliver(batch, done))
+
+    def _run_batch(self, key: tuple, strings: List[str]) -> List[bytearray]:
+        """
+        Valida un lote en el hilo de trabajo.
+
+        Args:
+            key (tuple): (patrones, flags, modo)
+            strings (List[str]): Cadenas de todas las peticiones del lote
+
+        Returns:
+            List[bytearray]: Un byte (0/1) por cadena para cada patrón
+
+        Raises:
+            HttpError: 400 si algún patrón no es válido
+        """
+        inicio = time.perf_counter() if metricas.activo else 0.0
+        patterns, flags, mode = key
+        if self._active_key != (patterns, flags):
+            # Los patrones ya usados se sirven compilados desde la caché del modelo.
+            self._active_key = None
+            self.controller.model.clear_patterns()
+            for pattern in patterns:
+                if not self.controller.set_regex_pattern(pattern, flags):
+                    self.controller.model.clear_patterns()
+                    raise HttpError(400, f'la expresión regular no es válida: {pattern}')
+            self._active_key = (patterns, flags)
+
+        results = self.controller.model.match_strings(strings, mode)
+        columns = [results.matched(index) for index in range(len(patterns))]
+        if metricas.activo:
+            metricas.observar('servidor.lote', time.perf_counter() - inicio)
+            metricas.incrementar('controlador.cadenas', len(strings))
+        return columns
+
+    def _deliver(self, batch: _Batch, done: asyncio.Future):
+        """Reparte el resultado de un lote entre sus peticiones."""
+        self._pending_strings -= len(batch.strings)
+        error = None if done.cancelled() else done.exception()
+        for start, count, future in batch.requests:
+            if future.done():
+                continue
+            if done.cancelled():
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result([list(map(bool, column[start:start + count]))
+                                   for column in done.result()])
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Atiende las peticiones de una conexión, con keep-alive de HTTP/1.1."""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HttpError as error:
+                    self._write_response(writer, error.status, {'error': error.message}, False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                status, payload = await self._route(method, target, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader
+                            ) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        """
+        Lee una petición HTTP.
+
+        Returns:
+            tuple: (método, ruta, cabeceras, cuerpo), o None si el cliente cerró la conexión
+
+        Raises:
+            HttpError: Si la petición está mal formada o el cuerpo es demasiado grande
+        """
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise HttpError(400, 'línea de petición no válida')
+        method, target, _ = parts
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+            if len(headers) > 100:
+                raise HttpError(400, 'demasiadas cabeceras')
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HttpError(400, 'Content-Length no válido') from None
+        if length < 0:
+            raise HttpError(400, 'Content-Length no válido')
+        if length > self.max_body_bytes:
+            raise HttpError(413, 'el cuerpo de la petición es demasiado grande')
+        body = await reader.readexactly(length) if length else b''
+        return method, target, headers, body
+
+    async def _route(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        """
+        Resuelve una petición y devuelve el código de estado y el cuerpo JSON.
+
+        Un error inesperado se responde con 500 en lugar de cerrar la conexión
+        sin respuesta; la traza se escribe en stderr.
+        """
+        try:
+            return await self._route_request(method, target, body)
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            return 500, {'error': 'error interno del servidor'}
+
+    async def _route_request(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        """Resuelve una petición según su ruta y su método."""
+        self.stats['requests'] += 1
+        if metricas.activo:
+            metricas.incrementar('servidor.peticiones')
+        path = target.split('?', 1)[0]
+        routes = {'/validate': 'POST', '/health': 'GET', '/metrics': 'GET'}
+        if path not in routes:
+            return 404, {'error': f'ruta desconocida: {path}'}
+        if method != routes[path]:
+            return 405, {'error': f'método no permitido: {method}'}
+
+        if path == '/health':
+            return 200, {'status': 'ok', 'pending_strings': self._pending_strings,
+                         **self.stats}
+        if path == '/metrics':
+            return 200, self.controller.get_metrics()
+
+        try:
+            patterns, strings, mode, flags = self._parse_validate(body)
+            results = await self.validate(patterns, strings, mode, flags)
+        except HttpError as error:
+            return error.status, {'error': error.message}
+        return 200, {'patterns': patterns, 'mode': mode, 'results': results}
+
+    @staticmethod
+    def _parse_validate(body: bytes) -> Tuple[List[str], List[str], str, int]:
+        """
+        Valida el cuerpo de una petición /validate.
+
+        Returns:
+            tuple: (patrones sin repetidos, cadenas, modo, flags)
+
+        Raises:
+            HttpError: 400 si el cuerpo no es válido
+        """
+        try:
+            data = json.loads(body)
+        except ValueError:
+            raise HttpError(400, 'el cuerpo no es JSON válido') from None
+        if not isinstance(data, dict):
+            raise HttpError(400, 'se esperaba un objeto JSON')
+
+        patterns = data.get('patterns')
+        strings = data.get('strings')
+        mode = data.get('mode', 'match')
+        flags = data.get('flags', 0)
+        if (not isinstance(patterns, list) or not patterns
+                or not all(isinstance(p, str) for p in patterns)):
+            raise HttpError(400, "'patterns' debe ser una lista no vacía de cadenas")
+        if not isinstance(strings, list) or not all(isinstance(s, str) for s in strings):
+            raise HttpError(400, "'strings' debe ser una lista de cadenas")
+        if mode not in SERVER_MODES:
+            raise HttpError(400, f"'mode' debe ser uno de {', '.join(SERVER_MODES)}")
+        if not isinstance(flags, int) or isinstance(flags, bool):
+            raise HttpError(400, "'flags' debe ser un entero")
+        if flags & ~ALLOWED_FLAGS:
+            raise HttpError(400, "'flags' solo admite re.IGNORECASE, re.MULTILINE, "
+                                 "re.DOTALL, re.VERBOSE y re.ASCII")
+        return list(dict.fromkeys(patterns)), strings, mode, flags
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: dict,
+                        keep_alive: bool):
+        """Escribe una respuesta JSON."""
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        headers = [
+            f'HTTP/1.1 {status} {REASONS[status]}',
+            'Content-Type: application/json; charset=utf-8',
+            f'Content-Length: {len(body)}',
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == 503:
+            headers.append('Retry-After: 1')
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1') + body)
+
+def build_parser():
+    """
+    Construye el analizador de argumentos del servicio.
+
+    Returns:
+        argparse.ArgumentParser: El analizador configurado.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.server',
+        description='Servicio local de validación de expresiones regulares sobre HTTP/JSON.'
+    )
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='dirección en la que escuchar (por defecto: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='puerto en el que escuchar (por defecto: 8765)')
+    parser.add_argument('--unix', metavar='RUTA',
+                        help='escuchar en un socket Unix en lugar de TCP')
+    parser.add_argument('--coalesce-ms', type=float, default=2.0,
+                        help='ventana de agrupación de peticiones (por defecto: 2 ms)')
+    parser.add_argument('--max-batch', type=int, default=100000,
+                        help='número máximo de cadenas por lote')
+    parser.add_argument('--max-pending', type=int, default=1000000,
+                        help='número máximo de cadenas pendientes antes de responder 503')
+    parser.add_argument('--metrics', action='store_true',
+                        help='activar las métricas expuestas en /metrics')
+    return parser
+
+async def serve(args):
+    """
+    Arranca el servicio con los argumentos de la línea de comandos y lo mantiene en marcha.
+
+    Args:
+        args (argparse.Namespace): Argumentos de build_parser.
+    """
+    server = ValidationServer(coalesce_ms=args.coalesce_ms,
+                              max_batch_strings=args.max_batch,
+                              max_pending_strings=args.max_pending)
+    if args.metrics:
+        server.controller.enable_metrics()
+    await server.start(args.host, args.port, args.unix)
+    address = args.unix or 'http://{}:{}'.format(*server.address[:2])
+    print(f"Escuchando en {address}", file=sys.stderr)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv=None):
+    """
+    Punto de entrada del servicio.
+
+    Args:
+        argv (list, optional): Argumentos; por defecto los de sys.argv.
+
+    Returns:
+        int: Código de salida del proceso.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
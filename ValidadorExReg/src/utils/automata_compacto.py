@@ -0,0 +1,338 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+
+# Cabecera del formato binario de AutomataCompacto (ver a_bytes).
+_MAGIA = b'RXAC'
+_VERSION_FORMATO = 1
+_CABECERA = struct.Struct('<4sBIiII')
+
+class AutomataCompacto:
+    """
+    Autómata finito con estados enteros y almacenamiento en arreglos.
+
+    Las transiciones se acumulan como tres arreglos paralelos (origen, símbolo,
+    destino) y, al consultarlas, se compactan en formato CSR: las aristas se
+    ordenan por (origen, símbolo) y un único arreglo de offsets por estado
+    delimita la fila de cada estado, de modo que la memoria es
+    O(estados + transiciones) sea cual sea el tamaño del alfabeto. Dentro de
+    una fila, los destinos de un símbolo forman un tramo contiguo que se
+    localiza por bisección. Los estados finales se guardan en un entero usado
+    como bitset.
+
+    Las propiedades estados y estado_inicial ofrecen la misma vista que
+    Automata (identificadores 'qN', objetos con transiciones y es_final), de
+    modo que visualizar_automata y el resto de consumidores siguen funcionando.
+
+    Attributes:
+        num_estados (int): Número de estados creados.
+        inicial (int): Estado inicial, o -1 si aún no se ha definido.
+        simbolos (list): Símbolos usados en las transiciones, ordenados por su índice.
+        finales (int): Bitset con un 1 en la posición de cada estado final.
+    """
+    __slots__ = ('num_estados', 'inicial', 'simbolos', 'finales',
+                 '_indice_simbolo', '_origenes', '_simbolos', '_destinos',
+                 '_filas', '_fila_simbolos', '_fila_destinos')
+
+    def __init__(self):
+        """
+        Inicializa un autómata vacío.
+        """
+        self.num_estados = 0
+        self.inicial = -1
+        self.simbolos = []
+        self.finales = 0
+        self._indice_simbolo = {}
+        self._origenes = array('i')
+        self._simbolos = array('i')
+        self._destinos = array('i')
+        self._filas = None
+        self._fila_simbolos = None
+        self._fila_destinos = None
+
+    @classmethod
+    def desde_automata(cls, automata):
+        """
+        Obtiene la representación compacta de un autómata.
+
+        Args:
+            automata (Automata | AutomataCompacto): El autómata a convertir.
+
+        Returns:
+            AutomataCompacto: El mismo objeto si ya es compacto, o una copia compacta.
+        """
+        if isinstance(automata, cls):
+            return automata
+
+        compacto = cls()
+        posicion = {estado_id: compacto.crear_estado() for estado_id in automata.estados}
+        for estado_id, estado in automata.estados.items():
+            origen = posicion[estado_id]
+            if estado.es_final:
+                compacto.marcar_final(origen)
+            for simbolo, destinos in estado.transiciones.items():
+                for destino in destinos:
+                    compacto.agregar_transicion(origen, simbolo, posicion[destino])
+        compacto.inicial = posicion[automata.estado_inicial]
+        return compacto
+
+    def a_bytes(self):
+        """
+        Serializa el autómata en un formato binario compacto.
+
+        El formato es una cabecera fija seguida de los símbolos en UTF-8, el
+        bitset de estados finales y los tres arreglos de transiciones en
+        little-endian.
+
+        Returns:
+            bytes: El autómata serializado.
+        """
+        simbolos = [simbolo.encode('utf-8') for simbolo in self.simbolos]
+        finales = self.finales.to_bytes((self.num_estados + 7) // 8, 'little')
+        partes = [_CABECERA.pack(_MAGIA, _VERSION_FORMATO, self.num_estados,
+                                 self.inicial, len(simbolos), len(self._destinos))]
+        for simbolo in simbolos:
+            partes.append(struct.pack('<H', len(simbolo)))
+            partes.append(simbolo)
+        partes.append(finales)
+        for arreglo in (self._origenes, self._simbolos, self._destinos):
+            if sys.byteorder != 'little':
+                arreglo = array('i', arreglo)
+                arreglo.byteswap()
+            partes.append(arreglo.tobytes())
+        return b''.join(partes)
+
+    @classmethod
+    def desde_bytes(cls, datos):
+        """
+        Reconstruye un autómata serializado con a_bytes.
+
+        Args:
+            datos (bytes): El autómata serializado.
+
+        Returns:
+            AutomataCompacto: El autómata reconstruido.
+
+        Raises:
+            ValueError: Si los datos no tienen el formato esperado.
+        """
+        try:
+            magia, version, num_estados, inicial, num_simbolos, num_aristas = \
+                _CABECERA.unpack_from(datos, 0)
+        except struct.error as error:
+            raise ValueError("Datos de autómata truncados") from error
+        if magia != _MAGIA or version != _VERSION_FORMATO:
+            raise ValueError("Formato de autómata no reconocido")
+
+        automata = cls()
+        posicion = _CABECERA.size
+        try:
+            for _ in range(num_simbolos):
+                (longitud,) = struct.unpack_from('<H', datos, posicion)
+                posicion += 2
+                simbolo = bytes(datos[posicion:posicion + longitud]).decode('utf-8')
+                posicion += longitud
+                automata._indice_simbolo[simbolo] = len(automata.simbolos)
+                automata.simbolos.append(simbolo)
+        except (struct.error, UnicodeDecodeError) as error:
+            raise ValueError("Símbolos del autómata corruptos") from error
+
+        tamano_finales = (num_estados + 7) // 8
+        automata.finales = int.from_bytes(datos[posicion:posicion + tamano_finales], 'little')
+        posicion += tamano_finales
+
+        tamano_arreglo = num_aristas * automata._destinos.itemsize
+        if len(datos) != posicion + 3 * tamano_arreglo:
+            raise ValueError("Transiciones del autómata truncadas")
+        for arreglo in (automata._origenes, automata._simbolos, automata._destinos):
+            arreglo.frombytes(datos[posicion:posicion + tamano_arreglo])
+            if sys.byteorder != 'little':
+                arreglo.byteswap()
+            posicion += tamano_arreglo
+
+        automata.num_estados = num_estados
+        automata.inicial = inicial
+        return automata
+
+    def crear_estado(self):
+        """
+        Crea un nuevo estado en el autómata.
+
+        Returns:
+            int: Identificador del nuevo estado.
+        """
+        estado = self.num_estados
+        self.num_estados += 1
+        self._filas = None
+        return estado
+
+    def agregar_transicion(self, estado_origen, simbolo, estado_destino):
+        """
+        Agrega una transición entre dos estados.
+
+        Args:
+            estado_origen (int): Estado de origen.
+            simbolo (str): Símbolo de la transición ('' para las transiciones vacías).
+            estado_destino (int): Estado de destino.
+        """
+        indice = self._indice_simbolo.get(simbolo)
+        if indice is None:
+            indice = len(self.simbolos)
+            self._indice_simbolo[simbolo] = indice
+            self.simbolos.append(simbolo)
+        self._origenes.append(estado_origen)
+        self._simbolos.append(indice)
+        self._destinos.append(estado_destino)
+        self._filas = None
+
+    def marcar_final(self, estado, final=True):
+        """
+        Marca o desmarca un estado como final.
+
+        Args:
+            estado (int): El estado a modificar.
+            final (bool): Si el estado debe ser final.
+        """
+        if final:
+            self.finales |= 1 << estado
+        else:
+            self.finales &= ~(1 << estado)
+
+    def es_final(self, estado):
+        """
+        Indica si un estado es final.
+
+        Args:
+            estado (int): El estado a consultar.
+
+        Returns:
+            bool: True si el estado es final.
+        """
+        return bool(self.finales >> estado & 1)
+
+    def compactar(self):
+        """
+        Compacta las transiciones acumuladas en la tabla CSR, sin duplicados.
+
+        Se llama automáticamente en la primera consulta tras una modificación.
+        """
+        if self._filas is not None:
+            return
+        filas = array('i', [0]) * (self.num_estados + 1)
+        simbolos = array('i')
+        destinos = array('i')
+        for origen, simbolo, destino in sorted(set(zip(self._origenes, self._simbolos,
+                                                       self._destinos))):
+            filas[origen + 1] += 1
+            simbolos.append(simbolo)
+            destinos.append(destino)
+        for estado in range(self.num_estados):
+            filas[estado + 1] += filas[estado]
+        self._filas = filas
+        self._fila_simbolos = simbolos
+        self._fila_destinos = destinos
+
+    def fila(self, estado):
+        """
+        Obtiene todas las transiciones de un estado.
+
+        Args:
+            estado (int): Estado de origen.
+
+        Returns:
+            tuple: (símbolos, destinos) como arreglos paralelos; los símbolos
+                son índices de la lista simbolos, en orden creciente.
+        """
+        self.compactar()
+        inicio, fin = self._filas[estado], self._filas[estado + 1]
+        return self._fila_simbolos[inicio:fin], self._fila_destinos[inicio:fin]
+
+    def destinos(self, estado, simbolo):
+        """
+        Obtiene los destinos de las transiciones de un estado con un símbolo.
+
+        Args:
+            estado (int): Estado de origen.
+            simbolo (str): Símbolo de la transición.
+
+        Returns:
+            array: Estados de destino, sin duplicados.
+        """
+        indice = self._indice_simbolo.get(simbolo)
+        if indice is None:
+            return array('i')
+        self.compactar()
+        simbolos = self._fila_simbolos
+        inicio = bisect_left(simbolos, indice, self._filas[estado], self._filas[estado + 1])
+        fin = bisect_right(simbolos, indice, inicio, self._filas[estado + 1])
+        return self._fila_destinos[inicio:fin]
+
+    @property
+    def num_transiciones(self):
+        """int: Número de transiciones distintas del autómata."""
+        self.compactar()
+        return len(self._fila_destinos)
+
+    @property
+    def estado_inicial(self):
+        """str: Identificador 'qN' del estado inicial, como en Automata."""
+        return f'q{self.inicial}' if self.inicial >= 0 else None
+
+    @estado_inicial.setter
+    def estado_inicial(self, estado):
+        self.inicial = int(estado[1:]) if isinstance(estado, str) else estado
+
+    @property
+    def estados(self):
+        """Mapping: Vista de los estados con la misma interfaz que Automata.estados."""
+        return _VistaEstados(self)
+
+class _EstadoVista:
+    """Vista de un estado de AutomataCompacto con la interfaz de Estado."""
+    __slots__ = ('_automata', '_estado')
+
+    def __init__(self, automata, estado):
+        self._automata = automata
+        self._estado = estado
+
+    @property
+    def id(self):
+        return f'q{self._estado}'
+
+    @property
+    def es_final(self):
+        return self._automata.es_final(self._estado)
+
+    @es_final.setter
+    def es_final(self, valor):
+        self._automata.marcar_final(self._estado, valor)
+
+    @property
+    def transiciones(self):
+        transiciones = {}
+        nombres = self._automata.simbolos
+        for indice, destino in zip(*self._automata.fila(self._estado)):
+            transiciones.setdefault(nombres[indice], set()).add(f'q{destino}')
+        return transiciones
+
+class _VistaEstados(Mapping):
+    """Vista de solo lectura de los estados de AutomataCompacto indexada por 'qN'."""
+    __slots__ = ('_automata',)
+
+    def __init__(self, automata):
+        self._automata = automata
+
+    def __getitem__(self, estado_id):
+        if isinstance(estado_id, str) and estado_id[:1] == 'q' and estado_id[1:].isdigit():
+            estado = int(estado_id[1:])
+            if estado < self._automata.num_estados:
+                return _EstadoVista(self._automata, estado)
+        raise KeyError(estado_id)
+
+    def __iter__(self):
+        return (f'q{estado}' for estado in range(self._automata.num_estados))
+
+    def __len__(self):
+        return self._automata.num_estados
@@ -0,0 +1,317 @@
+from array import array
+from src.utils.automata_compacto import AutomataCompacto
+
+# Símbolo usado por GeneradorAutomata para las transiciones vacías.
+EPSILON = ''
+
+class AutomataDeterminista:
+    """
+    Autómata finito determinista con estados enteros y tabla de transiciones densa.
+
+    La transición del estado e con el símbolo de índice s está en
+    tabla[e * len(alfabeto) + s]; el valor -1 indica que no hay transición.
+
+    Attributes:
+        alfabeto (list): Símbolos del autómata, ordenados por su índice.
+        indice_simbolo (dict): Índice de cada símbolo dentro del alfabeto.
+        tabla (array): Tabla de transiciones de tamaño num_estados * len(alfabeto).
+        finales (bytearray): 1 en la posición de cada estado final, 0 en el resto.
+        estado_inicial (int): Estado inicial del autómata.
+    """
+    def __init__(self, alfabeto, tabla, finales, estado_inicial=0):
+        """
+        Inicializa el autómata a partir de sus tablas.
+
+        Args:
+            alfabeto (list): Símbolos del autómata, ordenados por su índice.
+            tabla (array): Tabla de transiciones densa.
+            finales (bytearray): Marcas de estado final.
+            estado_inicial (int): Estado inicial del autómata.
+        """
+        self.alfabeto = list(alfabeto)
+        self.indice_simbolo = {simbolo: i for i, simbolo in enumerate(self.alfabeto)}
+        self.tabla = tabla
+        self.finales = finales
+        self.estado_inicial = estado_inicial
+
+    @property
+    def num_estados(self):
+        """int: Número de estados del autómata."""
+        return len(self.finales)
+
+    @property
+    def num_transiciones(self):
+        """int: Número de transiciones definidas (las entradas distintas de -1)."""
+        return sum(1 for destino in self.tabla if destino >= 0)
+
+    def transicion(self, estado, simbolo):
+        """
+        Obtiene el destino de una transición.
+
+        Args:
+            estado (int): Estado de origen.
+            simbolo (str): Símbolo leído.
+
+        Returns:
+            int: Estado de destino, o -1 si no hay transición.
+        """
+        indice = self.indice_simbolo.get(simbolo)
+        if indice is None:
+            return -1
+        return self.tabla[estado * len(self.alfabeto) + indice]
+
+    def run(self, cadena):
+        """
+        Ejecuta el autómata sobre una cadena en tiempo lineal.
+
+        Args:
+            cadena (str): La cadena a procesar.
+
+        Returns:
+            int: Estado alcanzado al consumir la cadena, o -1 si el autómata se bloquea.
+        """
+        tabla = self.tabla
+        ancho = len(self.alfabeto)
+        indice = self.indice_simbolo.get
+        estado = self.estado_inicial
+        for caracter in cadena:
+            simbolo = indice(caracter)
+            if simbolo is None:
+                return -1
+            estado = tabla[estado * ancho + simbolo]
+            if estado < 0:
+                return -1
+        return estado
+
+    def accepts(self, cadena):
+        """
+        Indica si el autómata acepta la cadena completa.
+
+        Args:
+            cadena (str): La cadena a evaluar.
+
+        Returns:
+            bool: True si la cadena termina en un estado final.
+        """
+        estado = self.run(cadena)
+        return estado >= 0 and bool(self.finales[estado])
+
+def cerraduras_epsilon(automata):
+    """
+    Calcula la cerradura épsilon de cada estado del AFN.
+
+    Args:
+        automata (AutomataCompacto): El autómata no determinista.
+
+    Returns:
+        list: Conjunto de estados alcanzables por transiciones vacías desde cada estado.
+    """
+    if EPSILON not in automata.simbolos:
+        return [frozenset((estado,)) for estado in range(automata.num_estados)]
+
+    vacias = [automata.destinos(estado, EPSILON) for estado in range(automata.num_estados)]
+    cerraduras = []
+    for estado in range(automata.num_estados):
+        visitados = {estado}
+        pila = [estado]
+        while pila:
+            actual = pila.pop()
+            for destino in vacias[actual]:
+                if destino not in visitados:
+                    visitados.add(destino)
+                    pila.append(destino)
+        cerraduras.append(frozenset(visitados))
+    return cerraduras
+
+def determinizar(automata, limite_estados=None):
+    """
+    Convierte un AFN de GeneradorAutomata en un AFD mediante construcción de subconjuntos.
+
+    Args:
+        automata (Automata | AutomataCompacto): El autómata no determinista, con
+            transiciones épsilon ('').
+        limite_estados (int, optional): Número máximo de estados del AFD resultante.
+
+    Returns:
+        AutomataDeterminista: El autómata determinista equivalente.
+
+    Raises:
+        ValueError: Si el AFD supera limite_estados.
+    """
+    automata = AutomataCompacto.desde_automata(automata)
+    alfabeto = sorted(simbolo for simbolo in automata.simbolos if simbolo != EPSILON)
+    # Posición en el alfabeto de cada índice de símbolo del AFN (-1 para épsilon).
+    posicion = [alfabeto.index(simbolo) if simbolo != EPSILON else -1
+                for simbolo in automata.simbolos]
+    filas = [automata.fila(estado) for estado in range(automata.num_estados)]
+    cerraduras = cerraduras_epsilon(automata)
+    estados_finales = automata.finales
+
+    inicial = cerraduras[automata.inicial]
+    subconjuntos = [inicial]
+    ids = {inicial: 0}
+    tabla = array('i')
+    finales = bytearray()
+
+    i = 0
+    while i < len(subconjuntos):
+        subconjunto = subconjuntos[i]
+        finales.append(any(estados_finales >> q & 1 for q in subconjunto))
+        destinos = [set() for _ in alfabeto]
+        for q in subconjunto:
+            for indice, siguiente in zip(*filas[q]):
+                columna = posicion[indice]
+                if columna >= 0:
+                    destinos[columna] |= cerraduras[siguiente]
+        for destino in destinos:
+            if not destino:
+                tabla.append(-1)
+                continue
+
+            destino = frozenset(destino)
+            destino_id = ids.get(destino)
+            if destino_id is None:
+                destino_id = len(subconjuntos)
+                if limite_estados is not None and destino_id >= limite_estados:
+                    raise ValueError(
+                        f"El AFD supera el límite de {limite_estados} estados"
+                    )
+                ids[destino] = destino_id
+                subconjuntos.append(destino)
+            tabla.append(destino_id)
+        i += 1
+
+    return AutomataDeterminista(alfabeto, tabla, finales)
+
+def _estados_alcanzables(afd):
+    """
+    Obtiene los estados alcanzables desde el estado inicial, en orden de recorrido.
+
+    Args:
+        afd (AutomataDeterminista): El autómata a recorrer.
+
+    Returns:
+        list: Estados alcanzables en orden BFS.
+    """
+    ancho = len(afd.alfabeto)
+    orden = [afd.estado_inicial]
+    vistos = {afd.estado_inicial}
+    i = 0
+    while i < len(orden):
+        base = orden[i] * ancho
+        for destino in afd.tabla[base:base + ancho]:
+            if destino >= 0 and destino not in vistos:
+                vistos.add(destino)
+                orden.append(destino)
+        i += 1
+    return orden
+
+def minimizar(afd):
+    """
+    Minimiza un AFD con el refinamiento de particiones de Hopcroft.
+
+    Los estados inalcanzables se descartan y los estados desde los que no se
+    puede llegar a un estado final se funden con el sumidero implícito (-1).
+
+    Args:
+        afd (AutomataDeterminista): El autómata a minimizar.
+
+    Returns:
+        tuple: (AutomataDeterminista mínimo, dict con el número de estados y
+            transiciones antes y después de la minimización).
+    """
+    ancho = len(afd.alfabeto)
+    alcanzables = _estados_alcanzables(afd)
+    # Renumerar los estados alcanzables y añadir un sumidero explícito al final
+    # para que la función de transición sea total durante el refinamiento.
+    local = {estado: i for i, estado in enumerate(alcanzables)}
+    sumidero = len(alcanzables)
+    n = sumidero + 1
+
+    inversa = [[[] for _ in range(n)] for _ in range(ancho)]
+    for estado in alcanzables:
+        origen = local[estado]
+        base = estado * ancho
+        for simbolo in range(ancho):
+            destino = afd.tabla[base + simbolo]
+            inversa[simbolo][local[destino] if destino >= 0 else sumidero].append(origen)
+    for simbolo in range(ancho):
+        inversa[simbolo][sumidero].append(sumidero)
+
+    finales = {local[e] for e in alcanzables if afd.finales[e]}
+    no_finales = set(range(n)) - finales
+    bloques = [bloque for bloque in (finales, no_finales) if bloque]
+    bloque_de = [0] * n
+    for indice, bloque in enumerate(bloques):
+        for estado in bloque:
+            bloque_de[estado] = indice
+
+    pendientes = {min(range(len(bloques)), key=lambda b: len(bloques[b]))}
+    while pendientes:
+        divisor = list(bloques[pendientes.pop()])
+        for simbolo in range(ancho):
+            tocados = {}
+            for destino in divisor:
+                for origen in inversa[simbolo][destino]:
+                    tocados.setdefault(bloque_de[origen], []).append(origen)
+
+            for indice, interseccion in tocados.items():
+                bloque = bloques[indice]
+                if len(interseccion) == len(bloque):
+                    continue
+                nuevo = set(interseccion)
+                bloque -= nuevo
+                nuevo_indice = len(bloques)
+                bloques.append(nuevo)
+                for estado in nuevo:
+                    bloque_de[estado] = nuevo_indice
+                if indice in pendientes:
+                    pendientes.add(nuevo_indice)
+                else:
+                    pendientes.add(indice if len(bloque) <= len(nuevo) else nuevo_indice)
+
+    # Numerar los bloques en orden BFS desde el inicial; el bloque del
+    # sumidero vuelve a ser la ausencia de transición.
+    bloque_sumidero = bloque_de[sumidero]
+    inicial = bloque_de[local[afd.estado_inicial]]
+    representante = {}
+    for estado in range(sumidero):
+        representante.setdefault(bloque_de[estado], estado)
+
+    nuevo_id = {}
+    orden = []
+    if inicial != bloque_sumidero:
+        nuevo_id[inicial] = 0
+        orden.append(inicial)
+    tabla = array('i')
+    nuevos_finales = bytearray()
+    i = 0
+    while i < len(orden):
+        estado = alcanzables[representante[orden[i]]]
+        nuevos_finales.append(afd.finales[estado])
+        base = estado * ancho
+        for simbolo in range(ancho):
+            destino = afd.tabla[base + simbolo]
+            bloque = bloque_de[local[destino]] if destino >= 0 else bloque_sumidero
+            if bloque == bloque_sumidero:
+                tabla.append(-1)
+                continue
+            if bloque not in nuevo_id:
+                nuevo_id[bloque] = len(orden)
+                orden.append(bloque)
+            tabla.append(nuevo_id[bloque])
+        i += 1
+
+    if not orden:
+        # El lenguaje es vacío: un único estado no final sin transiciones.
+        tabla = array('i', [-1] * ancho)
+        nuevos_finales = bytearray(1)
+
+    minimo = AutomataDeterminista(afd.alfabeto, tabla, nuevos_finales)
+    estadisticas = {
+        'estados_antes': afd.num_estados,
+        'estados_despues': minimo.num_estados,
+        'transiciones_antes': afd.num_transiciones,
+        'transiciones_despues': minimo.num_transiciones,
+    }
+    return minimo, estadisticas
@@ -1,9 +1,35 @@
+import io
 import os
-from graphviz import Digraph
-from PIL import Image
+import time
+from src.utils.automata_compacto import AutomataCompacto
+from src.utils.automata_determinista import determinizar, minimizar
+from src.utils.cache_automatas import CacheAutomatas, directorio_por_defecto, directorio_usuario
+from src.utils.metricas import metricas
+from src.utils.parser_expresiones import (
+    ALTERNATIVA, CONCATENACION, ESTRELLA, LITERAL, VACIO, parsear
+)
 
-# Add Graphviz bin directory to PATH
-os.environ["PATH"] += os.pathsep + r"C:\Program Files\Graphviz\bin"
+# Versión de la construcción de autómatas; cambiarla invalida la caché en disco.
+VERSION_GENERADOR = '2'
+
+# Formatos de salida de renderizar_automata
+FORMATOS = ('png', 'svg', 'dot')
+
+_cache = None
+_graphviz_configurado = False
+
+def _configurar_graphviz():
+    """
+    Agrega el directorio de Graphviz al PATH la primera vez que se renderiza.
+
+    Se hace aquí y no al importar el módulo para no modificar el entorno ni
+    cargar Graphviz hasta que realmente se visualiza un autómata.
+    """
+    global _graphviz_configurado
+    if not _graphviz_configurado:
+        # Add Graphviz bin directory to PATH
+        os.environ["PATH"] += os.pathsep + r"C:\Program Files\Graphviz\bin"
+        _graphviz_configurado = True
 
 class Estado:
     """
@@ -14,6 +40,8 @@ class Estado:
         transiciones (dict): Diccionario de transiciones del estado.
         es_final (bool): Indica si el estado es final.
     """
+    __slots__ = ('id', 'transiciones', 'es_final')
+
     def __init__(self, id):
         """
         Inicializa un estado con un identificador.
@@ -72,7 +100,7 @@ class GeneradorAutomata:
     Generador de autómatas a partir de expresiones regulares.
 
     Attributes:
-        automata (Automata): El autómata generado.
+        automata (AutomataCompacto): El autómata generado.
     """
     def __init__(self):
         """
@@ -88,119 +116,111 @@ class GeneradorAutomata:
             expr (str): La expresión regular a procesar.
 
         Returns:
-            Automata: El autómata generado.
+            AutomataCompacto: El autómata generado.
+
+        Raises:
+            ValueError: Si la expresión está mal formada.
         """
-        self.automata = Automata()
+        inicio = time.perf_counter() if metricas.activo else 0.0
+        self.automata = AutomataCompacto()
 
         # Crear estado inicial
         estado_inicial = self.automata.crear_estado()
-        self.automata.estado_inicial = estado_inicial
+        self.automata.inicial = estado_inicial
 
-        # Procesar la expresión
-        estado_actual = estado_inicial
-        estado_actual = self.procesar_subexpresion(estado_actual, expr)
+        # Procesar la expresión a partir de su árbol sintáctico
+        estado_actual = self.procesar_arbol(parsear(expr), estado_inicial)
 
         # Marcar el estado final
-        self.automata.estados[estado_actual].es_final = True
+        self.automata.marcar_final(estado_actual)
+
+        if metricas.activo:
+            metricas.observar('automata.construccion', time.perf_counter() - inicio)
+            metricas.fijar('automata.estados', self.automata.num_estados)
+            metricas.fijar('automata.transiciones', self.automata.num_transiciones)
         return self.automata
 
-    def procesar_subexpresion(self, estado_inicial, subexpr):
+    def procesar_arbol(self, raiz, estado_inicial):
         """
-        Procesa una subexpresión de la expresión regular.
+        Construye el autómata de un árbol sintáctico a partir de un estado.
+
+        El recorrido usa una pila explícita en lugar de recursión, y cada nodo
+        agrega un número constante de estados y transiciones, de modo que el
+        costo es lineal en el tamaño del árbol. Los ciclos de '*' y '+' vuelven
+        siempre a un estado nuevo, nunca al estado de entrada, para que las
+        alternativas que comparten ese estado no se mezclen.
 
         Args:
-            estado_inicial (str): Identificador del estado inicial.
-            subexpr (str): La subexpresión a procesar.
+            raiz (Nodo): Raíz del árbol sintáctico.
+            estado_inicial (int): Identificador del estado inicial.
 
         Returns:
-            str: Identificador del estado actual después de procesar la subexpresión.
-        """
-        estado_actual = estado_inicial
-        i = 0
-        while i < len(subexpr):
-            if subexpr[i] == '|':
-                # Manejar la unión (OR) creando caminos alternativos desde el mismo nodo inicial
-                estado_actual = self.procesar_union(estado_inicial, subexpr)
-                break
-            elif subexpr[i] == '(':
-                # Encontrar el paréntesis de cierre correspondiente
-                nivel = 1
-                j = i + 1
-                while j < len(subexpr) and nivel > 0:
-                    if subexpr[j] == '(':
-                        nivel += 1
-                    elif subexpr[j] == ')':
-                        nivel -= 1
-                    j += 1
-
-                # Procesar la subexpresión dentro de los paréntesis
-                subexpr_interna = subexpr[i + 1:j - 1]
-                estado_actual = self.procesar_subexpresion(estado_actual, subexpr_interna)
-                i = j
-            elif subexpr[i] in '*+':
-                # Manejar la clausura de Kleene y el operador +
-                estado_actual = self.procesar_estrella(estado_actual, subexpr, i)
-                i += 1
+            int: Identificador del estado alcanzado tras procesar el árbol.
+        """
+        automata = self.automata
+        resultado = estado_inicial
+        # Cada marco es [nodo, estado de entrada, hijos procesados, estado auxiliar]
+        pila = [[raiz, estado_inicial, 0, None]]
+        while pila:
+            marco = pila[-1]
+            nodo, entrada, procesados, auxiliar = marco
+            tipo = nodo.tipo
+
+            if tipo == LITERAL:
+                # Símbolo literal: una transición hacia un estado nuevo
+                resultado = automata.crear_estado()
+                automata.agregar_transicion(entrada, nodo.valor, resultado)
+            elif tipo == VACIO:
+                resultado = entrada
+            elif tipo == CONCATENACION:
+                # Cada hijo continúa desde el estado donde terminó el anterior
+                actual = resultado if procesados else entrada
+                if procesados < len(nodo.hijos):
+                    marco[2] += 1
+                    pila.append([nodo.hijos[procesados], actual, 0, None])
+                    continue
+                resultado = actual
+            elif tipo == ALTERNATIVA:
+                # Todas las alternativas parten del estado de entrada y se
+                # reúnen en un estado final común
+                if procesados == 0:
+                    auxiliar = marco[3] = automata.crear_estado()
+                else:
+                    automata.agregar_transicion(resultado, '', auxiliar)
+                if procesados < len(nodo.hijos):
+                    marco[2] += 1
+                    pila.append([nodo.hijos[procesados], entrada, 0, None])
+                    continue
+                resultado = auxiliar
             else:
-                # Manejar símbolos literales
-                nuevo_estado = self.automata.crear_estado()
-                self.automata.agregar_transicion(estado_actual, subexpr[i], nuevo_estado)
-                estado_actual = nuevo_estado
-                i += 1
-        return estado_actual
-
-    def procesar_estrella(self, estado_inicial, expr, i):
+                # Clausura de Kleene y operador +: el cuerpo empieza en un
+                # estado nuevo al que se vuelve al terminar cada repetición
+                if procesados == 0:
+                    ciclo = marco[3] = automata.crear_estado()
+                    automata.agregar_transicion(entrada, '', ciclo)
+                    marco[2] = 1
+                    pila.append([nodo.hijos[0], ciclo, 0, None])
+                    continue
+                automata.agregar_transicion(resultado, '', auxiliar)
+                if tipo == ESTRELLA:
+                    resultado = auxiliar
+            pila.pop()
+        return resultado
+
+    def minimizar(self):
         """
-        Procesa el operador de clausura de Kleene y el operador +.
-
-        Args:
-            estado_inicial (str): Identificador del estado inicial.
-            expr (str): La expresión regular.
-            i (int): Índice del operador en la expresión.
+        Reemplaza el autómata generado por su AFD mínimo equivalente.
 
         Returns:
-            str: Identificador del estado actual después de procesar el operador.
-        """
-        if expr[i - 1] == ')':
-            # Encontrar el paréntesis de apertura correspondiente
-            nivel = 1
-            j = i - 2
-            while j >= 0 and nivel > 0:
-                if expr[j] == ')':
-                    nivel += 1
-                elif expr[j] == '(':
-                    nivel -= 1
-                j -= 1
-
-            subexpr = expr[j + 2:i - 1]
-            estado_intermedio = self.procesar_subexpresion(estado_inicial, subexpr)
-            self.automata.agregar_transicion(estado_intermedio, '', estado_inicial)
-            return estado_intermedio
-        else:
-            simbolo = expr[i - 1]
-            self.automata.agregar_transicion(estado_inicial, simbolo, estado_inicial)
-            return estado_inicial
-
-    def procesar_union(self, estado_inicial, expr):
-        """
-        Procesa el operador de unión (OR).
-
-        Args:
-            estado_inicial (str): Identificador del estado inicial.
-            expr (str): La expresión regular.
-
-        Returns:
-            str: Identificador del estado final después de procesar la unión.
-        """
-        estado_final = self.automata.crear_estado()
-        partes = expr.split('|')
-        for parte in partes:
-            estado_actual = estado_inicial
-            for simbolo in parte:
-                nuevo_estado = self.automata.crear_estado() if simbolo != parte[-1] else estado_final
-                self.automata.agregar_transicion(estado_actual, simbolo, nuevo_estado)
-                estado_actual = nuevo_estado
-        return estado_final
+            dict: Número de estados y transiciones antes y después de minimizar.
+        """
+        estados_antes = self.automata.num_estados
+        transiciones_antes = self.automata.num_transiciones
+        minimo, estadisticas = minimizar(determinizar(self.automata))
+        self.automata = automata_desde_afd(minimo)
+        estadisticas['estados_afn'] = estados_antes
+        estadisticas['transiciones_afn'] = transiciones_antes
+        return estadisticas
 
     def visualizar_automata(self):
         """
@@ -209,6 +229,9 @@ class GeneradorAutomata:
         Returns:
             Digraph: El objeto Digraph de Graphviz que representa el autómata.
         """
+        from graphviz import Digraph
+
+        _configurar_graphviz()
         dot = Digraph(comment='Autómata Finito')
         dot.attr(rankdir='LR')
 
@@ -228,20 +251,136 @@ class GeneradorAutomata:
 
         return dot
 
-def probar_automata(expr):
+def automata_desde_afd(afd):
     """
-    Genera y visualiza un autómata a partir de una expresión regular.
+    Convierte un AutomataDeterminista en un AutomataCompacto para poder visualizarlo.
+
+    Args:
+        afd (AutomataDeterminista): El autómata determinista.
+
+    Returns:
+        AutomataCompacto: Autómata equivalente con los mismos números de estado.
+    """
+    automata = AutomataCompacto()
+    for _ in range(afd.num_estados):
+        automata.crear_estado()
+    automata.inicial = afd.estado_inicial
+    ancho = len(afd.alfabeto)
+    for estado in range(afd.num_estados):
+        automata.marcar_final(estado, bool(afd.finales[estado]))
+        for indice, simbolo in enumerate(afd.alfabeto):
+            destino = afd.tabla[estado * ancho + indice]
+            if destino >= 0:
+                automata.agregar_transicion(estado, simbolo, destino)
+    return automata
+
+def obtener_cache():
+    """
+    Obtiene la caché de autómatas compartida por la aplicación.
+
+    Returns:
+        CacheAutomatas: La caché, creada en el primer uso.
+    """
+    global _cache
+    if _cache is None:
+        _cache = CacheAutomatas(version=VERSION_GENERADOR)
+    return _cache
+
+def activar_cache_en_disco(directorio=None):
+    """
+    Hace que la caché de autómatas también se guarde en disco entre ejecuciones.
+
+    Por defecto la caché solo vive en memoria (salvo que se defina
+    REGEXIFY_CACHE_DIR), de modo que usar el generador como biblioteca no
+    escribe en la carpeta del usuario sin pedirlo. La aplicación de escritorio
+    la activa al arrancar (ver src/main.py).
+
+    Args:
+        directorio (str, optional): Directorio del almacén; por defecto
+            REGEXIFY_CACHE_DIR si está definida, y si no ~/.cache/regexify/automatas.
+
+    Returns:
+        CacheAutomatas: La nueva caché compartida.
+    """
+    global _cache
+    directorio = directorio or directorio_por_defecto() or directorio_usuario()
+    _cache = CacheAutomatas(directorio, version=VERSION_GENERADOR)
+    return _cache
+
+def renderizar_automata(expr, formato='png'):
+    """
+    Renderiza el autómata de una expresión directamente en memoria.
+
+    La salida de Graphviz se recibe por una tubería, sin archivos temporales,
+    así que varias llamadas pueden ejecutarse a la vez sin pisarse. El
+    autómata y cada formato renderizado se reutilizan desde la caché, que solo
+    escribe en disco si se activó (ver activar_cache_en_disco).
 
     Args:
         expr (str): La expresión regular a procesar.
+        formato (str): 'png', 'svg' o 'dot' (el código fuente de Graphviz).
+
+    Returns:
+        bytes: La imagen renderizada, o el código DOT en UTF-8.
+
+    Raises:
+        ValueError: Si la expresión está mal formada o el formato no es válido.
     """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}")
+
+    cache = obtener_cache()
+    entrada = cache.obtener(expr)
+    if entrada is not None and formato in entrada.imagenes:
+        if metricas.activo:
+            metricas.incrementar('automata.cache.aciertos')
+        return entrada.imagenes[formato]
+    if metricas.activo:
+        metricas.incrementar('automata.cache.fallos')
+
     generador = GeneradorAutomata()
-    automata = generador.procesar_expresion(expr)
+    if entrada is not None:
+        generador.automata = entrada.automata
+    else:
+        generador.procesar_expresion(expr)
+    inicio = time.perf_counter() if metricas.activo else 0.0
     dot = generador.visualizar_automata()
+    if formato == 'dot':
+        datos = dot.source.encode('utf-8')
+    else:
+        datos = dot.pipe(format=formato)
+    if metricas.activo:
+        metricas.observar('automata.renderizado', time.perf_counter() - inicio, etiqueta=formato)
+    cache.guardar(expr, generador.automata, {formato: datos})
+    return datos
+
+def imagen_automata(expr):
+    """
+    Obtiene la imagen PNG del autómata de una expresión como imagen de PIL.
 
-    dot.render('automata', format='png', cleanup=True)
-    print(f"Autómata generado para la expresión: {expr}")
-    print("El autómata ha sido guardado como 'automata.png'")
+    Args:
+        expr (str): La expresión regular a procesar.
+
+    Returns:
+        Image.Image: La imagen decodificada en memoria.
+    """
+    from PIL import Image
+
+    imagen = Image.open(io.BytesIO(renderizar_automata(expr, 'png')))
+    imagen.load()
+    return imagen
+
+def probar_automata(expr):
+    """
+    Genera y visualiza un autómata a partir de una expresión regular.
 
-    img = Image.open('automata.png')
-    img.show()
\ No newline at end of file
+    Args:
+        expr (str): La expresión regular a procesar.
+
+    Returns:
+        Image.Image: La imagen del autómata.
+    """
+    img = imagen_automata(expr)
+    print(f"Autómata generado para la expresión: {expr}")
+    img.show()
+    return img
\ No newline at end of file
@@ -0,0 +1,309 @@
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from src.utils.automata_compacto import AutomataCompacto
+
+# Cabecera de cada archivo de la caché: magia, versión y longitud del autómata comprimido.
+_MAGIA = b'RXCE'
+_VERSION_FORMATO = 1
+_CABECERA = struct.Struct('<4sBI')
+_EXTENSION = '.rxc'
+
+# Al desalojar se baja hasta esta fracción de max_bytes, para no tener que
+# recorrer el directorio de nuevo en el siguiente guardado.
+_FRACCION_DESALOJO = 0.9
+
+def directorio_usuario():
+    """
+    Obtiene el directorio de la caché en disco dentro de la carpeta del usuario.
+
+    Returns:
+        str: ~/.cache/regexify/automatas.
+    """
+    return os.path.join(os.path.expanduser('~'), '.cache', 'regexify', 'automatas')
+
+def directorio_por_defecto():
+    """
+    Obtiene el directorio de la caché en disco si se activó con REGEXIFY_CACHE_DIR.
+
+    Returns:
+        str: El valor de REGEXIFY_CACHE_DIR, o None (caché solo en memoria).
+    """
+    return os.environ.get('REGEXIFY_CACHE_DIR') or None
+
+class EntradaCache:
+    """
+    Autómata construido y sus imágenes renderizadas.
+
+    Attributes:
+        automata (AutomataCompacto): El autómata construido.
+        imagenes (dict): Imagen renderizada por formato ('png', 'svg', ...).
+    """
+    __slots__ = ('automata', 'imagenes')
+
+    def __init__(self, automata, imagenes=None):
+        self.automata = automata
+        self.imagenes = dict(imagenes or {})
+
+    def a_bytes(self):
+        """
+        Serializa la entrada: el autómata comprimido con zlib seguido de las imágenes.
+
+        Returns:
+            bytes: La entrada serializada.
+        """
+        automata = zlib.compress(self.automata.a_bytes())
+        partes = [_CABECERA.pack(_MAGIA, _VERSION_FORMATO, len(automata)), automata,
+                  struct.pack('<H', len(self.imagenes))]
+        for formato, datos in self.imagenes.items():
+            formato = formato.encode('ascii')
+            partes.append(struct.pack('<H', len(formato)))
+            partes.append(formato)
+            partes.append(struct.pack('<I', len(datos)))
+            partes.append(datos)
+        return b''.join(partes)
+
+    @classmethod
+    def desde_bytes(cls, datos):
+        """
+        Reconstruye una entrada serializada con a_bytes.
+
+        Args:
+            datos (bytes): La entrada serializada.
+
+        Returns:
+            EntradaCache: La entrada reconstruida.
+
+        Raises:
+            ValueError: Si los datos no tienen el formato esperado o están truncados.
+        """
+        def leer(posicion, longitud):
+            # Comprueba que el tramo declarado cabe en los datos restantes.
+            if posicion + longitud > len(datos):
+                raise ValueError("Entrada de caché truncada")
+            return datos[posicion:posicion + longitud]
+
+        try:
+            magia, version, longitud = _CABECERA.unpack_from(datos, 0)
+            if magia != _MAGIA or version != _VERSION_FORMATO:
+                raise ValueError("Formato de entrada de caché no reconocido")
+            posicion = _CABECERA.size
+            automata = AutomataCompacto.desde_bytes(zlib.decompress(leer(posicion, longitud)))
+            posicion += longitud
+
+            imagenes = {}
+            (cantidad,) = struct.unpack_from('<H', datos, posicion)
+            posicion += 2
+            for _ in range(cantidad):
+                (longitud,) = struct.unpack_from('<H', datos, posicion)
+                posicion += 2
+                formato = leer(posicion, longitud).decode('ascii')
+                posicion += longitud
+                (longitud,) = struct.unpack_from('<I', datos, posicion)
+                posicion += 4
+                imagenes[formato] = leer(posicion, longitud)
+                posicion += longitud
+            if posicion != len(datos):
+                raise ValueError("Entrada de caché con datos sobrantes")
+        except (struct.error, zlib.error, UnicodeDecodeError) as error:
+            raise ValueError("Entrada de caché corrupta") from error
+        return cls(automata, imagenes)
+
+class CacheAutomatas:
+    """
+    Caché direccionada por contenido de autómatas construidos y sus imágenes.
+
+    Combina una capa LRU en memoria con un almacén en disco opcional: sin
+    directorio (ni REGEXIFY_CACHE_DIR) la caché solo vive en memoria y no
+    escribe nada fuera del proceso. La clave es un hash
+    SHA-256 de la expresión y de la versión del generador, así que las entradas
+    sobreviven a los reinicios pero se ignoran cuando cambia la construcción.
+    Cuando el almacén en disco supera max_bytes se eliminan primero los archivos
+    usados hace más tiempo.
+
+    Attributes:
+        directorio (str): Directorio del almacén en disco, o None si solo se usa memoria.
+        version (str): Versión del generador incluida en la clave.
+        max_bytes (int): Tamaño máximo del almacén en disco.
+        max_memoria (int): Número máximo de entradas en memoria.
+    """
+
+    def __init__(self, directorio=None, version='', max_bytes=64 * 1024 * 1024, max_memoria=64):
+        """
+        Inicializa la caché.
+
+        Args:
+            directorio (str, optional): Directorio del almacén en disco; por
+                defecto REGEXIFY_CACHE_DIR, y si no está definida, ninguno.
+            version (str): Versión del generador incluida en la clave.
+            max_bytes (int): Tamaño máximo del almacén en disco.
+            max_memoria (int): Número máximo de entradas en memoria.
+        """
+        self.directorio = directorio or directorio_por_defecto()
+        self.version = str(version)
+        self.max_bytes = max_bytes
+        self.max_memoria = max_memoria
+        self._memoria = OrderedDict()
+        self._candado = threading.RLock()
+        # Tamaño estimado del almacén en disco; None hasta el primer recorrido.
+        self._tamano_disco = None
+
+    def clave(self, expr):
+        """
+        Calcula la clave de una expresión.
+
+        Args:
+            expr (str): La expresión regular.
+
+        Returns:
+            str: Hash hexadecimal de la versión y la expresión.
+        """
+        return hashlib.sha256(f'{self.version}\0{expr}'.encode('utf-8')).hexdigest()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + _EXTENSION)
+
+    def _recordar(self, clave, entrada):
+        with self._candado:
+            self._memoria[clave] = entrada
+            self._memoria.move_to_end(clave)
+            while len(self._memoria) > self.max_memoria:
+                self._memoria.popitem(last=False)
+
+    def obtener(self, expr):
+        """
+        Busca el autómata de una expresión, primero en memoria y luego en disco.
+
+        Args:
+            expr (str): La expresión regular.
+
+        Returns:
+            EntradaCache: La entrada encontrada, o None si no está en la caché.
+        """
+        clave = self.clave(expr)
+        with self._candado:
+            entrada = self._memoria.get(clave)
+            if entrada is not None:
+                self._memoria.move_to_end(clave)
+                return entrada
+        if self.directorio is None:
+            return None
+
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, 'rb') as archivo:
+                entrada = EntradaCache.desde_bytes(archivo.read())
+            # Actualizar la fecha de uso para la política de desalojo.
+            os.utime(ruta)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._eliminar(ruta)
+            return None
+
+        self._recordar(clave, entrada)
+        return entrada
+
+    def guardar(self, expr, automata, imagenes=None):
+        """
+        Guarda el autómata de una expresión y sus imágenes.
+
+        Las imágenes ya guardadas para la expresión se conservan salvo que se
+        reemplacen por otras del mismo formato.
+
+        Args:
+            expr (str): La expresión regular.
+            automata (AutomataCompacto): El autómata construido.
+            imagenes (dict, optional): Imagen renderizada por formato.
+
+        Returns:
+            EntradaCache: La entrada guardada.
+        """
+        clave = self.clave(expr)
+        with self._candado:
+            anterior = self.obtener(expr)
+            entrada = EntradaCache(automata, anterior.imagenes if anterior else None)
+            entrada.imagenes.update(imagenes or {})
+            self._recordar(clave, entrada)
+        if self.directorio is None:
+            return entrada
+
+        ruta = self._ruta(clave)
+        datos = entrada.a_bytes()
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            try:
+                anterior_tamano = os.stat(ruta).st_size
+            except FileNotFoundError:
+                anterior_tamano = 0
+            self._escribir(ruta, datos)
+        except OSError:
+            # Sin almacén en disco la caché sigue funcionando en memoria.
+            return entrada
+
+        with self._candado:
+            if self._tamano_disco is not None:
+                self._tamano_disco += len(datos) - anterior_tamano
+            excedido = self._tamano_disco is None or self._tamano_disco > self.max_bytes
+        if excedido:
+            self._desalojar()
+        return entrada
+
+    def _escribir(self, ruta, datos):
+        """Escribe un archivo de forma atómica; si falla, elimina el temporal."""
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as archivo:
+                archivo.write(datos)
+            os.replace(temporal, ruta)
+        except BaseException:
+            self._eliminar(temporal)
+            raise
+
+    def _eliminar(self, ruta):
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+
+    def _desalojar(self):
+        """
+        Elimina los archivos usados hace más tiempo hasta respetar max_bytes.
+
+        Recorre el directorio, así que solo se llama la primera vez y cuando el
+        tamaño estimado supera max_bytes; el recorrido corrige la estimación
+        con los archivos que hayan escrito o borrado otros procesos.
+        """
+        archivos = []
+        total = 0
+        with os.scandir(self.directorio) as entradas:
+            for entrada in entradas:
+                if entrada.name.endswith(_EXTENSION) and entrada.is_file():
+                    info = entrada.stat()
+                    archivos.append((info.st_mtime, info.st_size, entrada.path))
+                    total += info.st_size
+        archivos.sort()
+        limite = self.max_bytes if total <= self.max_bytes else self.max_bytes * _FRACCION_DESALOJO
+        for _, tamano, ruta in archivos:
+            if total <= limite:
+                break
+            self._eliminar(ruta)
+            total -= tamano
+        with self._candado:
+            self._tamano_disco = total
+
+    def limpiar(self):
+        """Vacía la caché en memoria y elimina todos los archivos del almacén en disco."""
+        with self._candado:
+            self._memoria.clear()
+            self._tamano_disco = None
+        if self.directorio is None or not os.path.isdir(self.directorio):
+            return
+        with os.scandir(self.directorio) as entradas:
+            for entrada in entradas:
+                if entrada.name.endswith(_EXTENSION):
+                    self._eliminar(entrada.path)
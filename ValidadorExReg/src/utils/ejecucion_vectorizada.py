@@ -0,0 +1,200 @@
+"""
+Ejecución por lotes de un AutomataDeterminista con NumPy.
+
+Las cadenas se codifican por ventanas como matrices de índices de símbolo y
+todas avanzan a la vez por la tabla de transiciones: en cada posición se hace
+una sola indexación de NumPy sobre la tabla para todas las cadenas que siguen
+vivas. NumPy es opcional; sin él, aceptar_cadenas recurre a la ejecución
+cadena por cadena de AutomataDeterminista.accepts.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+HAY_NUMPY = np is not None
+
+class EjecutorVectorizado:
+    """
+    Ejecuta un AFD sobre muchas cadenas a la vez.
+
+    La tabla se amplía con un estado sumidero explícito (el último), con una
+    columna para los caracteres que no pertenecen al alfabeto y con una
+    columna de fin de cadena que deja cada estado donde está, de modo que la
+    función de transición es total y las cadenas ya terminadas pueden seguir
+    avanzando sin cambiar de estado. La tabla guarda cada destino multiplicado
+    por el ancho de la fila, así que un paso es una suma y una indexación.
+
+    Las cadenas avanzan por ventanas de posiciones: en cada ventana solo se
+    codifican los caracteres de las cadenas que siguen vivas, y al terminarla
+    se descartan las que han caído en el sumidero o se han terminado. Una
+    cadena que se bloquea pronto no se codifica entera ni sigue avanzando, y
+    el lote termina en cuanto no queda ninguna viva. La ventana empieza en
+    VENTANA_INICIAL posiciones y se duplica en cada vuelta, acotada por
+    CELDAS_BLOQUE celdas.
+
+    Attributes:
+        afd (AutomataDeterminista): El autómata ejecutado.
+    """
+
+    # Celdas de la matriz de símbolos de cada ventana; acota la memoria usada.
+    CELDAS_BLOQUE = 1 << 22
+    # Posiciones de la primera ventana.
+    VENTANA_INICIAL = 16
+
+    def __init__(self, afd):
+        """
+        Prepara las tablas de NumPy del autómata.
+
+        Args:
+            afd (AutomataDeterminista): El autómata a ejecutar; sus símbolos
+                deben ser caracteres individuales.
+
+        Raises:
+            RuntimeError: Si NumPy no está instalado.
+            ValueError: Si algún símbolo del alfabeto no es un único carácter.
+        """
+        if np is None:
+            raise RuntimeError("EjecutorVectorizado necesita NumPy")
+        if any(len(simbolo) != 1 for simbolo in afd.alfabeto):
+            raise ValueError("Los símbolos del autómata deben ser caracteres individuales")
+
+        self.afd = afd
+        num_estados = afd.num_estados
+        ancho = len(afd.alfabeto)
+        self._sumidero = num_estados
+        # Columnas ampliadas: ancho para los caracteres fuera del alfabeto y
+        # ancho + 1 para las posiciones posteriores al final de la cadena.
+        self._fuera = ancho
+        self._fin = ancho + 1
+        self._ancho = ancho + 2
+
+        tabla = np.full((num_estados + 1, self._ancho), num_estados, dtype=np.int64)
+        if num_estados and ancho:
+            original = np.array(afd.tabla, dtype=np.int64).reshape(num_estados, ancho)
+            tabla[:num_estados, :ancho] = np.where(original >= 0, original, num_estados)
+        tabla[:, self._fin] = np.arange(num_estados + 1)
+        self._tabla = tabla.ravel() * self._ancho
+
+        self._finales = np.zeros(num_estados + 1, dtype=bool)
+        self._finales[:num_estados] = np.frombuffer(bytes(afd.finales), dtype=np.uint8) != 0
+
+        # Índice de símbolo de cada punto de código hasta el mayor del
+        # alfabeto; la última entrada (columna de fuera del alfabeto) cubre el resto.
+        mayor = max((ord(simbolo) for simbolo in afd.alfabeto), default=-1)
+        tipo = np.uint8 if self._ancho <= 256 else np.int32
+        self._simbolos = np.full(mayor + 2, self._fuera, dtype=tipo)
+        for indice, simbolo in enumerate(afd.alfabeto):
+            self._simbolos[ord(simbolo)] = indice
+
+    def codificar(self, cadenas):
+        """
+        Codifica las cadenas como índices de símbolo, concatenadas.
+
+        Args:
+            cadenas (list): Las cadenas a codificar.
+
+        Returns:
+            tuple: (códigos, longitudes) como arreglos de NumPy; los caracteres
+                fuera del alfabeto se codifican con la columna del sumidero.
+        """
+        longitudes = np.fromiter(map(len, cadenas), dtype=np.int64, count=len(cadenas))
+        return self._codigos(''.join(cadenas)), longitudes
+
+    def _codigos(self, texto):
+        """Codifica un texto como índices de símbolo."""
+        puntos = np.frombuffer(texto.encode('utf-32-le'), dtype=np.uint32)
+        return self._simbolos[np.minimum(puntos, len(self._simbolos) - 1)]
+
+    def _ejecutar(self, cadenas):
+        """Devuelve el estado alcanzado por cada cadena en la tabla ampliada."""
+        longitudes = np.fromiter(map(len, cadenas), dtype=np.int64, count=len(cadenas))
+        resultado = np.full(len(cadenas), self.afd.estado_inicial * self._ancho, dtype=np.int64)
+        # Filas vivas: índice de entrada, cadena, longitud y estado actual.
+        filas = np.flatnonzero(longitudes)
+        if len(filas) == len(cadenas):
+            vivas = cadenas
+        else:
+            vivas = [cadenas[i] for i in filas.tolist()]
+        longitudes = longitudes[filas]
+        estados = resultado[filas]
+
+        tabla = self._tabla
+        sumidero = self._sumidero * self._ancho
+        posicion = 0
+        ventana = self.VENTANA_INICIAL
+        while len(filas):
+            # Símbolos de la ventana, una fila por cadena; las posiciones
+            # posteriores al final de cada cadena quedan en la columna de fin.
+            fin = posicion + ventana
+            restantes = np.minimum(longitudes - posicion, ventana)
+            matriz = np.full((len(filas), ventana), self._fin, dtype=self._simbolos.dtype)
+            if posicion == 0 and fin >= int(longitudes.max()):
+                # Todas las cadenas caben enteras en la primera ventana.
+                trozos = vivas
+            else:
+                trozos = [cadena[posicion:fin] for cadena in vivas]
+            matriz[np.arange(ventana)[None, :] < restantes[:, None]] = self._codigos(''.join(trozos))
+            # Traspuesta para que los símbolos de cada paso sean contiguos.
+            matriz = np.ascontiguousarray(matriz.T)
+
+            siguiente = np.empty_like(estados)
+            for simbolos in matriz[:int(restantes.max())]:
+                np.add(estados, simbolos, out=siguiente)
+                np.take(tabla, siguiente, out=estados)
+
+            posicion = fin
+            siguen = (estados != sumidero) & (longitudes > posicion)
+            if not siguen.all():
+                terminadas = ~siguen
+                resultado[filas[terminadas]] = estados[terminadas]
+                indices = np.flatnonzero(siguen)
+                filas = filas[indices]
+                estados = estados[indices]
+                longitudes = longitudes[indices]
+                vivas = [vivas[i] for i in indices.tolist()]
+            ventana = min(2 * ventana,
+                          max(self.VENTANA_INICIAL, self.CELDAS_BLOQUE // max(1, len(filas))))
+        return resultado // self._ancho
+
+    def estados_finales(self, cadenas):
+        """
+        Obtiene el estado alcanzado por cada cadena.
+
+        Args:
+            cadenas (list): Las cadenas a procesar.
+
+        Returns:
+            numpy.ndarray: Estado alcanzado por cada cadena, en el orden de
+                entrada; -1 si el autómata se bloquea.
+        """
+        estados = self._ejecutar(cadenas)
+        estados[estados == self._sumidero] = -1
+        return estados
+
+    def aceptar(self, cadenas):
+        """
+        Indica qué cadenas acepta el autómata.
+
+        Args:
+            cadenas (list): Las cadenas a evaluar.
+
+        Returns:
+            numpy.ndarray: Vector booleano con la aceptación de cada cadena.
+        """
+        return self._finales[self._ejecutar(cadenas)]
+
+def aceptar_cadenas(afd, cadenas):
+    """
+    Evalúa un lote de cadenas con el ejecutor vectorizado si NumPy está disponible.
+
+    Args:
+        afd (AutomataDeterminista): El autómata a ejecutar.
+        cadenas (list): Las cadenas a evaluar.
+
+    Returns:
+        list: True o False para cada cadena, en el orden de entrada.
+    """
+    if np is None or any(len(simbolo) != 1 for simbolo in afd.alfabeto):
+        return [afd.accepts(cadena) for cadena in cadenas]
+    return EjecutorVectorizado(afd).aceptar(cadenas).tolist()
@@ -0,0 +1,234 @@
+"""
+Instrumentación opcional de los caminos críticos de la aplicación.
+
+Las métricas están desactivadas por defecto. Los puntos instrumentados
+comprueban primero metricas.activo, de modo que con la instrumentación
+desactivada su coste es la lectura de un atributo; solo al activarla se toman
+tiempos y se actualizan los contadores.
+
+Uso:
+
+    from src.utils.metricas import metricas
+    metricas.activar()
+    ...
+    metricas.instantanea()
+"""
+import math
+import os
+import threading
+import time
+
+# Límites superiores (en segundos) de los intervalos de los histogramas.
+LIMITES_HISTOGRAMA = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0, math.inf)
+
+class Histograma:
+    """
+    Histograma de duraciones con intervalos por décadas.
+
+    Attributes:
+        cantidad (int): Número de observaciones.
+        total (float): Suma de las observaciones, en segundos.
+        minimo (float): Observación más pequeña.
+        maximo (float): Observación más grande.
+        intervalos (list): Número de observaciones de cada intervalo de LIMITES_HISTOGRAMA.
+    """
+    __slots__ = ('cantidad', 'total', 'minimo', 'maximo', 'intervalos')
+
+    def __init__(self):
+        self.cantidad = 0
+        self.total = 0.0
+        self.minimo = math.inf
+        self.maximo = 0.0
+        self.intervalos = [0] * len(LIMITES_HISTOGRAMA)
+
+    def observar(self, segundos, veces=1):
+        """
+        Registra una duración.
+
+        Args:
+            segundos (float): La duración observada.
+            veces (int): Número de observaciones que representa (para lotes).
+        """
+        self.cantidad += veces
+        self.total += segundos * veces
+        self.minimo = min(self.minimo, segundos)
+        self.maximo = max(self.maximo, segundos)
+        for indice, limite in enumerate(LIMITES_HISTOGRAMA):
+            if segundos <= limite:
+                self.intervalos[indice] += veces
+                break
+
+    def a_dict(self):
+        """
+        Obtiene el resumen del histograma.
+
+        Returns:
+            dict: Cantidad, total, mínimo, máximo, media e intervalos no vacíos.
+        """
+        return {
+            'cantidad': self.cantidad,
+            'total': self.total,
+            'minimo': self.minimo if self.cantidad else 0.0,
+            'maximo': self.maximo,
+            'media': self.total / self.cantidad if self.cantidad else 0.0,
+            'intervalos': {
+                ('<=' + format(limite, 'g') if limite != math.inf else '>10'): cantidad
+                for limite, cantidad in zip(LIMITES_HISTOGRAMA, self.intervalos)
+                if cantidad
+            },
+        }
+
+class Metricas:
+    """
+    Registro de contadores, valores e histogramas de duración.
+
+    Las métricas con etiqueta (por ejemplo, el patrón al que corresponde una
+    duración) se guardan bajo la clave 'nombre[etiqueta]'.
+
+    Attributes:
+        activo (bool): Si es False, los puntos instrumentados no registran nada.
+    """
+
+    def __init__(self):
+        self.activo = False
+        self._contadores = {}
+        self._valores = {}
+        self._histogramas = {}
+        self._inicio = time.time()
+        self._candado = threading.Lock()
+        self._volcado = None
+
+    def activar(self):
+        """Activa el registro de métricas."""
+        self.activo = True
+
+    def desactivar(self):
+        """Desactiva el registro de métricas y detiene el volcado periódico."""
+        self.activo = False
+        self.detener_volcado()
+
+    @staticmethod
+    def _clave(nombre, etiqueta):
+        return nombre if etiqueta is None else f'{nombre}[{etiqueta}]'
+
+    def incrementar(self, nombre, cantidad=1, etiqueta=None):
+        """
+        Suma una cantidad a un contador.
+
+        Args:
+            nombre (str): Nombre del contador.
+            cantidad (int): Cantidad a sumar.
+            etiqueta (str, optional): Etiqueta del contador.
+        """
+        clave = self._clave(nombre, etiqueta)
+        with self._candado:
+            self._contadores[clave] = self._contadores.get(clave, 0) + cantidad
+
+    def fijar(self, nombre, valor, etiqueta=None):
+        """
+        Fija el valor actual de una métrica, como el número de estados de un autómata.
+
+        Args:
+            nombre (str): Nombre de la métrica.
+            valor (float): Valor actual.
+            etiqueta (str, optional): Etiqueta de la métrica.
+        """
+        with self._candado:
+            self._valores[self._clave(nombre, etiqueta)] = valor
+
+    def observar(self, nombre, segundos, etiqueta=None, veces=1):
+        """
+        Registra una duración en un histograma.
+
+        Args:
+            nombre (str): Nombre del histograma.
+            segundos (float): La duración observada.
+            etiqueta (str, optional): Etiqueta del histograma.
+            veces (int): Número de observaciones que representa.
+        """
+        clave = self._clave(nombre, etiqueta)
+        with self._candado:
+            histograma = self._histogramas.get(clave)
+            if histograma is None:
+                histograma = self._histogramas[clave] = Histograma()
+            histograma.observar(segundos, veces)
+
+    def instantanea(self):
+        """
+        Obtiene una copia de todas las métricas registradas.
+
+        Returns:
+            dict: Segundos desde el inicio del registro, contadores, valores e histogramas.
+        """
+        with self._candado:
+            return {
+                'activo': self.activo,
+                'segundos': time.time() - self._inicio,
+                'contadores': dict(self._contadores),
+                'valores': dict(self._valores),
+                'histogramas': {clave: histograma.a_dict()
+                                for clave, histograma in self._histogramas.items()},
+            }
+
+    def reiniciar(self):
+        """Elimina todas las métricas registradas."""
+        with self._candado:
+            self._contadores.clear()
+            self._valores.clear()
+            self._histogramas.clear()
+            self._inicio = time.time()
+
+    def volcar(self, ruta, extra=None):
+        """
+        Escribe la instantánea de las métricas en un archivo JSON de forma atómica.
+
+        Args:
+            ruta (str): Ruta del archivo.
+            extra (Callable[[], dict], optional): Devuelve datos adicionales para el volcado.
+        """
+        # Importaciones diferidas: solo se necesitan al volcar, no al arrancar.
+        import json
+        import tempfile
+
+        datos = self.instantanea()
+        if extra is not None:
+            datos.update(extra())
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix='.tmp')
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as archivo:
+            json.dump(datos, archivo, indent=2, ensure_ascii=False)
+        os.replace(temporal, ruta)
+
+    def iniciar_volcado(self, ruta, intervalo=60.0, extra=None):
+        """
+        Vuelca las métricas periódicamente en un hilo de fondo.
+
+        Args:
+            ruta (str): Ruta del archivo JSON.
+            intervalo (float): Segundos entre volcados.
+            extra (Callable[[], dict], optional): Devuelve datos adicionales para cada volcado.
+        """
+        self.detener_volcado()
+        detener = threading.Event()
+
+        def volcar_periodicamente():
+            while not detener.wait(intervalo):
+                try:
+                    self.volcar(ruta, extra)
+                except OSError:
+                    pass
+
+        hilo = threading.Thread(target=volcar_periodicamente, name='volcado-metricas', daemon=True)
+        self._volcado = (detener, hilo)
+        hilo.start()
+
+    def detener_volcado(self):
+        """Detiene el volcado periódico, si está en marcha."""
+        if self._volcado is not None:
+            detener, hilo = self._volcado
+            detener.set()
+            hilo.join()
+            self._volcado = None
+
+# Registro compartido por toda la aplicación.
+metricas = Metricas()
@@ -0,0 +1,136 @@
+"""
+Tokenizador y analizador sintáctico de las expresiones de GeneradorAutomata.
+
+La gramática reconoce símbolos literales, la unión '|', los grupos '( )' y los
+operadores posfijos '*' y '+'. Todo el análisis se hace en una sola pasada con
+pilas explícitas, de modo que el tiempo y la memoria crecen linealmente con la
+longitud de la expresión, sin importar la profundidad de anidamiento.
+"""
+
+# Tipos de token
+LITERAL = 'literal'
+UNION = '|'
+ABRE = '('
+CIERRA = ')'
+ESTRELLA = '*'
+MAS = '+'
+
+# Tipos de nodo del árbol sintáctico (además de LITERAL, ESTRELLA y MAS)
+CONCATENACION = 'concatenacion'
+ALTERNATIVA = 'alternativa'
+VACIO = 'vacio'
+
+_OPERADORES = {'|': UNION, '(': ABRE, ')': CIERRA, '*': ESTRELLA, '+': MAS}
+
+class Token:
+    """
+    Token de una expresión regular.
+
+    Attributes:
+        tipo (str): Tipo del token.
+        valor (str): Carácter de la expresión que lo originó.
+        posicion (int): Posición del carácter en la expresión.
+    """
+    __slots__ = ('tipo', 'valor', 'posicion')
+
+    def __init__(self, tipo, valor, posicion):
+        self.tipo = tipo
+        self.valor = valor
+        self.posicion = posicion
+
+    def __repr__(self):
+        return f'Token({self.tipo!r}, {self.valor!r}, {self.posicion})'
+
+class Nodo:
+    """
+    Nodo del árbol sintáctico.
+
+    Attributes:
+        tipo (str): LITERAL, CONCATENACION, ALTERNATIVA, ESTRELLA, MAS o VACIO.
+        valor (str): Símbolo de los nodos LITERAL; None en el resto.
+        hijos (list): Subárboles del nodo.
+    """
+    __slots__ = ('tipo', 'valor', 'hijos')
+
+    def __init__(self, tipo, valor=None, hijos=()):
+        self.tipo = tipo
+        self.valor = valor
+        self.hijos = list(hijos)
+
+    def __repr__(self):
+        if self.tipo == LITERAL:
+            return f'Nodo({self.tipo!r}, {self.valor!r})'
+        return f'Nodo({self.tipo!r}, hijos={self.hijos!r})'
+
+def tokenizar(expr):
+    """
+    Divide una expresión en tokens.
+
+    Args:
+        expr (str): La expresión regular.
+
+    Returns:
+        list: Lista de Token en el orden de la expresión.
+    """
+    return [Token(_OPERADORES.get(caracter, LITERAL), caracter, posicion)
+            for posicion, caracter in enumerate(expr)]
+
+def _cerrar_secuencia(secuencia):
+    """Convierte una secuencia de nodos en un único nodo."""
+    if not secuencia:
+        return Nodo(VACIO)
+    if len(secuencia) == 1:
+        return secuencia[0]
+    return Nodo(CONCATENACION, hijos=secuencia)
+
+def _cerrar_grupo(alternativas, secuencia):
+    """Convierte las alternativas de un grupo en un único nodo."""
+    alternativas.append(_cerrar_secuencia(secuencia))
+    if len(alternativas) == 1:
+        return alternativas[0]
+    return Nodo(ALTERNATIVA, hijos=alternativas)
+
+def parsear(expr):
+    """
+    Construye el árbol sintáctico de una expresión.
+
+    Args:
+        expr (str): La expresión regular.
+
+    Returns:
+        Nodo: Raíz del árbol sintáctico.
+
+    Raises:
+        ValueError: Si la expresión está mal formada.
+    """
+    tokens = tokenizar(expr)
+
+    # Cada grupo abierto guarda sus alternativas cerradas, la secuencia en curso
+    # y la posición de su paréntesis de apertura (None en el nivel superior).
+    grupos = [([], [], None)]
+    for indice, token in enumerate(tokens):
+        alternativas, secuencia, apertura = grupos[-1]
+        if token.tipo == LITERAL:
+            secuencia.append(Nodo(LITERAL, token.valor))
+        elif token.tipo == ABRE:
+            grupos.append(([], [], token.posicion))
+        elif token.tipo == CIERRA:
+            if apertura is None:
+                raise ValueError(f"Paréntesis de cierre sin apertura en la posición {token.posicion}")
+            grupos.pop()
+            grupos[-1][1].append(_cerrar_grupo(alternativas, secuencia))
+        elif token.tipo == UNION:
+            alternativas.append(_cerrar_secuencia(secuencia))
+            grupos[-1] = (alternativas, [], apertura)
+        else:
+            anterior = tokens[indice - 1].tipo if indice else None
+            if anterior in (None, ABRE, UNION):
+                raise ValueError(
+                    f"El operador '{token.valor}' de la posición {token.posicion} no tiene operando"
+                )
+            secuencia.append(Nodo(token.tipo, hijos=[secuencia.pop()]))
+
+    alternativas, secuencia, apertura = grupos.pop()
+    if apertura is not None:
+        raise ValueError(f"Paréntesis sin cerrar en la posición {apertura}")
+    return _cerrar_grupo(alternativas, secuencia)
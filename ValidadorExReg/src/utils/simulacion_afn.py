@@ -0,0 +1,222 @@
+from src.utils.automata_compacto import AutomataCompacto
+from src.utils.automata_determinista import EPSILON, cerraduras_epsilon
+
+class SimuladorAFN:
+    """
+    Simulación de Thompson de un AFN con el conjunto de estados activos como bitset.
+
+    El estado e es el bit e % 8 del byte e // 8 del bitset. Para cada símbolo,
+    los bytes con algún estado con transición forman un bloque y, para cada
+    bloque, se precalcula una tabla indexada por el subconjunto de sus estados
+    activos con la unión de los destinos ya cerrados por épsilon, así que
+    avanzar un carácter es, por cada bloque del símbolo, un AND, una consulta
+    a la tabla y un OR, sin recorrer los estados activos uno a uno. Un AFN de
+    Thompson tiene pocos estados con transiciones por cada símbolo, así que un
+    paso son unas pocas operaciones. El tiempo es lineal en la longitud de la
+    cadena.
+
+    Hasta LIMITE_ENTERO estados, el bitset es un entero de Python y cada
+    entrada de las tablas es un entero: las operaciones con enteros de pocas
+    palabras son las más rápidas. En autómatas mayores un entero del tamaño
+    del autómata haría que cada desplazamiento y cada OR costaran O(n / 64) y
+    que las tablas ocuparan O(n² / 64). Ahí el bitset es un bytearray, cada
+    entrada guarda solo los pares (byte, valor) que cambia y un paso recorre
+    los bytes activos en lugar de todos los bloques del símbolo, así que no
+    depende del tamaño del autómata. Las entradas de más de un estado se
+    calculan la primera vez que se usan, de modo que las tablas quedan
+    acotadas por el número de estados × 2 ** 8 entradas pequeñas y en la
+    práctica solo ocupan las que recorren las cadenas.
+
+    Attributes:
+        num_estados (int): Número de estados del autómata simulado.
+    """
+
+    # Estados por bloque (un byte); cada tabla tiene como mucho 2 ** 8 entradas.
+    ANCHO_BLOQUE = 8
+    # Número máximo de estados para simular con enteros en lugar de un bytearray.
+    LIMITE_ENTERO = 256
+
+    def __init__(self, automata):
+        """
+        Precalcula las tablas de un autómata generado por GeneradorAutomata.
+
+        Args:
+            automata (Automata | AutomataCompacto): El autómata no determinista a simular.
+        """
+        automata = AutomataCompacto.desde_automata(automata)
+        self.num_estados = automata.num_estados
+        self._num_bytes = (self.num_estados + 7) // 8
+        self._enteros = self.num_estados <= self.LIMITE_ENTERO
+
+        cierres = [self._empaquetar(cerradura) for cerradura in cerraduras_epsilon(automata)]
+
+        # Por símbolo, los destinos (ya cerrados por épsilon) de cada estado
+        # con alguna transición, como {byte: valor}.
+        por_simbolo = {}
+        for estado in range(self.num_estados):
+            for indice, destino in zip(*automata.fila(estado)):
+                simbolo = automata.simbolos[indice]
+                if simbolo != EPSILON:
+                    destinos = por_simbolo.setdefault(simbolo, {}).setdefault(estado, {})
+                    for byte, valor in cierres[destino].items():
+                        destinos[byte] = destinos.get(byte, 0) | valor
+        self._transiciones = {simbolo: self._bloques(destinos)
+                              for simbolo, destinos in por_simbolo.items()}
+
+        self._finales = automata.finales
+        inicial = bytearray(self._num_bytes)
+        for byte, valor in cierres[automata.inicial].items():
+            inicial[byte] = valor
+        self._inicial = int.from_bytes(inicial, 'little') if self._enteros else inicial
+
+    @staticmethod
+    def _empaquetar(estados):
+        """Convierte un conjunto de estados en {byte: valor} con los bytes no nulos."""
+        bytes_ = {}
+        for estado in estados:
+            bytes_[estado >> 3] = bytes_.get(estado >> 3, 0) | 1 << (estado & 7)
+        return bytes_
+
+    def _bloques(self, destinos):
+        """
+        Precalcula las tablas por bloque de las transiciones de un símbolo.
+
+        Con enteros, tabla[sub] es la unión de los destinos de los estados del
+        subconjunto sub del bloque y todas las entradas se calculan aquí. Con
+        bytearray, cada entrada son los pares (byte, valor) de esa unión; aquí
+        solo se calculan las de un estado, y las demás se añaden a la tabla la
+        primera vez que se necesitan (ver _union), porque una cadena real solo
+        recorre unos pocos subconjuntos de cada bloque.
+
+        Args:
+            destinos (dict): Destinos de cada estado con transición, como {byte: valor}.
+
+        Returns:
+            tuple | dict: Con enteros, tuplas (byte, filtro, tabla); con
+                bytearray, {byte: (filtro, tabla, pares de cada bit)}.
+        """
+        por_bloque = {}
+        for estado, bytes_ in destinos.items():
+            por_bloque.setdefault(estado >> 3, {})[estado & 7] = bytes_
+
+        bloques = []
+        for bloque, bits in sorted(por_bloque.items()):
+            filtro = 0
+            for bit in bits:
+                filtro |= 1 << bit
+            if not self._enteros:
+                pares = [None] * self.ANCHO_BLOQUE
+                for bit, bytes_ in bits.items():
+                    pares[bit] = tuple(sorted(bytes_.items()))
+                tabla = {1 << bit: pares[bit] for bit in bits}
+                bloques.append((bloque, (filtro, tabla, tuple(pares))))
+                continue
+
+            mascaras = {bit: sum(valor << 8 * byte for byte, valor in bytes_.items())
+                        for bit, bytes_ in bits.items()}
+            # Cada subconjunto se obtiene del anterior sin su bit más bajo,
+            # recorriendo los subconjuntos del filtro en orden creciente.
+            tabla = {0: 0}
+            sub = filtro & -filtro
+            while sub:
+                bajo = sub & -sub
+                tabla[sub] = tabla[sub ^ bajo] | mascaras[bajo.bit_length() - 1]
+                sub = (sub - filtro) & filtro
+            bloques.append((bloque, filtro, tabla))
+        return tuple(bloques) if self._enteros else dict(bloques)
+
+    @staticmethod
+    def _union(pares, parte):
+        """Une los pares (byte, valor) de los bits de parte."""
+        union = {}
+        while parte:
+            bajo = parte & -parte
+            for byte, valor in pares[bajo.bit_length() - 1]:
+                union[byte] = union.get(byte, 0) | valor
+            parte ^= bajo
+        return tuple(sorted(union.items()))
+
+    def run(self, cadena):
+        """
+        Simula el autómata sobre una cadena.
+
+        Args:
+            cadena (str): La cadena a procesar.
+
+        Returns:
+            int: Bitset de los estados activos al terminar (0 si el autómata se bloquea).
+        """
+        if self._enteros:
+            return self._run_entero(cadena)
+        transiciones = self._transiciones
+        num_bytes = self._num_bytes
+        activos = self._inicial
+        # Solo se recorren los bytes con algún estado activo.
+        indices = [byte for byte, valor in enumerate(activos) if valor]
+        for caracter in cadena:
+            bloques = transiciones.get(caracter)
+            if bloques is None:
+                return 0
+            siguientes = bytearray(num_bytes)
+            nuevos = []
+            for byte in indices:
+                bloque = bloques.get(byte)
+                if bloque is None:
+                    continue
+                filtro, tabla, pares = bloque
+                parte = activos[byte] & filtro
+                if parte:
+                    entrada = tabla.get(parte)
+                    if entrada is None:
+                        entrada = tabla[parte] = self._union(pares, parte)
+                    for destino, valor in entrada:
+                        if not siguientes[destino]:
+                            nuevos.append(destino)
+                        siguientes[destino] |= valor
+            if not nuevos:
+                return 0
+            activos = siguientes
+            indices = nuevos
+        return int.from_bytes(activos, 'little')
+
+    def _run_entero(self, cadena):
+        """Simula el autómata sobre una cadena con el bitset como entero."""
+        transiciones = self._transiciones
+        activos = self._inicial
+        for caracter in cadena:
+            bloques = transiciones.get(caracter)
+            if bloques is None:
+                return 0
+            siguientes = 0
+            for byte, filtro, tabla in bloques:
+                parte = activos >> 8 * byte & filtro
+                if parte:
+                    siguientes |= tabla[parte]
+            activos = siguientes
+            if not activos:
+                return 0
+        return activos
+
+    def accepts(self, cadena):
+        """
+        Indica si el autómata acepta la cadena completa.
+
+        Args:
+            cadena (str): La cadena a evaluar.
+
+        Returns:
+            bool: True si algún estado activo al terminar es final.
+        """
+        return bool(self.run(cadena) & self._finales)
+
+    def validar_cadenas(self, cadenas):
+        """
+        Valida una lista de cadenas contra el autómata.
+
+        Args:
+            cadenas (list): Lista de cadenas a validar.
+
+        Returns:
+            list: Lista de resultados (cadena, es_válida), como RegexModel.validate_strings.
+        """
+        return [(cadena, self.accepts(cadena)) for cadena in cadenas]
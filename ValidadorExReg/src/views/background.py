@@ -0,0 +1,177 @@
+import queue
+import threading
+
+class TaskCancelled(Exception):
+    """Se lanza dentro de una tarea cuando fue cancelada o reemplazada."""
+
+class Task:
+    """
+    Tarea en segundo plano.
+
+    Attributes:
+        kind (str): Tipo de tarea; una tarea nueva del mismo tipo reemplaza a la anterior.
+        task_id (int): Identificador único de la tarea.
+    """
+
+    def __init__(self, kind, task_id, results):
+        self.kind = kind
+        self.task_id = task_id
+        self._results = results
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        """bool: True si la tarea fue cancelada o reemplazada."""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Solicita la cancelación; la tarea la atiende en su siguiente comprobación."""
+        self._cancelled.set()
+
+    def check_cancelled(self):
+        """
+        Interrumpe la tarea si fue cancelada.
+
+        Raises:
+            TaskCancelled: Si la tarea fue cancelada o reemplazada.
+        """
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+
+    def report_progress(self, fraction):
+        """
+        Informa el avance de la tarea al hilo de Tk.
+
+        Args:
+            fraction (float): Avance entre 0 y 1.
+        """
+        self._results.put((self, 'progress', fraction))
+
+class BackgroundRunner:
+    """
+    Ejecuta tareas fuera del hilo de Tk y entrega sus resultados en ese hilo.
+
+    Las tareas corren en un ThreadPoolExecutor; sus resultados, errores y
+    avances se envían por una cola que el hilo de Tk sondea con after(), de
+    modo que los callbacks siempre se ejecutan en el hilo de la interfaz. Al
+    enviar una tarea se cancela la anterior del mismo tipo y cualquier
+    resultado tardío de una tarea cancelada se descarta.
+
+    Attributes:
+        root (tk.Misc): Widget usado para programar el sondeo.
+        poll_ms (int): Intervalo de sondeo de la cola, en milisegundos.
+    """
+
+    def __init__(self, root, poll_ms=50, max_workers=2):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            root (tk.Misc): Widget usado para programar el sondeo.
+            poll_ms (int): Intervalo de sondeo de la cola, en milisegundos.
+            max_workers (int): Número de hilos de fondo.
+        """
+        self.root = root
+        self.poll_ms = poll_ms
+        self.max_workers = max_workers
+        self._executor = None
+        self._results = queue.Queue()
+        self._active = {}
+        self._callbacks = {}
+        self._next_id = 0
+        self._polling = False
+
+    @property
+    def busy(self):
+        """bool: True si hay alguna tarea en curso."""
+        return bool(self._active)
+
+    def submit(self, kind, func, on_done, on_error=None, on_progress=None):
+        """
+        Envía una tarea, reemplazando la tarea en curso del mismo tipo.
+
+        Args:
+            kind (str): Tipo de la tarea.
+            func (Callable[[Task], object]): Trabajo a ejecutar en segundo plano.
+            on_done (Callable[[object], None]): Recibe el resultado en el hilo de Tk.
+            on_error (Callable[[Exception], None], optional): Recibe el error en el hilo de Tk.
+            on_progress (Callable[[float], None], optional): Recibe el avance en el hilo de Tk.
+
+        Returns:
+            Task: La tarea enviada.
+        """
+        previous = self._active.pop(kind, None)
+        if previous is not None:
+            previous.cancel()
+
+        self._next_id += 1
+        task = Task(kind, self._next_id, self._results)
+        self._active[kind] = task
+        self._callbacks[task.task_id] = (on_done, on_error, on_progress)
+        if self._executor is None:
+            # Importación diferida: los hilos de fondo no se crean hasta la primera tarea.
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._executor.submit(self._run, task, func)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return task
+
+    def cancel_all(self):
+        """Cancela todas las tareas en curso."""
+        for task in self._active.values():
+            task.cancel()
+        self._active.clear()
+
+    def _run(self, task, func):
+        """Ejecuta la tarea en un hilo de fondo y encola su desenlace."""
+        try:
+            task.check_cancelled()
+            result = func(task)
+        except TaskCancelled:
+            self._results.put((task, 'cancelled', None))
+        except Exception as error:
+            self._results.put((task, 'error', error))
+        else:
+            self._results.put((task, 'done', result))
+
+    def _poll(self):
+        """Despacha en el hilo de Tk los mensajes encolados por las tareas."""
+        while True:
+            try:
+                task, event, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            finished = event in ('done', 'error', 'cancelled')
+            on_done, on_error, on_progress = (
+                self._callbacks.pop(task.task_id) if finished
+                else self._callbacks.get(task.task_id, (None, None, None))
+            )
+            current = self._active.get(task.kind) is task and not task.cancelled
+            if finished and self._active.get(task.kind) is task:
+                del self._active[task.kind]
+            if not current:
+                continue
+
+            if event == 'progress' and on_progress is not None:
+                on_progress(payload)
+            elif event == 'done':
+                on_done(payload)
+            elif event == 'error':
+                if on_error is None:
+                    raise payload
+                on_error(payload)
+
+        if self._callbacks:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        """Cancela las tareas en curso y libera los hilos de fondo."""
+        self.cancel_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
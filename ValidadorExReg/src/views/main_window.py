@@ -1,10 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
 from src.controllers.regex_controller import RegexController
-from src.utils.automata_generator import probar_automata
+from src.views.background import BackgroundRunner
+from src.views.results_panel import ResultsPanel
+from src.views.syntax_highlighter import SyntaxHighlighter
 import os
-import re
 
 class MainWindow:
     """
@@ -40,6 +40,7 @@ class MainWindow:
         }
 
         self.root.configure(bg=self.colors['bg'])
+        self.runner = BackgroundRunner(self.root)
         self._init_styles()
         self._init_ui()
 
@@ -142,7 +143,6 @@ class MainWindow:
 
         self.regex_text = self._create_modern_text(regex_frame, height=2)
         self.regex_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
-        self.regex_text.bind("<KeyRelease>", self._highlight_syntax)
 
         # Frame para las cadenas de prueba
         test_frame = ttk.LabelFrame(
@@ -156,6 +156,23 @@ class MainWindow:
         self.test_text = self._create_modern_text(test_frame, height=8)
         self.test_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
 
+        # Validación en vivo: se vuelve a validar al editar las cadenas
+        self.live_validation = tk.BooleanVar(value=False)
+        self._live_pending = None
+        tk.Checkbutton(
+            test_frame,
+            text="Validación en vivo",
+            variable=self.live_validation,
+            command=self._on_live_toggle,
+            bg=self.colors['bg'],
+            fg=self.colors['text'],
+            selectcolor=self.colors['secondary'],
+            activebackground=self.colors['bg'],
+            activeforeground=self.colors['highlight'],
+            highlightthickness=0
+        ).grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        self.test_text.bind("<<Modified>>", self._on_test_modified)
+
         # Frame para los botones con diseño moderno
         buttons_frame = ttk.Frame(main_frame, style="Modern.TFrame")
         buttons_frame.grid(row=3, column=0, pady=(0, 20))
@@ -181,6 +198,27 @@ class MainWindow:
             )
             btn.grid(row=0, column=idx, padx=10)
 
+        # Progreso y cancelación de las tareas en segundo plano
+        progress_container = ttk.Frame(buttons_frame, style="Modern.TFrame")
+        progress_container.grid(row=1, column=0, pady=(15, 0))
+
+        self.progress = ttk.Progressbar(
+            progress_container,
+            mode='determinate',
+            length=400,
+            maximum=1.0
+        )
+        self.progress.grid(row=0, column=0, padx=10)
+
+        self.cancel_button = ttk.Button(
+            progress_container,
+            text="Cancelar ✗",
+            command=self._cancel_tasks,
+            style="Modern.TButton",
+            state='disabled'
+        )
+        self.cancel_button.grid(row=0, column=1, padx=10)
+
         # Frame para resultados
         results_frame = ttk.LabelFrame(
             main_frame,
@@ -190,15 +228,22 @@ class MainWindow:
         )
         results_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
 
-        self.results_text = self._create_modern_text(results_frame, height=8, state='disabled')
-        self.results_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.results_panel = ResultsPanel(
+            results_frame,
+            self.colors,
+            self._create_modern_text,
+            height=8,
+            style="Modern.TFrame"
+        )
+        self.results_panel.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        results_frame.columnconfigure(0, weight=1)
 
         # Cargar y mostrar el icono con estilo moderno
         icon_path = os.path.join(os.path.dirname(__file__), '../utils/expresiones.png')
         if os.path.exists(icon_path):
-            icon_image = Image.open(icon_path)
-            icon_image = icon_image.resize((60, 60), Image.ANTIALIAS)
-            icon_photo = ImageTk.PhotoImage(icon_image)
+            # Tk decodifica el PNG directamente; reducirlo 8 veces (512 -> 64 px)
+            # evita cargar PIL al abrir la ventana.
+            icon_photo = tk.PhotoImage(file=icon_path).subsample(8)
             icon_label = tk.Label(
                 main_frame,
                 image=icon_photo,
@@ -212,33 +257,56 @@ class MainWindow:
         self.regex_text.tag_configure("block1", foreground=self.colors['success'])
         self.regex_text.tag_configure("block2", foreground=self.colors['highlight'])
         self.regex_text.tag_configure("block3", foreground=self.colors['error'])
+        self.highlighter = SyntaxHighlighter(self.regex_text)
 
-    def _highlight_syntax(self, event=None):
+    def _task_started(self, determinate):
         """
-        Resalta la sintaxis de la expresión regular.
+        Muestra que hay una tarea en curso.
 
         Args:
-            event (tk.Event, optional): El evento de teclado que dispara el resaltado de sintaxis.
+            determinate (bool): Si la tarea informa su avance.
         """
-        regex = self.regex_text.get("1.0", tk.END).strip()
-        self.regex_text.tag_remove("block1", "1.0", tk.END)
-        self.regex_text.tag_remove("block2", "1.0", tk.END)
-        self.regex_text.tag_remove("block3", "1.0", tk.END)
-
-        patterns = [
-            (r"[a-zA-Z0-9]+", "block1"),
-            (r"[.*+?^${}()|[\]\\]+", "block2"),
-            (r"[\(\)]+", "block3")
-        ]
+        self.cancel_button.state(['!disabled'])
+        if determinate:
+            self.progress.stop()
+            self.progress.configure(mode='determinate', value=0)
+        else:
+            self.progress.configure(mode='indeterminate')
+            self.progress.start(15)
+
+    def _task_finished(self):
+        """
+        Restablece el indicador de progreso cuando ya no quedan tareas en curso.
+        """
+        if self.runner.busy:
+            return
+        self.progress.stop()
+        self.progress.configure(mode='determinate', value=0)
+        self.cancel_button.state(['disabled'])
 
-        for pattern, tag in patterns:
-            for match in re.finditer(pattern, regex):
-                start, end = match.span()
-                self.regex_text.tag_add(tag, f"1.{start}", f"1.{end}")
+    def _task_failed(self, error):
+        """
+        Muestra el error de una tarea en segundo plano.
+
+        Args:
+            error (Exception): El error lanzado por la tarea.
+        """
+        self._task_finished()
+        messagebox.showerror("Error", str(error))
+
+    def _cancel_tasks(self):
+        """
+        Cancela las tareas en segundo plano en curso.
+        """
+        self.runner.cancel_all()
+        self._task_finished()
 
     def _validate(self):
         """
         Maneja el evento de validación.
+
+        La validación se ejecuta en segundo plano; una nueva validación
+        reemplaza a la que esté en curso.
         """
         regex = self.regex_text.get("1.0", tk.END).strip()
         if not self.controller.set_regex_pattern(regex):
@@ -248,31 +316,132 @@ class MainWindow:
             )
             return
 
+        self._submit_validation()
+
+    def _on_live_toggle(self):
+        """
+        Activa o desactiva la validación en vivo.
+        """
+        if self.live_validation.get():
+            self._submit_validation()
+        elif self._live_pending is not None:
+            self.root.after_cancel(self._live_pending)
+            self._live_pending = None
+
+    def _on_test_modified(self, event=None, delay_ms=300):
+        """
+        Programa la validación en vivo tras una edición de las cadenas de prueba.
+
+        Args:
+            event (tk.Event, optional): El evento <<Modified>> del widget.
+            delay_ms (int): Retardo en milisegundos desde la última edición.
+        """
+        if not self.test_text.edit_modified():
+            return
+        self.test_text.edit_modified(False)
+        if not self.live_validation.get():
+            return
+        if self._live_pending is not None:
+            self.root.after_cancel(self._live_pending)
+        self._live_pending = self.root.after(delay_ms, self._submit_validation)
+
+    def _submit_validation(self):
+        """
+        Valida en segundo plano las cadenas de prueba con los patrones ya establecidos.
+
+        Solo las líneas nuevas o modificadas se validan: el resto se sirve
+        desde la caché del controlador.
+        """
+        if self._live_pending is not None:
+            self.root.after_cancel(self._live_pending)
+            self._live_pending = None
         test_strings = self.test_text.get("1.0", tk.END).split('\n')
-        results = self.controller.validate_strings(test_strings)
+        # La tarea trabaja sobre una copia de los patrones tomada en el hilo de
+        # Tk, que puede seguir cambiando el modelo mientras tanto.
+        snapshot = self.controller.snapshot_patterns()
+        self._task_started(determinate=True)
+        self.runner.submit(
+            'validate',
+            lambda task: self._validate_in_background(task, test_strings, snapshot),
+            self._show_results,
+            on_error=self._task_failed,
+            on_progress=lambda fraction: self.progress.configure(value=fraction)
+        )
 
-        self.results_text.configure(state='normal')
-        self.results_text.delete("1.0", tk.END)
+    def _validate_in_background(self, task, test_strings, snapshot, chunk_size=2000):
+        """
+        Valida las cadenas por bloques, informando el avance y atendiendo cancelaciones.
 
-        for string, is_valid in results:
-            result = "✓" if is_valid else "✗"
-            color_tag = "success" if is_valid else "error"
-            self.results_text.insert(tk.END, f"{string}: ")
-            self.results_text.insert(tk.END, f"{result}\n", color_tag)
+        La cancelación se comprueba entre bloques: una sola coincidencia con
+        retroceso catastrófico no libera el GIL y no se puede interrumpir desde
+        aquí. Para patrones así está RegexController.validate_strings_guarded,
+        que valida en procesos aparte con un límite de tiempo.
 
-        self.results_text.tag_configure("success", foreground=self.colors['success'])
-        self.results_text.tag_configure("error", foreground=self.colors['error'])
-        self.results_text.configure(state='disabled')
+        Args:
+            task (Task): La tarea en segundo plano.
+            test_strings (list): Cadenas a validar.
+            snapshot (PatternSnapshot): Patrones tomados en el hilo de Tk.
+            chunk_size (int): Número de cadenas de cada bloque.
+
+        Returns:
+            list: Lista de resultados (cadena, es_válida), en el mismo orden que
+                RegexController.validate_strings.
+        """
+        strings = [s.strip() for s in test_strings if s.strip()]
+        # Cada bloque devuelve sus resultados agrupados por patrón (un solo
+        # grupo si no hay patrones); se reagrupan para conservar el orden de
+        # una única llamada con todas las cadenas.
+        columns = [[] for _ in range(max(1, len(snapshot.patterns)))]
+        for start in range(0, len(strings), chunk_size):
+            task.check_cancelled()
+            chunk = strings[start:start + chunk_size]
+            chunk_results = self.controller.validate_strings_cached(chunk, snapshot)
+            for index, column in enumerate(columns):
+                column.extend(chunk_results[index * len(chunk):(index + 1) * len(chunk)])
+            task.report_progress((start + len(chunk)) / len(strings))
+        return [result for column in columns for result in column]
+
+    def _show_results(self, results):
+        """
+        Muestra los resultados de la validación.
+
+        Args:
+            results (list): Lista de resultados (cadena, es_válida).
+        """
+        self._task_finished()
+        self.results_panel.set_results(results)
 
     def _generate_automata(self):
         """
         Maneja el evento de generación de autómata.
+
+        El autómata se construye y se renderiza en segundo plano; una nueva
+        generación reemplaza a la que esté en curso.
         """
+        # Graphviz y PIL se importan solo la primera vez que se genera un autómata
+        from src.utils.automata_generator import imagen_automata
+
         regex = self.regex_text.get("1.0", tk.END).strip()
-        probar_automata(regex)
+        self._task_started(determinate=False)
+        self.runner.submit(
+            'automata',
+            lambda task: imagen_automata(regex),
+            self._show_automata,
+            on_error=self._task_failed
+        )
+
+    def _show_automata(self, img):
+        """
+        Muestra la imagen del autómata generado.
+
+        Args:
+            img (Image.Image): La imagen renderizada del autómata.
+        """
+        from PIL import Image, ImageTk
+
+        self._task_finished()
 
         # Mostrar la imagen generada en una ventana moderna
-        img = Image.open('automata.png')
         img_window = tk.Toplevel(self.root)
         img_window.title("Autómata Generado")
         img_window.configure(bg=self.colors['bg'])
@@ -326,9 +495,7 @@ class MainWindow:
         """
         Limpia el panel de resultados y las explicaciones almacenadas.
         """
-        self.results_text.configure(state='normal')
-        self.results_text.delete("1.0", tk.END)
-        self.results_text.configure(state='disabled')
+        self.results_panel.clear()
         self.controller.clear_patterns()
 
     def run(self):
@@ -343,4 +510,5 @@ class MainWindow:
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
 
-        self.root.mainloop()
\ No newline at end of file
+        self.root.mainloop()
+        self.runner.shutdown()
\ No newline at end of file
@@ -0,0 +1,183 @@
+import tkinter as tk
+from array import array
+from tkinter import ttk
+from tkinter import font as tkfont
+
+class ResultsPanel(ttk.Frame):
+    """
+    Panel virtualizado de resultados de validación.
+
+    Los resultados se guardan fuera del widget (cadenas y un bytearray de
+    validez) y el Text solo contiene las filas visibles, que se redibujan con
+    una única inserción al desplazarse. Así el coste de mostrar o desplazar
+    los resultados no depende de cuántos haya.
+
+    Attributes:
+        colors (dict): Colores del tema de la ventana principal.
+        text (tk.Text): Widget que muestra las filas visibles.
+        summary_label (tk.Label): Resumen de cadenas válidas e inválidas.
+    """
+
+    # Longitud máxima mostrada de cada cadena, para acotar el coste por fila.
+    MAX_LINE_LENGTH = 500
+
+    def __init__(self, parent, colors, text_factory, height=8, **kwargs):
+        """
+        Inicializa el panel.
+
+        Args:
+            parent (tk.Widget): El widget padre.
+            colors (dict): Colores del tema de la ventana principal.
+            text_factory (Callable): Crea el widget de texto; recibe el padre, la altura
+                y argumentos adicionales del widget.
+            height (int): Número de filas visibles inicialmente.
+            **kwargs: Argumentos adicionales para el Frame.
+        """
+        super().__init__(parent, **kwargs)
+        self.colors = colors
+        self._strings = []
+        self._valid = bytearray()
+        self._rows = None
+        self._failures = None
+        self._first = 0
+        self._visible_rows = height
+        self.only_failures = tk.BooleanVar(value=False)
+
+        header = ttk.Frame(self, style=kwargs.get('style', ''))
+        header.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        self.summary_label = tk.Label(
+            header,
+            text="",
+            bg=colors['bg'],
+            fg=colors['text'],
+            font=('Helvetica', 10)
+        )
+        self.summary_label.pack(side=tk.LEFT)
+        tk.Checkbutton(
+            header,
+            text="Solo fallos",
+            variable=self.only_failures,
+            command=self._apply_filter,
+            bg=colors['bg'],
+            fg=colors['text'],
+            selectcolor=colors['secondary'],
+            activebackground=colors['bg'],
+            activeforeground=colors['highlight'],
+            highlightthickness=0
+        ).pack(side=tk.RIGHT)
+
+        self.text = text_factory(self, height, state='disabled', wrap=tk.NONE)
+        self.text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.text.tag_configure("success", foreground=colors['success'])
+        self.text.tag_configure("error", foreground=colors['error'])
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+
+        self._line_height = tkfont.Font(font=self.text.cget('font')).metrics('linespace')
+        self.text.bind("<Configure>", self._on_resize)
+        self.text.bind("<MouseWheel>", self._on_mousewheel)
+        self.text.bind("<Button-4>", lambda event: self._scroll_to(self._first - 3))
+        self.text.bind("<Button-5>", lambda event: self._scroll_to(self._first + 3))
+        self._update_summary()
+
+    def set_results(self, results):
+        """
+        Reemplaza los resultados mostrados.
+
+        Args:
+            results (list): Lista de resultados (cadena, es_válida).
+        """
+        self._strings = [string for string, _ in results]
+        self._valid = bytearray(bool(is_valid) for _, is_valid in results)
+        self._failures = None
+        self._first = 0
+        self._apply_filter()
+
+    def clear(self):
+        """
+        Elimina todos los resultados.
+        """
+        self.set_results([])
+
+    @property
+    def total_rows(self):
+        """int: Número de filas según el filtro activo."""
+        return len(self._strings) if self._rows is None else len(self._rows)
+
+    def _apply_filter(self):
+        """Recalcula las filas según el filtro y vuelve a dibujar."""
+        if self.only_failures.get():
+            if self._failures is None:
+                self._failures = array('i', (
+                    index for index, is_valid in enumerate(self._valid) if not is_valid
+                ))
+            self._rows = self._failures
+        else:
+            self._rows = None
+        self._update_summary()
+        self._scroll_to(self._first)
+
+    def _update_summary(self):
+        total = len(self._valid)
+        valid = self._valid.count(1)
+        self.summary_label.configure(
+            text=f"Total: {total}   Válidas: {valid}   Inválidas: {total - valid}"
+        )
+
+    def _scroll_to(self, first):
+        """
+        Dibuja las filas visibles a partir de una fila dada.
+
+        Args:
+            first (int): Índice de la primera fila visible.
+        """
+        total = self.total_rows
+        self._first = max(0, min(first, total - self._visible_rows))
+        last = min(total, self._first + self._visible_rows)
+
+        # Una sola inserción con las etiquetas de cada tramo.
+        chunks = []
+        for row in range(self._first, last):
+            index = row if self._rows is None else self._rows[row]
+            string = self._strings[index]
+            if len(string) > self.MAX_LINE_LENGTH:
+                string = string[:self.MAX_LINE_LENGTH] + "…"
+            if self._valid[index]:
+                chunks.extend((f"{string}: ", (), "✓\n", "success"))
+            else:
+                chunks.extend((f"{string}: ", (), "✗\n", "error"))
+
+        self.text.configure(state='normal')
+        self.text.delete("1.0", tk.END)
+        if chunks:
+            self.text.insert(tk.END, *chunks)
+        self.text.configure(state='disabled')
+
+        if total:
+            self.scrollbar.set(self._first / total, last / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """Atiende los comandos de la barra de desplazamiento."""
+        if action == tk.MOVETO:
+            self._scroll_to(round(float(amount) * self.total_rows))
+        elif action == tk.SCROLL:
+            step = self._visible_rows if unit == tk.PAGES else 1
+            self._scroll_to(self._first + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        direction = 1 if event.delta > 0 else -1
+        self._scroll_to(self._first - 3 * direction)
+        return "break"
+
+    def _on_resize(self, event):
+        """Ajusta el número de filas visibles a la altura del widget."""
+        padding = 2 * int(self.text.cget('pady'))
+        rows = max(1, (event.height - padding) // max(1, self._line_height))
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._scroll_to(self._first)
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import os
 
 class StartWindow:
@@ -40,13 +39,9 @@ class StartWindow:
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
-        # Cargar y mostrar la imagen
-        img_path = os.path.join(os.path.dirname(__file__), '../utils/PORT.png')
-        img = Image.open(img_path)
-        img = ImageTk.PhotoImage(img)
-        img_label = tk.Label(main_frame, image=img)
-        img_label.image = img  # Keep a reference to avoid garbage collection
-        img_label.grid(row=0, column=0, padx=5, pady=5)
+        # La imagen se decodifica después de mostrar la ventana (ver _load_image)
+        self.img_label = tk.Label(main_frame)
+        self.img_label.grid(row=0, column=0, padx=5, pady=5)
 
         # Botón para pasar a la ventana principal
         start_button = ttk.Button(
@@ -56,6 +51,22 @@ class StartWindow:
         )
         start_button.grid(row=1, column=0, pady=10)
 
+        # after_idle + after(0) deja que Tk dibuje la ventana antes de decodificar
+        self.root.after_idle(lambda: self.root.after(0, self._load_image))
+
+    def _load_image(self):
+        """
+        Carga la imagen de portada fuera del camino crítico del arranque.
+
+        Tk decodifica el PNG de forma nativa, sin necesidad de importar PIL.
+        """
+        if self.main_window_open:
+            return
+        img_path = os.path.join(os.path.dirname(__file__), '../utils/PORT.png')
+        img = tk.PhotoImage(file=img_path)
+        self.img_label.configure(image=img)
+        self.img_label.image = img  # Keep a reference to avoid garbage collection
+
     def _open_main_window(self):
         """
         Cierra la ventana de inicio y abre la ventana principal.
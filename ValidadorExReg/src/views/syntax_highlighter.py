@@ -0,0 +1,145 @@
+import re
+
+# Cada carácter pertenece a una sola clase, así que la etiqueta de un carácter
+# no depende de sus vecinos y basta con volver a etiquetar el tramo modificado.
+TOKEN_PATTERN = re.compile(
+    r"(?P<block3>[()]+)"
+    r"|(?P<block2>[.*+?^${}|[\]\\]+)"
+    r"|(?P<block1>[a-zA-Z0-9]+)"
+)
+TAGS = ("block1", "block2", "block3")
+
+class SyntaxHighlighter:
+    """
+    Resaltado de sintaxis incremental y con retardo para un widget de texto.
+
+    El comando Tcl del widget se envuelve (como hace IDLE con su
+    WidgetRedirector) para conocer el tramo exacto de cada inserción. Los
+    tramos pendientes se acumulan entre dos marcas de Tk, que se desplazan solas
+    con las ediciones siguientes, y el etiquetado se hace delay_ms después de la
+    última edición y solo sobre ese tramo, en cualquier línea del widget. Los
+    borrados no requieren volver a etiquetar nada. Al destruirse el widget (o
+    al llamar a close) se restaura su comando original.
+
+    Attributes:
+        text (tk.Text): El widget resaltado.
+        delay_ms (int): Retardo en milisegundos desde la última edición.
+    """
+
+    START_MARK = "highlight_start"
+    END_MARK = "highlight_end"
+
+    def __init__(self, text, delay_ms=150):
+        """
+        Inicializa el resaltador y empieza a seguir las ediciones del widget.
+
+        Args:
+            text (tk.Text): El widget a resaltar.
+            delay_ms (int): Retardo en milisegundos desde la última edición.
+        """
+        self.text = text
+        self.delay_ms = delay_ms
+        self._dirty = False
+        self._pending = None
+
+        self._original = text._w + "_original"
+        text.tk.call("rename", text._w, self._original)
+        text.tk.createcommand(text._w, self._dispatch)
+        text.bind("<Destroy>", self._on_destroy, add="+")
+
+    def close(self):
+        """
+        Deja de seguir las ediciones y devuelve al widget su comando original.
+        """
+        if self._original is None:
+            return
+        if self._pending is not None:
+            self.text.after_cancel(self._pending)
+            self._pending = None
+        self._dirty = False
+        self.text.tk.deletecommand(self.text._w)
+        self.text.tk.call("rename", self._original, self.text._w)
+        self._original = None
+
+    def _on_destroy(self, event):
+        """Restaura el comando del widget antes de que Tk lo elimine."""
+        if event.widget is self.text:
+            self.close()
+
+    def _call(self, *args):
+        """Ejecuta un subcomando con el comando original del widget."""
+        return self.text.tk.call(self._original, *args)
+
+    def _dispatch(self, command, *args):
+        """Reenvía cada subcomando al widget y registra los tramos insertados."""
+        if command == "insert":
+            start = self._insert_index(args[0])
+            result = self._call(command, *args)
+            self._mark_dirty(start, sum(len(chars) for chars in args[1::2]))
+        elif command == "replace":
+            start = self._insert_index(args[0])
+            result = self._call(command, *args)
+            self._mark_dirty(start, sum(len(chars) for chars in args[2::2]))
+        else:
+            result = self._call(command, *args)
+        return result
+
+    def _insert_index(self, index):
+        """Resuelve el índice en el que Tk insertará el texto."""
+        # Tk inserta antes del último salto de línea cuando el índice es 'end'.
+        if self._call("compare", index, ">=", "end"):
+            index = "end - 1 chars"
+        return self._call("index", index)
+
+    def _mark_dirty(self, start, length):
+        """
+        Amplía el tramo pendiente con un texto insertado y programa el resaltado.
+
+        Args:
+            start (str): Índice del inicio del texto insertado.
+            length (int): Número de caracteres insertados.
+        """
+        end = self._call("index", f"{start} + {length} chars")
+        if self._dirty:
+            if self._call("compare", self.START_MARK, "<", start):
+                start = self._call("index", self.START_MARK)
+            if self._call("compare", self.END_MARK, ">", end):
+                end = self._call("index", self.END_MARK)
+        self._call("mark", "set", self.START_MARK, start)
+        self._call("mark", "gravity", self.START_MARK, "left")
+        self._call("mark", "set", self.END_MARK, end)
+        self._call("mark", "gravity", self.END_MARK, "right")
+        self._dirty = True
+
+        if self._pending is not None:
+            self.text.after_cancel(self._pending)
+        self._pending = self.text.after(self.delay_ms, self.refresh)
+
+    def refresh(self):
+        """
+        Etiqueta el tramo insertado desde el último resaltado.
+        """
+        self._pending = None
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        first = self.text.index(self.START_MARK)
+        last = self.text.index(self.END_MARK)
+        for tag in TAGS:
+            self.text.tag_remove(tag, first, last)
+
+        ranges = {tag: [] for tag in TAGS}
+        line, column = map(int, first.split("."))
+        for segment in self.text.get(first, last).split("\n"):
+            for match in TOKEN_PATTERN.finditer(segment):
+                ranges[match.lastgroup].extend((
+                    f"{line}.{column + match.start()}",
+                    f"{line}.{column + match.end()}"
+                ))
+            line += 1
+            column = 0
+
+        for tag, indices in ranges.items():
+            if indices:
+                self.text.tag_add(tag, *indices)